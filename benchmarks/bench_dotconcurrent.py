@@ -0,0 +1,145 @@
+"""Executable that benchmarks the dot concurrent utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import threading
+import time
+
+import lyc_pyutils
+
+_Event = threading.Event
+_Lock = threading.Lock
+_perf_counter = time.perf_counter
+_sleep = time.sleep
+
+_LYCConcurrentDotDict = lyc_pyutils.ConcurrentDotDict
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCFuncThread = lyc_pyutils.FuncThread
+
+_reader_count = 32
+"""The number of the reader threads."""
+
+_read_count = 20000
+"""The number of the reads per reader thread."""
+
+_write_interval = 0.0005
+"""The seconds between the writes of the writer thread."""
+
+_config = {"model": {"lr": 0.1, "dims": {"a1": 0, "a2": 0}}, **{f"k{index}": {"v": index} for index in range(200)}}
+"""The config. A torn read sees different values of model.dims.a1 and model.dims.a2."""
+
+
+def _run(read, write):
+    """Runs the reader threads against a writer thread.
+
+    Args:
+        read: the function that reads model.dims.a1 and model.dims.a2 once, and gives them as a tuple
+        write: the function that writes model.dims.a1 and model.dims.a2 once, with the given value
+
+    Returns:
+        result: a tuple of the time in seconds, the number of the torn reads, and the number of the writes
+    """
+    stop = _Event()
+
+    def read_all():
+        torn = 0
+
+        for _ in range(_read_count):
+            val1, val2 = read()
+            torn += val1 != val2
+        # end for
+
+        return torn
+
+    def write_all():
+        count = 0
+
+        while not stop.is_set():
+            write(count)
+            count += 1
+            _sleep(_write_interval)
+        # end while
+
+        return count
+
+    writer = _LYCFuncThread(target=write_all)
+    readers = [_LYCFuncThread(target=read_all) for _ in range(_reader_count)]
+    writer.start()
+    start = _perf_counter()
+
+    for reader in readers:
+        reader.start()
+
+    torn = sum(reader.join() for reader in readers)
+    secs = _perf_counter() - start
+    stop.set()
+    write_count = writer.join()
+
+    result = (secs, torn, write_count)
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    locked = _LYCDotDict.from_dict____(_config)
+    lock = _Lock()
+
+    def read_locked():
+        with lock:
+            dims = locked.model.dims
+            return dims.a1, dims.a2
+        # end with
+
+    def write_locked(val):
+        with lock:
+            locked.model.dims.a1 = val
+            locked.model.dims.a2 = val
+        # end with
+
+    unlocked = _LYCDotDict.from_dict____(_config)
+
+    def read_unlocked():
+        dims = unlocked.model.dims
+        return dims.a1, dims.a2
+
+    def write_unlocked(val):
+        unlocked.model.dims.a1 = val
+        unlocked.model.dims.a2 = val
+
+    concurrent = _LYCConcurrentDotDict(_config)
+
+    def read_concurrent():
+        dims = concurrent.snapshot____().model.dims
+        return dims.a1, dims.a2
+
+    def write_concurrent(val):
+        ops = [("change", ("model", "dims", "a1"), val), ("change", ("model", "dims", "a2"), val)]
+        concurrent.apply_patch____(ops)
+
+    cases = [
+        ("DotDict with a lock", read_locked, write_locked),
+        ("DotDict without a lock", read_unlocked, write_unlocked),
+        ("ConcurrentDotDict", read_concurrent, write_concurrent)
+    ]
+
+    for label, read, write in cases:
+        secs, torn, write_count = _run(read, write)
+        print(f"{label:24s} {secs:7.2f} s  {torn} torn reads  {write_count} writes")
+    # end for
+
+    count = 2000
+    start = _perf_counter()
+
+    for index in range(count):
+        concurrent.set_path____("model.lr", index)
+
+    secs = _perf_counter() - start
+    print(f"{'ConcurrentDotDict write':24s} {secs / count * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
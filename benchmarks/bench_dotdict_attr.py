@@ -0,0 +1,54 @@
+"""Executable that benchmarks the dot dict attribute and item accesses."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import timeit
+
+import lyc_pyutils
+
+_repeat = timeit.repeat
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+_number = 200000
+"""The number of the runs per timing."""
+
+_repeats = 3
+"""The number of the timings, of which the best is reported."""
+
+
+class _Config(_LYCDotDict):
+    """A DotDict class with a declared field."""
+
+    a1 = 0.1
+
+
+def main():
+    """Runs this module as an executable."""
+    dotdict = _LYCDotDict()
+    dotdict.a1 = 0.1
+    config = _Config()
+    dict_ = {"a1": 0.1}
+    globals_ = {"dotdict": dotdict, "config": config, "dict_": dict_}
+
+    cases = [
+        ("dict[key] get", "dict_['a1']"),
+        ("DotDict.key get", "dotdict.a1"),
+        ("DotDict[key] get", "dotdict['a1']"),
+        ("DotDict.key set", "dotdict.a1 = 0.2"),
+        ("subclass field set", "config.a1 = 0.2"),
+        ("DotDict[key] set + del", "dotdict['a2'] = 1; del dotdict['a2']")
+    ]
+
+    for label, stmt in cases:
+        secs = min(_repeat(stmt, globals=globals_, number=_number, repeat=_repeats))
+        print(f"{label:24s} {secs / _number * 1e9:8.1f} ns")
+    # end for
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Executable that benchmarks the dot dict tree conversions."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import time
+
+import lyc_pyutils
+
+_perf_counter = time.perf_counter
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+_repeats = 3
+"""The number of the timings, of which the best is reported."""
+
+
+def _make_tree(depth, width):
+    """Makes a tree of the given depth and width.
+
+    Args:
+        depth: the depth
+        width: the number of the children per node
+
+    Returns:
+        result: the tree
+    """
+    if depth <= 0:
+        return 1
+
+    result = {f"k{index}": _make_tree(depth - 1, width) for index in range(width)}
+    return result
+
+
+def _best(func):
+    """Finds the best time of a function.
+
+    Args:
+        func: the function
+
+    Returns:
+        result: the best time in seconds
+    """
+    result = None
+
+    for _ in range(_repeats):
+        start = _perf_counter()
+        func()
+        secs = _perf_counter() - start
+        result = secs if result is None else min(result, secs)
+    # end for
+
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    wide = {f"k{index}": {"a": index, "b": {"c": index}} for index in range(20000)}
+    bushy = _make_tree(5, 7)
+    deep = {}
+    leaf = deep
+
+    for _ in range(400):
+        leaf["n"] = {}
+        leaf = leaf["n"]
+    # end for
+
+    shared_tree = _make_tree(3, 8)
+    shared = {f"k{index}": shared_tree for index in range(200)}
+    cases = [("wide 20k x 2", wide), ("bushy 7^5", bushy), ("deep 400", deep), ("shared 200 x 8^3", shared)]
+
+    for label, tree in cases:
+        dotdict = _LYCDotDict.from_dict____(tree)
+        from_secs = _best(lambda: _LYCDotDict.from_dict____(tree))
+        to_secs = _best(dotdict.to_dict____)
+        print(f"{label:18s} from_dict____ {from_secs * 1e3:8.2f} ms  to_dict____ {to_secs * 1e3:8.2f} ms")
+    # end for
+
+
+if __name__ == "__main__":
+    main()
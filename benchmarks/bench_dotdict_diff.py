@@ -0,0 +1,92 @@
+"""Executable that benchmarks the dot dict structural diffs and patches."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import time
+
+import lyc_pyutils
+
+_perf_counter = time.perf_counter
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCFrozenDotDict = lyc_pyutils.FrozenDotDict
+
+_repeats = 5
+"""The number of the timings, of which the best is reported."""
+
+
+def _modify(dotdict):
+    """Changes 4 leaves of a tree.
+
+    Args:
+        dotdict: the tree, a DotDict
+
+    Returns:
+        dotdict: the tree
+    """
+    for index in (3, 50, 97):
+        dotdict[f"g{index}"][f"s{index % 40}"]["k7"] = -1
+
+    dotdict.g5.s5.new = 1
+    return dotdict
+
+
+def _best(func, repeats=_repeats):
+    """Finds the best time of a function.
+
+    Args:
+        func: the function
+        repeats: the number of the timings
+
+    Returns:
+        result: a tuple of the best time in seconds and the last result of the function
+    """
+    secs = None
+
+    for _ in range(repeats):
+        start = _perf_counter()
+        val = func()
+        time_ = _perf_counter() - start
+        secs = time_ if secs is None else min(secs, time_)
+    # end for
+
+    result = (secs, val)
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    tree = {f"g{i}": {f"s{j}": {f"k{k}": k for k in range(50)} for j in range(40)} for i in range(100)}
+    dotdict1 = _LYCDotDict.from_dict____(tree)
+    dotdict2 = _modify(_LYCDotDict.from_dict____(tree))
+
+    secs, _ = _best(lambda: dotdict1.to_dict____() == dotdict2.to_dict____())
+    print(f"{'to_dict____ x2 + ==':36s} {secs * 1e3:8.2f} ms")
+
+    secs, ops = _best(lambda: list(dotdict1.diff____(dotdict2)))
+    print(f"{'diff____, separate trees':36s} {secs * 1e3:8.2f} ms  {len(ops)} ops")
+
+    base = _LYCDotDict.from_dict____(tree)
+    snapshot = _modify(base.snapshot____())
+    secs, ops = _best(lambda: list(base.diff____(snapshot)))
+    print(f"{'diff____, snapshot sharing subtrees':36s} {secs * 1e3:8.2f} ms  {len(ops)} ops")
+
+    frozen1 = _LYCFrozenDotDict.from_dict____(tree)
+    frozen2 = _LYCFrozenDotDict.from_dict____(dotdict2.to_dict____())
+    secs, ops = _best(lambda: list(frozen1.diff____(frozen2)), 1)
+    print(f"{'diff____, frozen, first call':36s} {secs * 1e3:8.2f} ms  {len(ops)} ops")
+
+    secs, ops = _best(lambda: list(frozen1.diff____(frozen2)))
+    print(f"{'diff____, frozen, hashes cached':36s} {secs * 1e3:8.2f} ms  {len(ops)} ops")
+
+    patched = dotdict1.snapshot____()
+    secs, _ = _best(lambda: patched.apply_patch____(ops), 1)
+    print(f"{'apply_patch____':36s} {secs * 1e3:8.2f} ms  matched: {patched == dotdict2}")
+
+
+if __name__ == "__main__":
+    main()
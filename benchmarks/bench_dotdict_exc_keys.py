@@ -0,0 +1,53 @@
+"""Executable that benchmarks the dot dict exceptional key classifications."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import timeit
+
+import lyc_pyutils
+
+_repeat = timeit.repeat
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+_keys = [f"key{index}" for index in range(32)] + ["_private", "keys", "key____"]
+"""The keys, including some exceptional ones."""
+
+_number = 5000
+"""The number of the runs per timing."""
+
+_repeats = 3
+"""The number of the timings, of which the best is reported."""
+
+
+def main():
+    """Runs this module as an executable."""
+    dotdict = _LYCDotDict()
+    is_exc_key = _LYCDotDict.is_exc_key____
+
+    def classify():
+        for key in _keys:
+            is_exc_key(key)
+
+    def set_items():
+        for key in _keys:
+            dotdict[key] = 1
+
+    def set_attrs():
+        for key in _keys:
+            dotdict.set_attr____(key, 1)
+
+    cases = [("is_exc_key____", classify), ("DotDict[key] = val", set_items), ("set_attr____", set_attrs)]
+
+    for label, func in cases:
+        secs = min(_repeat(func, number=_number, repeat=_repeats))
+        print(f"{label:20s} {secs / _number / len(_keys) * 1e9:8.1f} ns/key")
+    # end for
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Executable that benchmarks the dot dict deep updates and merges."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import time
+
+import lyc_pyutils
+
+_perf_counter = time.perf_counter
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+_repeats = 3
+"""The number of the timings, of which the best is reported."""
+
+
+def _make_base(groups, keys):
+    """Makes a base config.
+
+    Args:
+        groups: the number of the groups
+        keys: the number of the keys per subgroup
+
+    Returns:
+        result: the base config, a dict
+    """
+    result = {
+        f"g{group}": {f"s{sub}": {f"k{key}": key for key in range(keys)} for sub in range(4)}
+        for group in range(groups)
+    }
+
+    return result
+
+
+def _make_overrides(groups, keys):
+    """Makes an override set, which changes half of the base keys and adds as many new keys.
+
+    Args:
+        groups: the number of the groups in the base config
+        keys: the number of the keys per subgroup in the base config
+
+    Returns:
+        result: the override set, a dict
+    """
+    changes = {f"k{key}": -key for key in range(0, keys, 2)}
+    changes.update({f"n{key}": key for key in range(keys // 2)})
+    result = {f"g{group}": {f"s{sub}": dict(changes) for sub in range(4)} for group in range(0, groups, 2)}
+
+    result["extra"] = {f"k{key}": {"v": key} for key in range(keys)}
+    return result
+
+
+def _update_loop(dotdict, map_):
+    """Deep-updates a DotDict with a per-key set_attr____ loop, as the ad-hoc code does.
+
+    Args:
+        dotdict: the DotDict
+        map_: the mapping tree
+    """
+    for key, val in map_.items():
+        if isinstance(val, dict) and isinstance(dotdict.get(key), _LYCDotDict):
+            _update_loop(dotdict.get_attr____(key), val)
+        else:
+            dotdict.set_attr____(key, val)
+        # end if
+    # end for
+
+
+def _best(func, make):
+    """Finds the best time of a function, on a new argument per timing.
+
+    Args:
+        func: the function of the argument
+        make: the function that makes the argument
+
+    Returns:
+        result: a tuple of the best time in seconds and the last argument
+    """
+    secs = None
+
+    for _ in range(_repeats):
+        arg = make()
+        start = _perf_counter()
+        func(arg)
+        time_ = _perf_counter() - start
+        secs = time_ if secs is None else min(secs, time_)
+    # end for
+
+    result = (secs, arg)
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    cases = [("1k leaves", 25, 10), ("40k leaves", 200, 50), ("200k leaves", 500, 100)]
+
+    for label, groups, keys in cases:
+        base = _make_base(groups, keys)
+        overrides = _make_overrides(groups, keys)
+
+        def make():
+            return _LYCDotDict.from_dict____(base)
+
+        loop_secs, looped = _best(lambda dotdict: _update_loop(dotdict, overrides), make)
+        update_secs, updated = _best(lambda dotdict: dotdict.deep_update____(overrides), make)
+        merge_secs, _ = _best(lambda _: _LYCDotDict.merge____(base, overrides), lambda: None)
+        matched = looped == updated == _LYCDotDict.merge____(base, overrides)
+
+        print(
+            f"{label:12s} set_attr____ loop {loop_secs * 1e3:8.1f} ms  deep_update____ {update_secs * 1e3:8.1f} ms  "
+            f"merge____ of both {merge_secs * 1e3:8.1f} ms  matched: {matched}"
+        )
+    # end for
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Executable that benchmarks the dot dict pickling."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import pickle
+import time
+
+import lyc_pyutils
+
+_perf_counter = time.perf_counter
+_pickle_dumps = pickle.dumps
+_pickle_loads = pickle.loads
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+
+class _Config(_LYCDotDict):
+    """A DotDict class with declared fields, at the module level for pickling."""
+
+    a1 = 0.1
+    a2 = {"a1": 1}
+
+
+def _round_trip(obj, count):
+    """Times the pickle round trips of an object.
+
+    Args:
+        obj: the object
+        count: the number of the round trips
+
+    Returns:
+        result: a tuple of the mean time in seconds and the pickle size in bytes
+    """
+    start = _perf_counter()
+
+    for _ in range(count):
+        blob = _pickle_dumps(obj, protocol=5)
+        back = _pickle_loads(blob)
+    # end for
+
+    secs = (_perf_counter() - start) / count
+
+    if back != obj or type(back) is not type(obj):
+        raise ValueError("The round trip does not match")
+
+    result = (secs, len(blob))
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    tree = {f"s{i}": {f"k{j}": {"v": j, "w": [j] * 4} for j in range(20)} for i in range(50)}
+    cases = [("50x20 nested tree", _LYCDotDict.from_dict____(tree), 20), ("small subclass record", _Config(), 2000)]
+
+    for label, obj, count in cases:
+        secs, size = _round_trip(obj, count)
+        print(f"{label:22s} round trip {secs * 1e3:8.3f} ms  {size} bytes")
+    # end for
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Executable that benchmarks the dot record memory use and accesses."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import gc
+import time
+import tracemalloc
+
+import lyc_pyutils
+
+_gc_collect = gc.collect
+_perf_counter = time.perf_counter
+_trace_get = tracemalloc.get_traced_memory
+_trace_start = tracemalloc.start
+_trace_stop = tracemalloc.stop
+
+_LYCDotDict = lyc_pyutils.DotDict
+
+_count = 200000
+"""The number of the records."""
+
+_repeats = 5
+"""The number of the read timings, of which the best is reported."""
+
+
+class _Sample(_LYCDotDict):
+    """A DotDict class with declared fields."""
+
+    id = 0
+    score = 0.0
+    name = ""
+    ok = False
+
+
+def _measure(make):
+    """Measures the time and the memory of making the records.
+
+    Args:
+        make: the function that makes the list of the records
+
+    Returns:
+        result: a tuple of the time in seconds and the memory in bytes
+    """
+    _gc_collect()
+    start = _perf_counter()
+    records = make()
+    secs = _perf_counter() - start
+    del records
+    _gc_collect()
+
+    _trace_start()
+    records = make()
+    size, _ = _trace_get()
+    _trace_stop()
+    del records
+
+    result = (secs, size)
+    return result
+
+
+def _best_read(func):
+    """Finds the best time of reading all the records.
+
+    Args:
+        func: the function that reads all the records
+
+    Returns:
+        result: the best time in seconds
+    """
+    result = None
+
+    for _ in range(_repeats):
+        start = _perf_counter()
+        func()
+        secs = _perf_counter() - start
+        result = secs if result is None else min(result, secs)
+    # end for
+
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    record_class = _Sample.record_class____()
+    names = ("id", "score", "name", "ok")
+    vals = [(i, i * 0.5, f"n{i % 100}", i % 2 == 0) for i in range(_count)]
+    field_vals = [tuple(dict(zip(names, val))[field] for field in record_class._fields) for val in vals]
+
+    cases = [
+        ("plain dict", lambda: [dict(zip(names, val)) for val in vals]),
+        ("DotDict subclass", lambda: [_Sample(id=v[0], score=v[1], name=v[2], ok=v[3]) for v in vals]),
+        ("record, kwargs", lambda: [record_class(id=v[0], score=v[1], name=v[2], ok=v[3]) for v in vals]),
+        ("record, from_values____", lambda: [record_class.from_values____(val) for val in field_vals])
+    ]
+
+    for label, make in cases:
+        secs, size = _measure(make)
+        print(f"{label:24s} {size / _count:7.1f} B/record  {secs / _count * 1e6:6.2f} us/record")
+    # end for
+
+    dotdicts = [_Sample(id=v[0], score=v[1], name=v[2], ok=v[3]) for v in vals]
+    records = [record_class(id=v[0], score=v[1], name=v[2], ok=v[3]) for v in vals]
+
+    reads = [
+        ("DotDict .key read", lambda: [dotdict.score for dotdict in dotdicts]),
+        ("record .key read", lambda: [record.score for record in records]),
+        ("DotDict [key] read", lambda: [dotdict["score"] for dotdict in dotdicts]),
+        ("record [key] read", lambda: [record["score"] for record in records])
+    ]
+
+    for label, func in reads:
+        secs = _best_read(func)
+        print(f"{label:24s} {secs / _count * 1e9:7.1f} ns")
+    # end for
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Executable that benchmarks the dot schema validation and coercion."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import random
+import time
+
+import lyc_pyutils
+
+_perf_counter = time.perf_counter
+_Random = random.Random
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCDotSchema = lyc_pyutils.DotSchema
+_lyc_clamp_float = lyc_pyutils.clamp_float
+_lyc_clamp_int = lyc_pyutils.clamp_int
+
+_config_count = 10000
+"""The number of the configs."""
+
+_rules = {
+    f"g{group}.sub.k{index}": {"type": float if index % 2 else int, "min": 0, "max": 100, "default": 1}
+    for group in range(4) for index in range(5)
+}
+"""The rules, 20 in all, with the last key of each group missing from the configs."""
+
+
+def _make_configs(seed):
+    """Makes the configs.
+
+    Args:
+        seed: the random seed
+
+    Returns:
+        result: the list of the configs
+    """
+    rand = _Random(seed)
+
+    result = [
+        _LYCDotDict.from_dict____({
+            f"g{group}": {"sub": {f"k{index}": str(rand.randint(-5, 200)) for index in range(4)}}
+            for group in range(4)
+        })
+        for _ in range(_config_count)
+    ]
+
+    return result
+
+
+def _coerce_walk(dotdict):
+    """Coerces a config with one tree walk per rule, as the ad-hoc code does.
+
+    Args:
+        dotdict: the config
+
+    Returns:
+        result: the list of the error messages
+    """
+    result = []
+
+    for path, spec in _rules.items():
+        try:
+            val = dotdict.get_path____(path)
+        except (AttributeError, KeyError):
+            dotdict.set_path____(path, spec["default"])
+            continue
+        # end try
+
+        try:
+            val = spec["type"](val)
+        except (TypeError, ValueError) as exc:
+            result.append(f"{path}: {exc}")
+            continue
+        # end try
+
+        if spec["type"] is int:
+            val = _lyc_clamp_int(val, spec["min"], spec["max"])
+        else:
+            val = _lyc_clamp_float(val, spec["min"], spec["max"])
+        # end if
+
+        dotdict.set_path____(path, val)
+    # end for
+
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    configs = _make_configs(0)
+    start = _perf_counter()
+
+    for config in configs:
+        _coerce_walk(config)
+
+    walk_secs = _perf_counter() - start
+    schema_configs = _make_configs(0)
+    start = _perf_counter()
+    schema = _LYCDotSchema(_rules)
+    schema.coerce_all____(schema_configs)
+    schema_secs = _perf_counter() - start
+
+    print(f"{'one walk per rule':24s} {walk_secs * 1e3:8.0f} ms")
+    print(f"{'DotSchema.coerce_all____':24s} {schema_secs * 1e3:8.0f} ms")
+    print(f"results matched: {configs == schema_configs}")
+
+
+if __name__ == "__main__":
+    main()
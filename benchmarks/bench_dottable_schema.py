@@ -0,0 +1,125 @@
+"""Executable that benchmarks the dot table schema-typed columns."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import gc
+import time
+import tracemalloc
+
+import lyc_pyutils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
+
+_gc_collect = gc.collect
+_numpy = numpy
+_perf_counter = time.perf_counter
+_trace_get = tracemalloc.get_traced_memory
+_trace_start = tracemalloc.start
+_trace_stop = tracemalloc.stop
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCDotTable = lyc_pyutils.DotTable
+
+_count = 1000000
+"""The number of the rows."""
+
+_repeats = 3
+"""The number of the timings, of which the best is reported."""
+
+
+class _Sample(_LYCDotDict):
+    """A DotDict class with declared fields, used as the schema."""
+
+    step = 0
+    loss = 0.0
+    lr = 0.0
+    ok = False
+
+
+def _best(func, repeats=_repeats):
+    """Finds the best time of a function.
+
+    Args:
+        func: the function
+        repeats: the number of the timings
+
+    Returns:
+        result: a tuple of the best time in seconds and the last result of the function
+    """
+    secs = None
+
+    for _ in range(repeats):
+        _gc_collect()
+        start = _perf_counter()
+        val = func()
+        time_ = _perf_counter() - start
+        secs = time_ if secs is None else min(secs, time_)
+    # end for
+
+    result = (secs, val)
+    return result
+
+
+def _traced_size(make):
+    """Finds the memory of the result of a function.
+
+    Args:
+        make: the function
+
+    Returns:
+        result: the memory in bytes
+    """
+    _gc_collect()
+    _trace_start()
+    val = make()
+    result, _ = _trace_get()
+    _trace_stop()
+    del val
+    return result
+
+
+def main():
+    """Runs this module as an executable."""
+    names = ("step", "loss", "lr", "ok")
+    rows = [
+        _LYCDotDict.from_pairs____(zip(names, (i, 1.0 / (i + 1), 1e-3, i % 7 == 0)))
+        for i in range(_count)
+    ]
+
+    secs, _ = _best(lambda: {name: [getattr(row, name) for row in rows] for name in names})
+    print(f"{'per-element attribute loop':30s} {secs * 1e3:8.0f} ms")
+
+    secs, _ = _best(lambda: _LYCDotTable.from_rows____(rows))
+    print(f"{'from_rows____, no schema':30s} {secs * 1e3:8.0f} ms")
+
+    secs, table = _best(lambda: _LYCDotTable.from_rows____(rows, schema=_Sample))
+    print(f"{'from_rows____, schema':30s} {secs * 1e3:8.0f} ms")
+
+    secs, _ = _best(lambda: table.to_rows____(_Sample), 1)
+    print(f"{'to_rows____, schema':30s} {secs * 1e3:8.0f} ms")
+
+    if _numpy is not None:
+        secs, struct_array = _best(table.to_struct_array____)
+        print(f"{'to_struct_array____':30s} {secs * 1e3:8.0f} ms")
+
+        secs, _ = _best(lambda: _LYCDotTable.from_struct_array____(struct_array))
+        print(f"{'from_struct_array____':30s} {secs * 1e3:8.0f} ms")
+    else:
+        print("NumPy is not available, skipped the structured array timings")
+    # end if
+
+    table_size = _traced_size(lambda: _LYCDotTable.from_rows____(rows, schema=_Sample))
+    rows_size = _traced_size(lambda: [_LYCDotDict.from_pairs____(row.items()) for row in rows])
+    print(f"memory: DotTable {table_size / _count:.0f} B/row, list of DotDicts {rows_size / _count:.0f} B/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,13 @@
 # Last updated by username: liu-yucheng
 
 from lyc_pyutils.libs import batchlog
+from lyc_pyutils.libs import dotconcurrent
 from lyc_pyutils.libs import dotdict
+from lyc_pyutils.libs import dotindex
+from lyc_pyutils.libs import dotmapped
+from lyc_pyutils.libs import dotschema
+from lyc_pyutils.libs import dotshared
+from lyc_pyutils.libs import dottable
 from lyc_pyutils.libs import functhread
 from lyc_pyutils.libs import jsonrw
 from lyc_pyutils.libs import randbool
@@ -17,6 +23,27 @@ from lyc_pyutils.libs import clamps
 
 dotdict = dotdict
 DotDict = dotdict.DotDict
+FrozenDotDict = dotdict.FrozenDotDict
+DotRecord = dotdict.DotRecord
+
+dottable = dottable
+DotTable = dottable.DotTable
+DotTableRow = dottable.DotTableRow
+
+dotindex = dotindex
+DotIndex = dotindex.DotIndex
+
+dotconcurrent = dotconcurrent
+ConcurrentDotDict = dotconcurrent.ConcurrentDotDict
+
+dotshared = dotshared
+SharedDotDict = dotshared.SharedDotDict
+
+dotmapped = dotmapped
+MappedDotDict = dotmapped.MappedDotDict
+
+dotschema = dotschema
+DotSchema = dotschema.DotSchema
 
 timedinput = timedinput
 TimedInput = timedinput.TimedInput
@@ -29,9 +56,14 @@ rand_bool = randbool.rand_bool
 
 jsonrw = jsonrw
 load_json = jsonrw.load_json
+load_json_dotdict = jsonrw.load_json_dotdict
 save_json = jsonrw.save_json
 load_json_str = jsonrw.load_json_str
+load_json_str_dotdict = jsonrw.load_json_str_dotdict
 save_json_str = jsonrw.save_json_str
+save_json_stream = jsonrw.save_json_stream
+append_json_patch = jsonrw.append_json_patch
+load_json_patch = jsonrw.load_json_patch
 
 batchlog = batchlog
 logstr = batchlog.logstr
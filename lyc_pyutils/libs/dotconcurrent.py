@@ -0,0 +1,406 @@
+"""Dot concurrent."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import threading
+
+from lyc_pyutils.libs import dotdict
+
+_compile_path = dotdict._compile_path
+_dict_getitem = dict.__getitem__
+_dict_update = dict.update
+_DotDict = dotdict.DotDict
+_FrozenDotDict = dotdict.FrozenDotDict
+_Lock = threading.Lock
+
+
+class ConcurrentDotDict:
+    """Concurrent dot dictionary.
+
+    A DotDict-like holder of a live config that is shared by threads. Its content is an immutable FrozenDotDict
+        version. A writer builds the next version and publishes it with a single reference assignment, under the
+        writer lock. A reader takes the current version without any lock, and sees it in full or not at all.
+
+    The next version is built by path copying. Only the FrozenDotDicts on the changed paths are copied, and the other
+        nested FrozenDotDicts are shared with the last version.
+
+    NOTE: Each "dict.key" or "dict[key]" read takes the current version on its own. To read several values that are
+        consistent with one another, read them from one snapshot____ result.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    def __init__(self, *args, **kwargs):
+        """Inits self with the given args and kwargs, like a FrozenDotDict.
+
+        Args:
+            *args: the variable arguments
+            **kwargs: the keyword arguments
+        """
+        object.__setattr__(self, "_lock", _Lock())
+        object.__setattr__(self, "_version", _FrozenDotDict(*args, **kwargs))
+
+    def _publish(self, ops):
+        """Builds the next version with the given operations, and publishes it.
+
+        See the DotDict diff____ method for the operations. The FrozenDotDicts on the parent path of each operation are
+            copied into DotDicts once, and the operation is applied to the copies. The result is then frozen, with the
+            uncopied FrozenDotDicts kept as they are. The copies keep all the stored items, like the dict.copy method,
+            including the exceptional keys.
+
+        Args:
+            ops: an iterable of the operations, each a tuple of the operation name, the path, and the value
+
+        Returns:
+            result: the published version
+
+        Raises:
+            ValueError: if an operation name is unknown, or a path is empty
+            KeyError: if a path does not exist in the last version
+            TypeError: if a path goes through a value that is not a dict
+        """
+        with self._lock:
+            root = _copy_node(self._version)
+
+            for op, path, val in ops:
+                path = tuple(path)
+
+                if len(path) <= 0:
+                    raise ValueError(f"Cannot apply an operation with an empty path: {op}")
+
+                parent = root
+
+                for key in path[:-1]:
+                    child = _dict_getitem(parent, key)
+
+                    if isinstance(child, _FrozenDotDict):
+                        child = _copy_node(child)
+                        parent.set_item____(key, child)
+                    elif not isinstance(child, _DotDict):
+                        raise TypeError(f"Cannot apply an operation through a non-dict value: {path}")
+                    # end if
+
+                    parent = child
+                # end for
+
+                if op == "add" or op == "change":
+                    parent.set_item____(path[-1], val)
+                elif op == "remove":
+                    parent.del_item____(path[-1])
+                else:
+                    raise ValueError(f"Unknown operation: {op}")
+                # end if
+            # end for
+
+            result = _FrozenDotDict(root)
+            # A single reference assignment, which the readers see in full or not at all
+            object.__setattr__(self, "_version", result)
+        # end with
+
+        return result
+
+    # Magic functions
+
+    def __getattr__(self, name):
+        """Gets a value with the given name from the current version.
+
+        Args:
+            name: a name
+
+        Returns:
+            _: the value
+
+        Raises:
+            AttributeError: if the name is exceptional, or there is no such a value
+        """
+        if _FrozenDotDict.is_exc_key____(name):
+            raise AttributeError(f"ConcurrentDotDict attribute is protected: {name}")
+
+        return getattr(self._version, name)
+
+    def __setattr__(self, name, val):
+        """Sets a value with the given name, and publishes the next version.
+
+        Args:
+            name: a name
+            val: a value
+
+        Raises:
+            AttributeError: if the name is exceptional
+        """
+        self.set_attr____(name, val)
+
+    def __delattr__(self, name):
+        """Deletes a value with the given name, and publishes the next version.
+
+        Args:
+            name: a name
+
+        Raises:
+            AttributeError: if the name is exceptional, or there is no such a value
+        """
+        self.del_attr____(name)
+
+    def __getitem__(self, key):
+        """Gets a value with the given key from the current version.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: the value
+        """
+        return self._version[key]
+
+    def __setitem__(self, key, val):
+        """Sets a value with the given key, and publishes the next version.
+
+        Args:
+            key: a key
+            val: a value
+        """
+        self.set_item____(key, val)
+
+    def __delitem__(self, key):
+        """Deletes a value with the given key, and publishes the next version.
+
+        Args:
+            key: a key
+        """
+        self.del_item____(key)
+
+    def __contains__(self, key):
+        """Finds if the current version has the given key.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: whether the current version has the key
+        """
+        return key in self._version
+
+    def __iter__(self):
+        """Iterates over the keys of the current version.
+
+        Returns:
+            _: the key iterator
+        """
+        return iter(self._version)
+
+    def __len__(self):
+        """Finds the number of the items of the current version.
+
+        Returns:
+            _: the number of the items
+        """
+        return len(self._version)
+
+    def __eq__(self, other):
+        """Finds if the current version equals other.
+
+        Args:
+            other: the other object
+
+        Returns:
+            result: the equality
+        """
+        if isinstance(other, ConcurrentDotDict):
+            other = other._version
+
+        result = self._version == other
+        return result
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        super_repr = dict.__repr__(self._version)
+        result = f"ConcurrentDotDict(**{super_repr})"
+        return result
+
+    # Public functions
+
+    def snapshot____(self):
+        """Finds the current version, without taking any lock.
+
+        Returns:
+            result: the current version, a FrozenDotDict
+        """
+        result = self._version
+        return result
+
+    def get_path____(self, path):
+        """Gets a nested value with the given path from the current version.
+
+        See the DotDict get_path____ method.
+
+        Args:
+            path: a path
+
+        Returns:
+            _: the value
+        """
+        return self._version.get_path____(path)
+
+    def set_attr____(self, name, val):
+        """Sets a value with the given name, and publishes the next version.
+
+        Args:
+            name: a name
+            val: a value
+
+        Returns:
+            result: the published version
+
+        Raises:
+            AttributeError: if the name is exceptional
+        """
+        name = str(name)
+
+        if _FrozenDotDict.is_exc_key____(name):
+            raise AttributeError(f"ConcurrentDotDict attribute is protected: {name}")
+
+        result = self._publish([("change", (name,), val)])
+        return result
+
+    def del_attr____(self, name):
+        """Deletes a value with the given name, and publishes the next version.
+
+        Args:
+            name: a name
+
+        Returns:
+            result: the published version
+
+        Raises:
+            AttributeError: if the name is exceptional, or there is no such a value
+        """
+        name = str(name)
+
+        if _FrozenDotDict.is_exc_key____(name):
+            raise AttributeError(f"ConcurrentDotDict attribute is protected: {name}")
+
+        if name not in self._version:
+            raise AttributeError(f"ConcurrentDotDict has no attribute called: {name}")
+
+        result = self._publish([("remove", (name,), None)])
+        return result
+
+    def set_item____(self, key, val):
+        """Sets a value with the given key, and publishes the next version.
+
+        Args:
+            key: a key
+            val: a value
+
+        Returns:
+            result: the published version
+        """
+        result = self._publish([("change", (str(key),), val)])
+        return result
+
+    def del_item____(self, key):
+        """Deletes a value with the given key, and publishes the next version.
+
+        Args:
+            key: a key
+
+        Returns:
+            result: the published version
+
+        Raises:
+            KeyError: if there is no such a value
+        """
+        result = self._publish([("remove", (str(key),), None)])
+        return result
+
+    def set_path____(self, path, val):
+        """Sets a nested value with the given path, and publishes the next version.
+
+        See the DotDict get_path____ method for the path forms. The path must go through the nested dicts only.
+
+        Args:
+            path: a path
+            val: a value
+
+        Returns:
+            result: the published version
+        """
+        steps = path if isinstance(path, tuple) else _compile_path(str(path))
+        result = self._publish([("change", steps, val)])
+        return result
+
+    def update____(self, *maps, **kwargs):
+        """Sets the items of the given maps and kwargs, in order, and publishes the next version once.
+
+        Args:
+            *maps: the maps, each a dict (including DotDict) or Mapping
+            **kwargs: the keyword arguments
+
+        Returns:
+            result: the published version
+        """
+        ops = []
+
+        for map_ in maps + (kwargs,):
+            for key, val in map_.items():
+                ops.append(("change", (str(key),), val))
+        # end for
+
+        result = self._publish(ops)
+        return result
+
+    def apply_patch____(self, ops):
+        """Applies the given operations, in order, and publishes the next version once.
+
+        See the DotDict diff____ method for the operations. Either all or none of the operations are published.
+
+        Args:
+            ops: an iterable of the operations, each a tuple of the operation name, the path, and the value
+
+        Returns:
+            result: the published version
+        """
+        result = self._publish(ops)
+        return result
+
+    def replace____(self, *args, **kwargs):
+        """Replaces the content with the given args and kwargs, like a FrozenDotDict, and publishes it.
+
+        Args:
+            *args: the variable arguments
+            **kwargs: the keyword arguments
+
+        Returns:
+            result: the published version
+        """
+        result = _FrozenDotDict(*args, **kwargs)
+
+        with self._lock:
+            object.__setattr__(self, "_version", result)
+
+        return result
+
+
+def _copy_node(node):
+    """Copies a FrozenDotDict node into a DotDict, with all its stored items.
+
+    Args:
+        node: the node
+
+    Returns:
+        result: the copy
+    """
+    result = _DotDict()
+    _dict_update(result, node)
+    return result
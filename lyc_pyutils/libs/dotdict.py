@@ -6,17 +6,82 @@
 # First added by username: liu-yucheng
 # Last updated by username: liu-yucheng
 
+import copyreg
+import functools
+import io
+import re
+import reprlib
+import sys
+
 from collections import abc
 
 # Aliases
 
+_copyreg_newobj = copyreg.__newobj__
+_dict_getitem = dict.__getitem__
+_dict_new = dict.__new__
+_dict_setitem = dict.__setitem__
+_dict_setitem_all = dict.update
 _Iterable = abc.Iterable
+_lru_cache = functools.lru_cache
 _Mapping = abc.Mapping
+_re_compile = re.compile
+_Repr = reprlib.Repr
+_StringIO = io.StringIO
+_sys_intern = sys.intern
+_sys_maxsize = sys.maxsize
 
 # -
 
+_dir_names = {}
+"""The cached dir(cls) name sets, keyed by DotDict classes."""
+
+_class_defaults = {}
+"""The cached class-level default templates, keyed by DotDict classes."""
+
+_record_classes = {}
+"""The cached compact record classes, keyed by DotDict classes."""
+
+_exc_keys = {}
+"""The memoized exceptional key classifications, keyed by DotDict classes."""
+
+_exc_keys_cap = 4096
+"""The max number of memoized classifications per DotDict class."""
+
+_path_step_regex = _re_compile(r"([^.\[\]]+)|\[(-?\d+)\]|(\.)")
+"""The regex that matches a step of a dotted path, a name, an index, or a separating dot."""
+
+_track_attr_names = ("_track", "_track_parent", "_track_key", "_track_log")
+"""The instance attribute names used by the change tracking."""
+
+_stream_buf_size = 65536
+"""The number of characters to buffer before each write to a string representation stream."""
+
+
+class _DotDictType(type):
+    """The metaclass of DotDict, which clears the cached per-class data when a class-level attribute changes."""
+
+    def __setattr__(cls, name, val):
+        """Sets a class-level attribute, and clears the cached per-class data of cls and its subclasses.
+
+        Args:
+            name: an attribute name
+            val: an attribute value
+        """
+        super().__setattr__(name, val)
+        _clear_class_caches(cls)
+
+    def __delattr__(cls, name):
+        """Deletes a class-level attribute, and clears the cached per-class data of cls and its subclasses.
+
+        Args:
+            name: an attribute name
+        """
+        super().__delattr__(name)
+        _clear_class_caches(cls)
+
 
-class DotDict(dict):
+class DotDict(dict, metaclass=_DotDictType):
     """Dot dictionary, API version 2.
 
     NOTE: Not API-compatible with the version 1 DotDict.
@@ -51,24 +116,211 @@ class DotDict(dict):
     # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
     # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
 
-    dir_dict_excs____ = dir(dict())
-    """The dir(dict()) exceptional names."""
+    _lazy = False
+    """Whether the nested Python built-in dict values are converted lazily, on their first accesses."""
+
+    _lazy_convs = None
+    """The lazy conversion memo, shared by a lazy DotDict tree. It maps the id of each converted Python built-in dict
+        to a tuple of the dict and its DotDict."""
+
+    _cow = False
+    """Whether the nested DotDict values are copied on their first accesses, as in a snapshot."""
+
+    _track = False
+    """Whether the item changes are recorded, as in the track____ method."""
+
+    dir_dict_excs____ = frozenset(dir(dict()))
+    """The dir(dict()) exceptional names.
+
+    Call the clear_exc_keys____ method after changing this.
+    """
+
+    @classmethod
+    def dir_names____(cls):
+        """Finds the set of the dir(cls) names.
+
+        The set is computed once per class and cached until the clear_dir_names____ method is called.
+
+        Returns:
+            result: the dir(cls) name set
+        """
+        result = _dir_names.get(cls)
+
+        if result is None:
+            result = frozenset(dir(cls))
+            _dir_names[cls] = result
+        # end if
+
+        return result
+
+    @classmethod
+    def clear_dir_names____(cls):
+        """Clears the cached dir(cls) name sets and default templates of cls and its subclasses.
+
+        Setting or deleting a class-level attribute, like "DotDictClass.key = val", calls this automatically, and so
+            do the set_class_attr____ and del_class_attr____ methods. Call this after changing the class-level
+            attributes of a DotDict class in any other way, like through a base class that is not a DotDict. Call
+            this on DotDict itself to clear the cached data of all the DotDict classes.
+
+        The record classes are kept, see the record_class____ method.
+        """
+        _clear_class_caches(cls)
+
+    @classmethod
+    def defaults____(cls):
+        """Finds the class-level default template of cls.
+
+        The template is computed once per class and cached until the clear_dir_names____ method is called.
+
+        Returns:
+            result: a tuple of ...
+                ... the default values dict, with the non-exceptional class-level names as its keys; and,
+                ... the names whose default values are Python built-in dicts, to convert for each instance
+        """
+        result = _class_defaults.get(cls)
+
+        if result is not None:
+            return result
+
+        defaults = {}
+        dict_names = []
+
+        # Keep the dir(cls) order, as in the instance initialization before the templates
+        for name in sorted(cls.dir_names____()):
+            name = str(name)
+
+            if not cls.is_exc_key____(name):
+                val = getattr(cls, name)
+                defaults[name] = val
+
+                if (not isinstance(val, DotDict)) and isinstance(val, dict):
+                    dict_names.append(name)
+            # end if
+        # end for
+
+        result = (defaults, tuple(dict_names))
+        _class_defaults[cls] = result
+        return result
+
+    @classmethod
+    def record_class____(cls):
+        """Finds the compact record class of cls.
+
+        The record class is a DotRecord subclass whose fields are the non-exceptional class-level names of cls, in the
+            class-level default template order, with the class-level values as their defaults. The values are stored
+            in the __slots__ of the records, with the field index shared by all the records of the class, instead of
+            a hash table per record.
+
+        The record class is built once per class. When the class-level attributes of cls change, the defaults of the
+            record class are refreshed in place, so the existing records stay its instances. A new record class is
+            built only if the fields change, since the __slots__ of a class cannot change.
+
+        Returns:
+            result: the record class
+        """
+        result = _record_classes.get(cls)
+        template = cls.defaults____()
+
+        if result is not None and result._template is template:
+            return result
+
+        defaults, dict_names = template
+        fields = tuple(defaults)
+
+        if result is not None and result._fields == fields:
+            result._defaults = tuple(defaults.values())
+            result._dict_fields = dict_names
+            result._template = template
+            return result
+        # end if
+
+        attrs = {
+            "__slots__": fields,
+            "__module__": cls.__module__,
+            "__qualname__": f"{cls.__qualname__}Record",
+            "_fields": fields,
+            "_field_index": {name: index for index, name in enumerate(fields)},
+            "_defaults": tuple(defaults.values()),
+            "_dict_fields": dict_names,
+            "_dotdict_class": cls,
+            "_template": template
+        }
+
+        result = type(f"{cls.__name__}Record", (DotRecord,), attrs)
+        result._setters = tuple(result.__dict__[name].__set__ for name in fields)
+        _record_classes[cls] = result
+        return result
+
+    @classmethod
+    def clear_exc_keys____(cls):
+        """Clears the memoized exceptional key classifications of all the DotDict classes."""
+        _exc_keys.clear()
 
     @classmethod
-    def from_dict____(cls, dict_):
+    def from_dict____(cls, dict_, lazy=False):
         """Builds and returns a DotDict from a Python built-in dict or Mapping.
 
+        The nested Python built-in dict values are converted with an explicit stack instead of recursive calls, so
+            the nesting depth is not limited by the Python recursion limit. A dict object referenced multiple times is
+            converted once, and all its references share the resulting DotDict. Thus, the shared subtrees stay shared,
+            and a self-referencing dict becomes a self-referencing DotDict.
+
+        In the lazy mode, the nested Python built-in dict values are stored as-is. Such a value is converted to a lazy
+            DotDict, and cached in place, on its first access through the get_attr____ or get_item____ method. Until
+            then, the dict methods, like values and items, give the value as-is. The lazy DotDicts of a tree share a
+            conversion memo, so a dict object is converted once, no matter through which reference it is accessed.
+
         Args:
             dict_: a dict or Mapping
+            lazy: whether to use the lazy mode
 
         Returns:
             result: the resulting DotDict
         """
         # print(f"from_dict____ dict_: {dict_}")  # Debug
-        result = DotDict()
+        if lazy:
+            result = _lazy_from_dict(dict_, {})
+        else:
+            result = _conv_dict(dict_, {})
+        # end if
+
+        return result
+
+    @classmethod
+    def from_pairs____(cls, pairs):
+        """Builds and returns a DotDict from an iterable of key-value pairs, trusting the values as converted.
+
+        The values are stored as they are, without the set_attr____ checks and the Python built-in dict conversions.
+            This suits building DotDicts bottom-up, like in the object_pairs_hook of a JSON decoder. Like in the
+            from_dict____ method, the exceptional keys are skipped.
+
+        Args:
+            pairs: an iterable of key-value pairs
+
+        Returns:
+            result: the resulting DotDict
+        """
+        # Skip the initialization chain, which does nothing else for a DotDict without args
+        result = _dict_new(DotDict)
+        is_exc_key = DotDict.is_exc_key____
+        exc_memo = _exc_keys.get(DotDict, {})
+        dir_names = DotDict.dir_names____()
+
+        for key, val in pairs:
+            name = str(key)
+            name_is_exc = exc_memo.get(name)
+
+            if name_is_exc is None:
+                name_is_exc = is_exc_key(name)
+
+            if name_is_exc:
+                continue
+
+            if name in dir_names:
+                result.__dict__[name] = val
 
-        for key in dict_:
-            result.set_attr____(key, dict_[key])
+            _dict_setitem(result, name, val)
+        # end for
 
         return result
 
@@ -79,6 +331,8 @@ class DotDict(dict):
         If a key is exceptional, when accessed with the "dict.key" syntax, it is read-only and evaluated to the
             respective dict or DotDict attribute.
 
+        The classifications are memoized per class, up to a bounded number of keys.
+
         Args:
             key: a key
 
@@ -88,6 +342,18 @@ class DotDict(dict):
         # print(f"is_exc____ key: {key}")  # Debug
         key = str(key)
 
+        memo = _exc_keys.get(cls)
+
+        if memo is None:
+            memo = {}
+            _exc_keys[cls] = memo
+        # end if
+
+        result = memo.get(key)
+
+        if result is not None:
+            return result
+
         # See whether the key is in the dir(dict()) attribute list
         result = key in cls.dir_dict_excs____
 
@@ -100,8 +366,166 @@ class DotDict(dict):
             (len(key) >= 4 and key[:2] == "__" and key[-2:] == "__") or \
             key[-4:] == "____"
 
+        # Bound the memo by starting over when it is full
+        if len(memo) >= _exc_keys_cap:
+            memo.clear()
+
+        memo[key] = result
+        return result
+
+    def _in_dir(self, name):
+        """Finds if a name is in self.__dir__(), without building self.__dir__().
+
+        Args:
+            name: a name
+
+        Returns:
+            result: whether the name is in self.__dir__()
+        """
+        self_type = type(self)
+        names = _dir_names.get(self_type)
+
+        if names is None:
+            names = self_type.dir_names____()
+
+        result = name in names or name in self.__dict__
         return result
 
+    def _conv_nested(self, key, val):
+        """Converts a nested dict value on its access, and caches the result in place.
+
+        In the lazy mode, a Python built-in dict value is converted to a lazy DotDict. In the copy-on-write mode, a
+            DotDict value that self does not own yet is replaced with its snapshot.
+
+        Args:
+            key: an item key
+            val: the item value
+
+        Returns:
+            val: the converted item value
+        """
+        if self._lazy and (not isinstance(val, DotDict)):
+            convs = self._lazy_convs
+
+            # An unpickled lazy DotDict starts a new memo
+            if convs is None:
+                convs = {}
+                self.__dict__["_lazy_convs"] = convs
+            # end if
+
+            conv = convs.get(id(val))
+            val = _lazy_from_dict(val, convs) if conv is None else conv[1]
+        elif self._cow and isinstance(val, DotDict) and (key not in self._cow_owned):
+            val = val.snapshot____()
+        else:
+            return val
+        # end if
+
+        old = super().__getitem__(key)
+        super().__setitem__(key, val)
+
+        if self._cow:
+            self._cow_owned.add(key)
+
+        if (not type(self).is_exc_key____(key)) and self._in_dir(key):
+            super().__setattr__(key, val)
+
+        # The converted value replaces the old one in the tracking, without being a change
+        if self._track:
+            _track_detach(self, old)
+            _track_attach(self, key, val)
+        # end if
+
+        return val
+
+    def _track_set(self, key, old, val, existed):
+        """Records that an item is set, and attaches a DotDict value to the change tracking of self.
+
+        Args:
+            key: an item key
+            old: the old item value, or None
+            val: the new item value
+            existed: whether the item existed before the setting
+        """
+        if old is not val:
+            _track_detach(self, old)
+
+        if isinstance(val, DotDict):
+            _track_attach(self, key, val)
+
+        self._track_change(key, existed)
+
+    def _track_change(self, key, existed):
+        """Records the change of an item in the change log of the tracking root.
+
+        The path of the item is found by following the parent links up to the root. Only the first change of each
+            path since the last checkpoint is recorded, along with whether the item existed before it.
+
+        Args:
+            key: an item key
+            existed: whether the item existed before the change
+        """
+        path = [key]
+        node = self
+        parent = node.__dict__.get("_track_parent")
+
+        while parent is not None:
+            path.append(node.__dict__["_track_key"])
+            node = parent
+            parent = node.__dict__.get("_track_parent")
+        # end while
+
+        log = node.__dict__.get("_track_log")
+
+        # A detached subtree has no root to record to
+        if log is None:
+            return
+
+        path.reverse()
+        log.setdefault(tuple(path), existed)
+
+    def _set_items(self, pairs):
+        """Sets the items from an iterable of key-value pairs, in bulk.
+
+        This works like calling the set_item____ method on each pair, with the per-class lookups done once. The Python
+            built-in dict values share one conversion memo, so a dict object referenced by multiple pairs is converted
+            once.
+
+        Args:
+            pairs: an iterable of key-value pairs
+        """
+        self_type = type(self)
+        is_exc_key = self_type.is_exc_key____
+        dir_names = self_type.dir_names____()
+        attrs = self.__dict__
+        lazy = self._lazy
+        cow = self._cow
+        track = self._track
+        convs = {}
+
+        for key, val in pairs:
+            key = str(key)
+
+            if (not lazy) and (not isinstance(val, DotDict)) and isinstance(val, dict):
+                val = _conv_dict(val, convs)
+
+            if track:
+                existed = key in self
+                old = super().get(key)
+            # end if
+
+            super().__setitem__(key, val)
+
+            if (key in dir_names or key in attrs) and (not is_exc_key(key)):
+                super().__setattr__(key, val)
+
+            if cow:
+                self._cow_owned.add(key)
+
+            if track:
+                self._track_set(key, old, val, existed)
+        # end for
+
     def _mand_init(self, *args, **kwargs):
         """Inits self with the given args and kwargs.
 
@@ -113,18 +537,20 @@ class DotDict(dict):
         """
         self_type = type(self)
 
-        # Set the inherited keys from the custom class level
+        # Set the inherited keys from the custom class level, in bulk from the class-level default template
         if self_type is not DotDict and issubclass(self_type, DotDict):
-            class_dir = dir(self_type)
+            defaults, dict_names = self_type.defaults____()
 
-            for name in class_dir:
-                name = str(name)
-                # print(f"_mand_init class attribute {name}: {getattr(self_type, name)}")  # Debug
+            if len(defaults) > 0:
+                self.__dict__.update(defaults)
+                super().update(defaults)
 
-                if not self_type.is_exc_key____(name):
-                    val = getattr(self_type, name)
-                    self.set_attr____(name, val)
-            # end for
+                for name in dict_names:
+                    val = DotDict.from_dict____(defaults[name])
+                    super().__setattr__(name, val)
+                    super().__setitem__(name, val)
+                # end for
+            # end if
         # end if
 
         # Set keys with the key names from the variable arguments
@@ -132,7 +558,7 @@ class DotDict(dict):
             arg = str(arg)
             # print(f"_mand_init *args arg: {arg}")  # Debug
 
-            if not self_type.is_exc_key____(name):
+            if not self_type.is_exc_key____(arg):
                 self.set_attr____(arg, None)
         # end for
 
@@ -141,7 +567,7 @@ class DotDict(dict):
             kw = str(kw)
             # print(f"_mand_init **kwargs kw: {kw}  arg: {kwargs[kw]}")  # Debug
 
-            if not self_type.is_exc_key____(name):
+            if not self_type.is_exc_key____(kw):
                 arg = kwargs[kw]
                 self.set_attr____(kw, arg)
         # end for
@@ -190,6 +616,22 @@ class DotDict(dict):
 
     # Magic functions
 
+    def __init_subclass__(cls, **kwargs):
+        """Inits a subclass of DotDict.
+
+        This precomputes the class-level default template of the subclass. If the subclass overrides the get_attr____
+            method, its "dict.key" reads are routed through the override.
+
+        Args:
+            **kwargs: the keyword arguments
+        """
+        super().__init_subclass__(**kwargs)
+
+        if cls.get_attr____ is not DotDict.get_attr____ and "__getattr__" not in cls.__dict__:
+            cls.__getattr__ = _getattr_via_api
+
+        cls.defaults____()
+
     def __init__(self, *args, **kwargs):
         """Inits self with the given args and kwargs.
 
@@ -270,13 +712,30 @@ class DotDict(dict):
     def __getattr__(self, name):
         """Gets an attribute with the given name.
 
+        Python calls this only after its normal lookup misses the class-level and the instance attributes, so only the
+            items are left to check. Thus, this reads the item directly, without the attribute checks of the
+            get_attr____ method. A subclass that overrides the get_attr____ method has it called here instead, see the
+            __init_subclass__ method.
+
         Args:
             name: an attribute name
 
         Returns:
-            _: the attribute value
+            val: the attribute value
+
+        Raises:
+            AttributeError: if self and self.__dir__() both have no such an attribute
         """
-        return self.get_attr____(name)
+        try:
+            val = _dict_getitem(self, name)
+        except KeyError:
+            raise AttributeError(f"self and self.__dir__() both have no attribute called: {name}") from None
+        # end try
+
+        if (self._lazy or self._cow) and isinstance(val, dict):
+            val = self._conv_nested(name, val)
+
+        return val
 
     def __setattr__(self, name, val):
         """Sets an attribute with the given name to the given value.
@@ -331,9 +790,49 @@ class DotDict(dict):
         """Sets self's internal to the given state.
 
         Args:
-            state: a serialization of self's certain state
+            state: a serialization of self's certain state, either ...
+                ... a tuple of the items dict and the instance attributes dict, from the __reduce_ex__ method; or,
+                ... a dict, from the __getstate__ method
+        """
+        if isinstance(state, tuple):
+            items, attrs = state
+            super().update(items)
+            self.__dict__.update(attrs)
+        else:
+            self.__init__(**state)
+        # end if
+
+    def __reduce_ex__(self, protocol):
+        """Finds the pickling recipe of self.
+
+        The items and the instance attributes are pickled as they are, without the __getstate__ dict conversion. The
+            unpickling restores them in bulk, without re-running the initialization. Since the values are not
+            converted, out-of-band buffers in the values work as usual with pickle protocol 5.
+
+        This also serves copy.copy and copy.deepcopy.
+
+        Args:
+            protocol: the pickle protocol
+
+        Returns:
+            result: a tuple of the constructor, the constructor args, and the state
         """
-        self.__init__(**state)
+        attrs = dict(self.__dict__)
+
+        # The restored values are not shared with any snapshots
+        attrs.pop("_cow", None)
+        attrs.pop("_cow_owned", None)
+
+        # The restored values start a new lazy conversion memo
+        attrs.pop("_lazy_convs", None)
+
+        # The restored values are not tracked
+        for name in _track_attr_names:
+            attrs.pop(name, None)
+
+        state = (dict(self), attrs)
+        result = (_copyreg_newobj, (type(self),), state)
+        return result
 
     # End of magic functions
     # Attribute functions
@@ -352,18 +851,18 @@ class DotDict(dict):
         """
         name = str(name)
 
-        self_dir = self.__dir__()
-        name_in_self_dir = name in self_dir
-        name_in_self = name in self
-
-        if name_in_self_dir:
+        # Check the names lazily, so that the common cases stop at the first hit
+        if self._in_dir(name):
             val = super().__getattribute__(name)
-        elif name_in_self:
+        elif name in self:
             val = super().__getitem__(name)
         else:
             raise AttributeError(f"self and self.__dir__() both have no attribute called: {name}")
         # end if
 
+        if (self._lazy or self._cow) and isinstance(val, dict) and name in self:
+            val = self._conv_nested(name, val)
+
         return val
 
     def set_attr____(self, name, val):
@@ -372,7 +871,7 @@ class DotDict(dict):
         If the name is an exceptional key name, this method protects the corresponding attribute from the changes.
 
         When setting the attribute values, all Python built-in dict values are converted to their corresponding DotDict
-            values recursively.
+            values recursively. In the lazy mode (see the from_dict____ method), they are stored as-is instead.
 
         Args:
             name: an attribute name
@@ -388,8 +887,7 @@ class DotDict(dict):
         self_type = type(self)
         name_is_exc = self_type.is_exc_key____(name)
 
-        self_dir = self.__dir__()
-        name_in_self_dir = name in self_dir
+        name_in_self_dir = self._in_dir(name)
         name_in_self = name in self
 
         if name_is_exc:
@@ -401,13 +899,21 @@ class DotDict(dict):
                 val = None
             # end if
         else:
-            if (not isinstance(val, DotDict)) and isinstance(val, dict):
+            if (not self._lazy) and (not isinstance(val, DotDict)) and isinstance(val, dict):
                 val = DotDict.from_dict____(val)
 
+            old = super().get(name)
+
             if name_in_self_dir:
                 super().__setattr__(name, val)
 
             super().__setitem__(name, val)
+
+            if self._cow:
+                self._cow_owned.add(name)
+
+            if self._track:
+                self._track_set(name, old, val, name_in_self)
         # end if
 
         return val
@@ -433,8 +939,7 @@ class DotDict(dict):
         self_type = type(self)
         name_is_exc = self_type.is_exc_key____(name)
 
-        self_dir = self.__dir__()
-        name_in_self_dir = name in self_dir
+        name_in_self_dir = self._in_dir(name)
         name_in_self = name in self
 
         info = f"self and self.__dir__() both have no attribute called: {name}"
@@ -448,6 +953,8 @@ class DotDict(dict):
                 raise AttributeError(info)
             # end if
         else:
+            old = super().get(name)
+
             if name_in_self_dir:
                 super().__delattr__(name)
 
@@ -457,6 +964,14 @@ class DotDict(dict):
             if (not name_in_self_dir) and (not name_in_self):
                 raise AttributeError(info)
 
+            if self._cow:
+                self._cow_owned.discard(name)
+
+            if self._track and name_in_self:
+                _track_detach(self, old)
+                self._track_change(name, True)
+            # end if
+
             val = None
         # end if
 
@@ -479,7 +994,7 @@ class DotDict(dict):
         name = str(name)
 
         self_type = type(self)
-        class_dir = dir(self_type)
+        class_dir = self_type.dir_names____()
 
         if name not in class_dir:
             raise AttributeError(f"type(self).__dir__() has no attribute called: {name}")
@@ -515,10 +1030,9 @@ class DotDict(dict):
         self_type = type(self)
         name_is_exc = self_type.is_exc_key____(name)
 
-        class_dir = dir(self_type)
-        self_dir = self.__dir__()
+        class_dir = self_type.dir_names____()
         name_in_class_dir = name in class_dir
-        name_in_self_dir = name in self_dir
+        name_in_self_dir = self._in_dir(name)
         name_in_self = name in self
 
         if name_is_exc:
@@ -534,6 +1048,7 @@ class DotDict(dict):
                 val = DotDict.from_dict____(val)
 
             setattr(self_type, name, val)
+            self_type.clear_dir_names____()
             self.set_attr____(name, val)
         # end if
 
@@ -564,10 +1079,9 @@ class DotDict(dict):
         self_type = type(self)
         name_is_exc = self_type.is_exc_key____(name)
 
-        class_dir = dir(self_type)
-        self_dir = self.__dir__()
+        class_dir = self_type.dir_names____()
         name_in_class_dir = name in class_dir
-        name_in_self_dir = name in self_dir
+        name_in_self_dir = self._in_dir(name)
         name_in_self = name in self
 
         info = f"self, self.__dir__(), and type(self).__dir__() all have no attribute called: {name}"
@@ -583,6 +1097,8 @@ class DotDict(dict):
         else:
             if name_in_class_dir:
                 delattr(self_type, name)
+                self_type.clear_dir_names____()
+            # end if
 
             self.del_attr____(name)
 
@@ -611,13 +1127,13 @@ class DotDict(dict):
         """
         key = str(key)
 
-        self_dir = self.__dir__()
-        key_in_self = key in self
-        key_in_self_dir = key in self_dir
-
-        if key_in_self:
+        # Check the keys lazily, so that the common cases stop at the first hit
+        if key in self:
             val = super().__getitem__(key)
-        elif key_in_self_dir:
+
+            if (self._lazy or self._cow) and isinstance(val, dict):
+                val = self._conv_nested(key, val)
+        elif self._in_dir(key):
             val = super().__getattribute__(key)
         else:
             raise KeyError(f"self and self.__dir__() both have no item with the key: {key}")
@@ -629,7 +1145,7 @@ class DotDict(dict):
         """Sets an item with the given key to the given value.
 
         When setting the item values, all Python built-in dict values are converted to their corresponding DotDict
-            values recursively.
+            values recursively. In the lazy mode (see the from_dict____ method), they are stored as-is instead.
 
         Args:
             key: an item key
@@ -643,17 +1159,27 @@ class DotDict(dict):
         self_type = type(self)
         key_is_exc = self_type.is_exc_key____(key)
 
-        self_dir = self.__dir__()
-        key_in_self_dir = key in self_dir
+        key_in_self_dir = self._in_dir(key)
 
-        if (not isinstance(val, DotDict)) and isinstance(val, dict):
+        if (not self._lazy) and (not isinstance(val, DotDict)) and isinstance(val, dict):
             val = DotDict.from_dict____(val)
 
+        if self._track:
+            existed = key in self
+            old = super().get(key)
+        # end if
+
         super().__setitem__(key, val)
 
         if (not key_is_exc) and key_in_self_dir:
             super().__setattr__(key, val)
 
+        if self._cow:
+            self._cow_owned.add(key)
+
+        if self._track:
+            self._track_set(key, old, val, existed)
+
         return val
 
     def del_item____(self, key):
@@ -673,9 +1199,9 @@ class DotDict(dict):
         self_type = type(self)
         key_is_exc = self_type.is_exc_key____(key)
 
-        self_dir = self.__dir__()
         key_in_self = key in self
-        key_in_self_dir = key in self_dir
+        key_in_self_dir = self._in_dir(key)
+        old = super().get(key)
 
         if key_in_self:
             super().__delitem__(key)
@@ -686,6 +1212,14 @@ class DotDict(dict):
         if (not key_in_self) and (not key_in_self_dir):
             raise KeyError(f"self and self.__dir__() both have no item with the key: {key}")
 
+        if self._cow:
+            self._cow_owned.discard(key)
+
+        if self._track and key_in_self:
+            _track_detach(self, old)
+            self._track_change(key, True)
+        # end if
+
         val = None
         return val
 
@@ -731,65 +1265,1616 @@ class DotDict(dict):
 
     # End of item functions
 
-    def repr____(self):
-        """Finds a Python representation of self.
-
-        This makes eval(repr(self)) == self.
+    def deep_update____(self, *maps, **kwargs):
+        """Deep-updates self with the given mapping trees, in order, and then with the given keyword arguments.
 
-        Returns:
-            result: the resulting Python representation
-        """
-        super_repr = super().__repr__()
-        result = f"DotDict(**{super_repr})"
-        return result
+        A dict (including DotDict) value is merged into the DotDict value with the same key, which is created if
+            missing or replaced if not a DotDict. Any other value replaces the value with the same key. The values are
+            set with the set_item____ method, so the items follow the "dict[key]" syntax rules.
 
-    def str____(self):
-        """Finds a string representation of self.
+        The trees are merged with an explicit stack in a single traversal. The dict values are merged into new
+            DotDicts instead of being stored, so self never aliases any part of the given trees. A dict referenced
+            multiple times is merged into a single new DotDict.
 
-        Returns:
-            result: the resulting string representation
+        Args:
+            *maps: the mapping trees, each a dict or Mapping
+            **kwargs: the keyword arguments
         """
-        if len(self) <= 0:
-            result = ".{}"
-            return result
+        stack = []
+
+        for map_ in reversed(maps + (kwargs,)):
+            stack.append((self, map_))
+
+        merged = set()
+        new_nodes = {}
+
+        while len(stack) > 0:
+            dest, src = stack.pop()
+
+            # Skip the repeated pairs, which come from the cycles in the trees
+            pair_ids = (id(dest), id(src))
+
+            if pair_ids in merged:
+                continue
+
+            merged.add(pair_ids)
+            pairs = []
+            subtrees = []
+
+            for key, val in src.items():
+                if not isinstance(val, dict):
+                    pairs.append((key, val))
+                    continue
+
+                name = str(key)
+
+                # Let the lazy and copy-on-write modes convert the existing value
+                if dest._lazy or dest._cow:
+                    node = dest.get_item____(name) if name in dest else None
+                else:
+                    node = dest.get(name)
+                # end if
+
+                if isinstance(node, DotDict):
+                    subtrees.append((node, val))
+                elif id(val) in new_nodes:
+                    # Share the new DotDict of a dict referenced multiple times
+                    pairs.append((name, new_nodes[id(val)]))
+                else:
+                    node = DotDict()
+                    new_nodes[id(val)] = node
+                    pairs.append((name, node))
+                    subtrees.append((node, val))
+                # end if
+            # end for
 
-        segs = []
+            if len(pairs) > 0:
+                dest._set_items(pairs)
 
-        for key in self:
-            val = self[key]
+            # Merge the subtrees in order
+            stack.extend(reversed(subtrees))
+        # end while
 
-            if isinstance(val, DotDict):
-                seg = f"{key.__str__()}: {val.__str__()}, "
-            else:
-                seg = f"{key.__str__()}: {val.__repr__()}, "
-            # end if
+    @classmethod
+    def merge____(cls, *maps, **kwargs):
+        """Builds and returns a DotDict by deep-merging the given mapping trees, in order.
 
-            segs.append(seg)
-        # end for
+        See the deep_update____ method.
 
-        contents = "".join(segs)
-        contents = contents[:-2]  # Remove the trailing comma and space
+        Args:
+            *maps: the mapping trees
+            **kwargs: the keyword arguments
 
-        result = f".{{{contents}}}"
+        Returns:
+            result: the resulting DotDict
+        """
+        result = DotDict()
+        result.deep_update____(*maps, **kwargs)
         return result
 
-    def to_dict____(self):
-        """Finds a Python built-in dict version of self.
+    def get_path____(self, path):
+        """Gets a nested value with the given path.
 
-        This method converts all DotDict values to their corresponding Python built-in dict values recursively.
+        The path is either ...
+            ... a dotted path string, like "model.encoder.layers[3].dropout"; or,
+            ... a tuple of steps, each a str key or an int index.
+
+        A path string is compiled once into a tuple of steps, and cached. The steps are resolved with plain dict and
+            list indexing, so the values are given as they are stored (see the lazy mode and the snapshot____ method).
+
+        Args:
+            path: a path
 
         Returns:
-            result: the result dict
+            val: the value
+
+        Raises:
+            KeyError: if a key is missing
+            IndexError: if an index is out of range
+            ValueError: if the path string is malformed
         """
-        result = {}
+        steps = path if isinstance(path, tuple) else _compile_path(str(path))
+        val = self
+
+        for step in steps:
+            if isinstance(val, dict):
+                val = _dict_getitem(val, step)
+            else:
+                val = val[step]
+        # end for
+
+        return val
+
+    def get_paths____(self, paths):
+        """Gets the nested values with the given paths.
+
+        See the get_path____ method.
+
+        Args:
+            paths: an iterable of paths
+
+        Returns:
+            result: the list of values, in the order of the paths
+        """
+        result = [self.get_path____(path) for path in paths]
+        return result
+
+    def set_path____(self, path, val):
+        """Sets a nested value with the given path to the given value.
+
+        See the get_path____ method for the path forms. The nested DotDicts along the path are accessed with the
+            get_item____ method, and the last step is set with the set_item____ method, so the lazy and copy-on-write
+            modes work as usual.
+
+        Args:
+            path: a path
+            val: a value
+
+        Returns:
+            val: the value after the setting
+
+        Raises:
+            KeyError: if a key is missing
+            IndexError: if an index is out of range
+            ValueError: if the path string is malformed or empty
+        """
+        steps = path if isinstance(path, tuple) else _compile_path(str(path))
+
+        if len(steps) <= 0:
+            raise ValueError(f"Cannot set a value with an empty path: {path}")
+
+        node = self
+
+        for step in steps[:-1]:
+            if isinstance(node, DotDict):
+                node = node.get_item____(step)
+            else:
+                node = node[step]
+        # end for
+
+        if isinstance(node, DotDict):
+            val = node.set_item____(steps[-1], val)
+        else:
+            node[steps[-1]] = val
+
+        return val
+
+    def iter_flat____(self, sep="."):
+        """Iterates over the flattened items of self, like ("a.b.c", val), in the depth-first order.
+
+        The nested dicts are walked with an explicit stack. Each key prefix is built and interned once, and shared by
+            all the flat keys under it. An empty nested dict is given as a leaf value.
+
+        Args:
+            sep: the key separator
+
+        Yields:
+            item: a tuple of the flat key and the leaf value
+
+        Raises:
+            ValueError: if a nested dict contains itself
+        """
+        sep = str(sep)
+
+        stack = [("", iter(dict.items(self)))]
+        on_path = {id(self)}
+        nodes = [self]
+
+        while len(stack) > 0:
+            prefix, items = stack[-1]
+
+            for key, val in items:
+                if isinstance(val, dict) and len(val) > 0:
+                    if id(val) in on_path:
+                        raise ValueError(f"Cannot flatten a dict that contains itself, at: {prefix}{key}")
+
+                    # Descend, and resume the current items after the nested ones
+                    stack.append((_sys_intern(f"{prefix}{key}{sep}"), iter(dict.items(val))))
+                    on_path.add(id(val))
+                    nodes.append(val)
+                    break
+                # end if
+
+                yield (f"{prefix}{key}", val)
+            else:
+                stack.pop()
+                on_path.discard(id(nodes.pop()))
+            # end for
+        # end while
+
+    def flatten____(self, sep="."):
+        """Finds a flattened dict version of self, like {"a.b.c": val}.
+
+        See the iter_flat____ method.
+
+        Args:
+            sep: the key separator
+
+        Returns:
+            result: the flattened dict
+        """
+        result = dict(self.iter_flat____(sep))
+        return result
+
+    @classmethod
+    def unflatten____(cls, flat, sep="."):
+        """Builds and returns a DotDict from a flattened dict, or an iterable of flattened items.
+
+        The nested DotDicts are looked up by their key prefixes, so each one is found or created once. The items of
+            each DotDict are set in bulk.
+
+        Args:
+            flat: a flattened dict or Mapping, like {"a.b.c": val}; or, an iterable of flattened items
+            sep: the key separator
+
+        Returns:
+            result: the resulting DotDict
+
+        Raises:
+            ValueError: if a flat key is both a leaf and a prefix of another flat key
+        """
+        sep = str(sep)
+
+        if isinstance(flat, _Mapping):
+            flat = flat.items()
+
+        result = DotDict()
+        nodes = {"": result}
+        leaf_keys = set()
+
+        # The pending items of each node, set in bulk at the end, in order
+        node_items = {"": []}
+
+        for flat_key, val in flat:
+            flat_key = str(flat_key)
+            prefix, _, name = flat_key.rpartition(sep)
+            items = node_items.get(prefix)
+
+            if items is None:
+                items = node_items[""]
+                node_key = ""
+
+                for part in prefix.split(sep):
+                    node_key = f"{node_key}{sep}{part}" if len(node_key) > 0 else part
+
+                    if node_key not in nodes:
+                        if node_key in leaf_keys:
+                            raise ValueError(f"Flat key is both a leaf and a prefix: {node_key}")
+
+                        child = DotDict()
+                        items.append((part, child))
+                        nodes[node_key] = child
+                        node_items[node_key] = []
+                    # end if
+
+                    items = node_items[node_key]
+                # end for
+            # end if
+
+            if flat_key in nodes:
+                raise ValueError(f"Flat key is both a leaf and a prefix: {flat_key}")
+
+            leaf_keys.add(flat_key)
+            items.append((name, val))
+        # end for
+
+        for node_key in node_items:
+            nodes[node_key]._set_items(node_items[node_key])
+
+        return result
+
+    def diff____(self, other):
+        """Iterates over the operations that turn self into the given mapping tree, in the depth-first order.
+
+        Each operation is a tuple of (op, path, val), where op is "add", "change", or "remove"; path is the tuple of
+            the keys to the item; and val is the new value, or None for "remove". The nested dicts on both sides are
+            compared key by key, and any other value that does not equal its counterpart is changed as a whole.
+
+        The trees are walked with an explicit stack, using the dict methods, so the lazy and copy-on-write modes do
+            not convert anything. A subtree that is the same object on both sides is skipped. Two FrozenDotDict
+            subtrees are compared by their cached hashes first, and skipped if they are equal.
+
+        Args:
+            other: the other mapping tree, a dict or Mapping
+
+        Yields:
+            op: a tuple of the operation name, the path, and the value
+
+        Raises:
+            ValueError: if a nested dict contains itself
+        """
+        if self is other:
+            return
+
+        stack = [((), other, iter(dict.items(self)))]
+        on_path = {(id(self), id(other))}
+        nodes = [(self, other)]
+
+        while len(stack) > 0:
+            path, dest, items = stack[-1]
+
+            for key, val in items:
+                if key not in dest:
+                    yield ("remove", path + (key,), None)
+                    continue
+
+                dest_val = dest[key] if not isinstance(dest, dict) else _dict_getitem(dest, key)
+
+                if val is dest_val:
+                    continue
+
+                if isinstance(val, dict) and isinstance(dest_val, _Mapping):
+                    if isinstance(val, FrozenDotDict) and isinstance(dest_val, FrozenDotDict):
+                        if hash(val) == hash(dest_val) and val == dest_val:
+                            continue
+
+                    pair_ids = (id(val), id(dest_val))
+
+                    if pair_ids in on_path:
+                        raise ValueError(f"Cannot diff a dict that contains itself, at: {path + (key,)}")
+
+                    # Descend, and resume the current items after the nested ones
+                    stack.append((path + (key,), dest_val, iter(dict.items(val))))
+                    on_path.add(pair_ids)
+                    nodes.append((val, dest_val))
+                    break
+                # end if
+
+                if val != dest_val:
+                    yield ("change", path + (key,), dest_val)
+            else:
+                src, _ = nodes[-1]
+
+                for key, dest_val in dest.items():
+                    if key not in src:
+                        yield ("add", path + (key,), dest_val)
+
+                stack.pop()
+                src, dest = nodes.pop()
+                on_path.discard((id(src), id(dest)))
+            # end for
+        # end while
+
+    def apply_patch____(self, ops):
+        """Applies the given operations to self in place, in order.
+
+        See the diff____ method for the operations. The values are set with the set_item____ method, so a dict value is
+            converted to a DotDict, and a DotDict value is stored as-is. The nested DotDicts are reached through the
+            item syntax, so the lazy and copy-on-write modes convert them as usual. The parent of the last path is
+            reused by the next operation with the same parent path.
+
+        Args:
+            ops: an iterable of the operations, each a tuple of the operation name, the path, and the value
+
+        Raises:
+            ValueError: if an operation name is unknown, or a path is empty
+            KeyError: if a path does not exist in self
+        """
+        parent_path = None
+        parent = None
+
+        for op, path, val in ops:
+            path = tuple(path)
+
+            if len(path) <= 0:
+                raise ValueError(f"Cannot apply an operation with an empty path: {op}")
+
+            if path[:-1] != parent_path:
+                parent = self
+
+                for key in path[:-1]:
+                    parent = parent[key]
+
+                parent_path = path[:-1]
+            # end if
+
+            key = path[-1]
+
+            if op == "add" or op == "change":
+                if isinstance(parent, DotDict):
+                    parent.set_item____(key, val)
+                else:
+                    parent[key] = val
+                # end if
+            elif op == "remove":
+                if isinstance(parent, DotDict):
+                    parent.del_item____(key)
+                else:
+                    del parent[key]
+                # end if
+            else:
+                raise ValueError(f"Unknown operation: {op}")
+            # end if
+        # end for
+
+    def track____(self):
+        """Starts recording the item changes of self and its nested DotDicts, with self as the tracking root.
+
+        The changes made through the DotDict methods, like the attribute and item syntaxes, are recorded by their
+            paths, which are found through the parent links of the nested DotDicts. The nested DotDicts set later are
+            linked on their settings. The changes made through the dict methods, like dict.update, are not recorded.
+
+        NOTE: A DotDict is linked to the last place it is set to. A DotDict referenced at multiple places in the tree
+            records its changes at one of them only.
+
+        See the changes____ and checkpoint____ methods.
+
+        Raises:
+            ValueError: if self is tracked as a part of another DotDict
+        """
+        attrs = self.__dict__
+
+        if attrs.get("_track_parent") is not None:
+            raise ValueError("Cannot track a DotDict that is tracked as a part of another DotDict")
 
-        for key in self:
-            val = self[key]
+        attrs["_track"] = True
+        attrs["_track_parent"] = None
+        attrs["_track_key"] = None
+        attrs["_track_log"] = {}
 
+        for key, val in dict.items(self):
             if isinstance(val, DotDict):
-                val = val.to_dict____()
+                _track_attach(self, key, val)
+        # end for
+
+    def changes____(self):
+        """Finds the operations that redo the changes of self since the last checkpoint.
+
+        The operations are in the diff____ method format, and can be applied with the apply_patch____ method. Each path
+            gives one operation with its current value, in the order of the first changes. A path under another changed
+            path is left out, since the operation of the latter carries the whole subtree.
+
+        Returns:
+            result: the list of the operations
+
+        Raises:
+            ValueError: if self is not a tracking root
+        """
+        log = self.__dict__.get("_track_log")
+
+        if log is None:
+            raise ValueError("Cannot find the changes of a DotDict that is not a tracking root; see track____")
+
+        result = []
+
+        for path, existed in log.items():
+            if any(path[:index] in log for index in range(1, len(path))):
+                continue
+
+            node = self
+            found = True
+
+            for key in path:
+                if isinstance(node, dict) and key in node:
+                    node = _dict_getitem(node, key)
+                else:
+                    found = False
+                    break
+                # end if
+            # end for
+
+            if found:
+                result.append(("change" if existed else "add", path, node))
+            elif existed:
+                result.append(("remove", path, None))
+            # end if
+        # end for
+
+        return result
+
+    def checkpoint____(self):
+        """Finds the operations that redo the changes of self since the last checkpoint, and starts a new checkpoint.
+
+        See the changes____ method.
+
+        Returns:
+            result: the list of the operations
+
+        Raises:
+            ValueError: if self is not a tracking root
+        """
+        result = self.changes____()
+        self.__dict__["_track_log"].clear()
+        return result
+
+    def snapshot____(self):
+        """Finds a copy-on-write snapshot of self.
+
+        The snapshot is a shallow copy of self. Afterwards, both self and the snapshot copy a nested DotDict on its
+            first access through the attribute or item syntax (the dict.key and dict[key] syntaxes), by replacing it
+            with its own snapshot. Thus, the unchanged subtrees stay shared, and each side copies only the paths it
+            accesses.
+
+        The nested dict values that are mirrored as instance attributes, like the class-level fields of a DotDict
+            subclass, are found by the normal attribute lookup without the copying. So, they are copied on both sides
+            right away. In the lazy mode, both sides start new lazy conversion memos, so a dict converted on one side
+            is never shared with the other.
+
+        NOTE: The nested DotDicts obtained in other ways, like through the dict methods or before the snapshot, are not
+            protected. The other mutable values, like lists, are shared, as in dict.copy.
+
+        Returns:
+            result: the snapshot
+        """
+        result = _dict_new(type(self))
+        _dict_setitem_all(result, self)
+
+        attrs = result.__dict__
+        attrs.update(self.__dict__)
+        attrs["_cow"] = True
+        attrs["_cow_owned"] = set()
+
+        # The snapshot is not tracked
+        for name in _track_attr_names:
+            attrs.pop(name, None)
+
+        self.__dict__["_cow"] = True
+        self.__dict__["_cow_owned"] = set()
+
+        if self._lazy:
+            self.__dict__["_lazy_convs"] = {}
+            attrs["_lazy_convs"] = {}
+        # end if
+
+        is_exc_key = type(self).is_exc_key____
+
+        for name in list(self.__dict__):
+            if is_exc_key(name) or (name not in self):
+                continue
+
+            val = _dict_getitem(self, name)
+
+            if isinstance(val, dict):
+                result._conv_nested(name, val)
+                self._conv_nested(name, val)
+            # end if
+        # end for
+
+        return result
+
+    def repr____(self):
+        """Finds a Python representation of self.
+
+        This makes eval(repr(self)) == self.
+
+        Returns:
+            result: the resulting Python representation
+        """
+        super_repr = super().__repr__()
+        result = f"DotDict(**{super_repr})"
+        return result
+
+    def str____(self, max_depth=None, max_items=None, max_chars=None):
+        """Finds a string representation of self.
+
+        See the write_str____ method for the truncation args.
+
+        Args:
+            max_depth: the max depth of the DotDicts to write in full, or None for no limit
+            max_items: the max number of the items to write per DotDict or per nested container, or None for no limit
+            max_chars: the max number of the characters to write, or None for no limit
+
+        Returns:
+            result: the resulting string representation
+        """
+        # Without a character limit, the segments are joined at once, which is faster than a stream
+        if max_chars is None and max_items is None:
+            result = "".join(self._iter_str(max_depth, None, repr))
+            return result
+        # end if
+
+        stream = _StringIO()
+        self.write_str____(stream, max_depth=max_depth, max_items=max_items, max_chars=max_chars)
+        result = stream.getvalue()
+        return result
+
+    def write_str____(self, stream, max_depth=None, max_items=None, max_chars=None):
+        """Writes the string representation of self to a stream, chunk by chunk.
+
+        The nested DotDicts are written in the ".{key: val}" form, and the other values in their Python
+            representations. The nested DotDicts are walked with an explicit stack, and the chunks are buffered and
+            written to the stream in batches, so the whole string is never built in memory.
+
+        The truncated parts are written as "...". A DotDict deeper than max_depth, where self is at depth 1, is written
+            as ".{...}", and so is a DotDict nested in itself. The items of a DotDict after the first max_items are
+            left out, and the containers in the other values are abbreviated with the reprlib module. The writing stops
+            at max_chars characters, including the "..." of the cut.
+
+        The values are read as they are stored, so writing a snapshot copies nothing, and writing a lazy DotDict
+            converts nothing. The unconverted dicts of a lazy DotDict are written like DotDicts.
+
+        Args:
+            stream: a writable text file object
+            max_depth: the max depth of the DotDicts to write in full, or None for no limit
+            max_items: the max number of the items to write per DotDict or per nested container, or None for no limit
+            max_chars: the max number of the characters to write, or None for no limit
+
+        Returns:
+            result: the number of the characters written
+        """
+        if max_items is None:
+            repr_val = repr
+        else:
+            short_repr = _Repr()
+            short_repr.maxlist = short_repr.maxtuple = short_repr.maxset = short_repr.maxfrozenset = max_items
+            short_repr.maxdict = short_repr.maxdeque = short_repr.maxarray = max_items
+            short_repr.maxstring = short_repr.maxlong = short_repr.maxother = _sys_maxsize
+            repr_val = short_repr.repr
+        # end if
+
+        chars_left = _sys_maxsize if max_chars is None else max_chars
+        segs = self._iter_str(max_depth, max_items, repr_val)
+        buf = []
+        buf_size = 0
+        result = 0
+
+        for seg in segs:
+            # Near the limit, look ahead for whether the rest fits in full, or needs a cut with room for the "..."
+            if len(seg) > chars_left - 3:
+                tail = [seg]
+                tail_size = len(seg)
+
+                while tail_size <= chars_left:
+                    seg = next(segs, None)
 
-            result[key] = val
+                    if seg is None:
+                        break
+
+                    tail.append(seg)
+                    tail_size += len(seg)
+                # end while
+
+                tail = "".join(tail)
+
+                if tail_size > chars_left:
+                    tail = tail[:max(chars_left - 3, 0)] + "..."[:chars_left]
+
+                buf.append(tail)
+                buf_size += len(tail)
+                break
+            # end if
+
+            buf.append(seg)
+            buf_size += len(seg)
+            chars_left -= len(seg)
+
+            if buf_size >= _stream_buf_size:
+                stream.write("".join(buf))
+                result += buf_size
+                buf.clear()
+                buf_size = 0
+            # end if
         # end for
 
+        if buf_size > 0:
+            stream.write("".join(buf))
+            result += buf_size
+        # end if
+
         return result
+
+    def _iter_str(self, max_depth, max_items, repr_val):
+        """Iterates over the segments of the string representation of self, in order.
+
+        See the write_str____ method.
+
+        Args:
+            max_depth: the max depth of the DotDicts to write in full, or None for no limit
+            max_items: the max number of the items to write per DotDict, or None for no limit
+            repr_val: the function that finds the Python representation of a value
+
+        Yields:
+            seg: a segment
+        """
+        is_exc_key = DotDict.is_exc_key____
+        lazy_convs = self._lazy_convs or {}
+        path_ids = {id(self)}
+        # Each entry has a node, its key iterator, and whether it is in a lazy DotDict tree
+        stack = [(self, iter(self), self._lazy)]
+        # The numbers of the items written, one per node in the stack
+        counts = [0]
+        yield ".{"
+
+        while len(stack) > 0:
+            node, keys, lazy = stack[-1]
+            descended = False
+
+            for key in keys:
+                val = _dict_getitem(node, key)
+                # An unconverted dict of a lazy DotDict is written like the DotDict it converts to, or as its DotDict
+                # if it is converted already
+                val_is_node = isinstance(val, DotDict) or (lazy and isinstance(val, dict))
+
+                if val_is_node and lazy and not isinstance(val, DotDict):
+                    val = lazy_convs.get(id(val), (None, val))[1]
+
+                if lazy and not isinstance(node, DotDict) and is_exc_key(str(key)):
+                    continue
+
+                count = counts[-1]
+                sep = ", " if count > 0 else ""
+
+                if max_items is not None and count >= max_items:
+                    yield f"{sep}..."
+                    break
+                # end if
+
+                counts[-1] = count + 1
+
+                if not val_is_node:
+                    yield f"{sep}{key}: {repr_val(val)}"
+                elif id(val) in path_ids or (max_depth is not None and len(stack) >= max_depth and len(val) > 0):
+                    yield f"{sep}{key}: .{{...}}"
+                else:
+                    yield f"{sep}{key}: .{{"
+                    path_ids.add(id(val))
+                    stack.append((val, iter(val), lazy or (isinstance(val, DotDict) and val._lazy)))
+                    counts.append(0)
+                    descended = True
+                    break
+                # end if
+            # end for
+
+            if not descended:
+                yield "}"
+                stack.pop()
+                counts.pop()
+                path_ids.discard(id(node))
+            # end if
+        # end while
+
+    def to_dict____(self):
+        """Finds a Python built-in dict version of self.
+
+        This method converts all DotDict values to their corresponding Python built-in dict values recursively.
+
+        The DotDict values are converted with an explicit stack instead of recursive calls, so the nesting depth is not
+            limited by the Python recursion limit. A DotDict referenced multiple times is converted once, and all its
+            references share the resulting dict.
+
+        Returns:
+            result: the result dict
+        """
+        result = {}
+        convs = {id(self): result}
+        stack = [(self, result)]
+
+        while len(stack) > 0:
+            src, dest = stack.pop()
+
+            for key in src:
+                val = _dict_getitem(src, key)
+
+                if src._lazy and (not isinstance(val, DotDict)) and isinstance(val, dict):
+                    val = src.get_item____(key)
+
+                if isinstance(val, DotDict):
+                    conv = convs.get(id(val))
+
+                    if conv is None:
+                        conv = {}
+                        convs[id(val)] = conv
+                        stack.append((val, conv))
+                    # end if
+
+                    val = conv
+                # end if
+
+                dest[key] = val
+            # end for
+        # end while
+
+        return result
+
+
+class FrozenDotDict(DotDict):
+    """Frozen dot dictionary.
+
+    A DotDict that rejects mutations after its initialization, and is hashable.
+
+    During the initialization, the nested values are frozen recursively: the dicts (including DotDicts) are converted
+        to FrozenDotDicts, the lists and tuples to tuples, and the sets to frozensets.
+
+    The structural hash is computed on the first hash() call, and cached. An equality check against another
+        FrozenDotDict returns False right away if both hashes are cached and they do not match.
+
+    Mutations raise TypeError.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    _frozen = False
+    """Whether self is frozen."""
+
+    @classmethod
+    def from_dict____(cls, dict_, lazy=False):
+        """Builds and returns a FrozenDotDict from a Python built-in dict or Mapping.
+
+        Args:
+            dict_: a dict or Mapping
+            lazy: ignored, since freezing converts all the nested values
+
+        Returns:
+            result: the resulting FrozenDotDict
+        """
+        result = cls(DotDict.from_dict____(dict_))
+        return result
+
+    def _check_mut(self):
+        """Checks if self accepts mutations.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        if self._frozen:
+            raise TypeError(f"{type(self).__name__} does not support mutations")
+
+    def _freeze(self):
+        """Freezes the nested values of self and then self."""
+        convs = {id(self): self}
+        stack = [self]
+
+        while len(stack) > 0:
+            node = stack.pop()
+
+            for key in node:
+                val = _dict_getitem(node, key)
+                frozen_val = _freeze_val(val, convs, stack)
+
+                if frozen_val is not val:
+                    _dict_setitem(node, key, frozen_val)
+
+                    if key in node.__dict__:
+                        node.__dict__[key] = frozen_val
+                # end if
+            # end for
+
+            node.__dict__["_frozen"] = True
+        # end while
+
+    # Magic functions
+
+    def __init__(self, *args, **kwargs):
+        """Inits self with the given args and kwargs, and then freezes self.
+
+        Args:
+            *args: the variable arguments
+            **kwargs: the keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self._freeze()
+
+    def __hash__(self):
+        """Finds the structural hash of self.
+
+        Returns:
+            result: the hash
+        """
+        result = self.__dict__.get("_hash")
+
+        if result is None:
+            result = hash(frozenset(self.items()))
+            self.__dict__["_hash"] = result
+        # end if
+
+        return result
+
+    def __eq__(self, other):
+        """Finds if self equals other.
+
+        Args:
+            other: the other object
+
+        Returns:
+            result: the equality
+        """
+        if self is other:
+            return True
+
+        if isinstance(other, FrozenDotDict):
+            self_hash = self.__dict__.get("_hash")
+            other_hash = other.__dict__.get("_hash")
+
+            if self_hash is not None and other_hash is not None and self_hash != other_hash:
+                return False
+        # end if
+
+        result = super().__eq__(other)
+        return result
+
+    def __ne__(self, other):
+        """Finds if self does not equal other.
+
+        Args:
+            other: the other object
+
+        Returns:
+            result: the inequality
+        """
+        result = self.__eq__(other)
+
+        if result is not NotImplemented:
+            result = not result
+
+        return result
+
+    def __reduce_ex__(self, protocol):
+        """Finds the pickling recipe of self.
+
+        The cached hash is left out, since the str hashes vary between processes.
+
+        Args:
+            protocol: the pickle protocol
+
+        Returns:
+            result: a tuple of the constructor, the constructor args, and the state
+        """
+        result = super().__reduce_ex__(protocol)
+        attrs = result[2][1]
+        attrs.pop("_hash", None)
+        return result
+
+    def __ior__(self, other):
+        """Rejects the in-place union.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().__ior__(other)
+
+    # End of magic functions
+    # Dict functions
+
+    def clear(self):
+        """Rejects the clearing.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        super().clear()
+
+    def pop(self, *args):
+        """Rejects the popping.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().pop(*args)
+
+    def popitem(self):
+        """Rejects the item popping.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().popitem()
+
+    def setdefault(self, *args):
+        """Rejects the default setting.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().setdefault(*args)
+
+    def update(self, *args, **kwargs):
+        """Rejects the updating.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        super().update(*args, **kwargs)
+
+    # End of dict functions
+    # Attribute and item functions
+
+    def set_attr____(self, name, val):
+        """Rejects the attribute setting once frozen. See DotDict.set_attr____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().set_attr____(name, val)
+
+    def del_attr____(self, name):
+        """Rejects the attribute deletion once frozen. See DotDict.del_attr____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().del_attr____(name)
+
+    def set_class_attr____(self, name, val):
+        """Rejects the class-level attribute setting once frozen. See DotDict.set_class_attr____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().set_class_attr____(name, val)
+
+    def del_class_attr____(self, name):
+        """Rejects the class-level attribute deletion once frozen. See DotDict.del_class_attr____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().del_class_attr____(name)
+
+    def _set_items(self, pairs):
+        """Rejects the bulk item setting once frozen. See DotDict._set_items.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        super()._set_items(pairs)
+
+    def set_item____(self, key, val):
+        """Rejects the item setting once frozen. See DotDict.set_item____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().set_item____(key, val)
+
+    def del_item____(self, key):
+        """Rejects the item deletion once frozen. See DotDict.del_item____.
+
+        Raises:
+            TypeError: if self is frozen
+        """
+        self._check_mut()
+        return super().del_item____(key)
+
+    # End of attribute and item functions
+
+    def snapshot____(self):
+        """Finds a snapshot of self.
+
+        Since self is frozen, this is self itself.
+
+        Returns:
+            result: self
+        """
+        result = self
+        return result
+
+    def repr____(self):
+        """Finds a Python representation of self.
+
+        This makes eval(repr(self)) == self.
+
+        Returns:
+            result: the resulting Python representation
+        """
+        super_repr = dict.__repr__(self)
+        result = f"FrozenDotDict(**{super_repr})"
+        return result
+
+
+class DotRecord(_Mapping):
+    """Dot record, a compact fixed-field Mapping for large populations of same-shape DotDicts.
+
+    A record stores its values in __slots__, so it has no per-record hash table or __dict__. The field index is
+        shared by all the records of a class. The fields can be accessed with both the "record.key" and the
+        "record[key]" syntaxes, but not added or deleted.
+
+    Use the DotDict record_class____ method to find the record class of a DotDict subclass with declared fields.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    __slots__ = ()
+
+    _fields = ()
+    """The field names, in order."""
+
+    _field_index = {}
+    """The field positions, keyed by the field names."""
+
+    _defaults = ()
+    """The field default values, in order."""
+
+    _dict_fields = ()
+    """The names of the fields whose default values are Python built-in dicts, to convert for each record."""
+
+    _dotdict_class = DotDict
+    """The DotDict class of the records."""
+
+    _setters = ()
+    """The slot setters of the fields, in order."""
+
+    _template = None
+    """The class-level default template of the DotDict class, from which the fields and the defaults are found."""
+
+    @classmethod
+    def from_values____(cls, values):
+        """Builds and returns a record from the field values, in the field order, without any conversions.
+
+        This is the fast path for building many records.
+
+        Args:
+            values: an iterable of the field values
+
+        Returns:
+            result: the record
+
+        Raises:
+            ValueError: if the number of the values does not match the number of the fields
+        """
+        values = tuple(values)
+
+        if len(values) != len(cls._fields):
+            raise ValueError(f"{cls.__name__} takes {len(cls._fields)} values, but got {len(values)}")
+
+        result = cls.__new__(cls)
+
+        for setter, val in zip(cls._setters, values):
+            setter(result, val)
+
+        return result
+
+    def __init__(self, map_=None, **kwargs):
+        """Inits self with the field defaults, then with the given mapping, and then with the given keyword arguments.
+
+        Args:
+            map_: a dict or Mapping, or an iterable of key-value pairs
+            **kwargs: the keyword arguments
+
+        Raises:
+            KeyError: if a key is not a field name
+        """
+        self_type = type(self)
+        field_index = self_type._field_index
+        values = list(self_type._defaults)
+
+        for name in self_type._dict_fields:
+            index = field_index[name]
+            values[index] = DotDict.from_dict____(values[index])
+        # end for
+
+        pairs_list = [kwargs.items()]
+
+        if map_ is not None:
+            pairs_list.insert(0, map_.items() if isinstance(map_, _Mapping) else map_)
+
+        # Find all the values first, so that each field is set once
+        for pairs in pairs_list:
+            for key, val in pairs:
+                index = field_index.get(key)
+
+                if index is None:
+                    index = field_index.get(str(key))
+
+                    if index is None:
+                        raise KeyError(f"{self_type.__name__} has no field called: {key}")
+                # end if
+
+                if (not isinstance(val, DotDict)) and isinstance(val, dict):
+                    val = DotDict.from_dict____(val)
+
+                values[index] = val
+            # end for
+        # end for
+
+        for setter, val in zip(self_type._setters, values):
+            setter(self, val)
+
+    def __getitem__(self, key):
+        """Gets a field value with the given key.
+
+        Args:
+            key: a field name
+
+        Returns:
+            result: the field value
+
+        Raises:
+            KeyError: if the key is not a field name
+        """
+        # Check the str keys first, so that the common cases skip the conversion
+        if key in self._field_index:
+            return getattr(self, key)
+
+        key = str(key)
+
+        if key not in self._field_index:
+            raise KeyError(f"{type(self).__name__} has no field called: {key}")
+
+        result = getattr(self, key)
+        return result
+
+    def __setitem__(self, key, val):
+        """Sets a field value with the given key.
+
+        As in a DotDict, a Python built-in dict value is converted to a DotDict.
+
+        Args:
+            key: a field name
+            val: a field value
+
+        Raises:
+            KeyError: if the key is not a field name
+        """
+        key = str(key)
+
+        if key not in self._field_index:
+            raise KeyError(f"{type(self).__name__} has no field called: {key}")
+
+        if (not isinstance(val, DotDict)) and isinstance(val, dict):
+            val = DotDict.from_dict____(val)
+
+        object.__setattr__(self, key, val)
+
+    def __setattr__(self, name, val):
+        """Sets a field value with the given name.
+
+        As in a DotDict, a Python built-in dict value is converted to a DotDict.
+
+        Args:
+            name: a field name
+            val: a field value
+
+        Raises:
+            AttributeError: if the name is not a field name
+        """
+        if (not isinstance(val, DotDict)) and isinstance(val, dict):
+            val = DotDict.from_dict____(val)
+
+        object.__setattr__(self, name, val)
+
+    def __delattr__(self, name):
+        """Rejects the field deletions.
+
+        Args:
+            name: an attribute name
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError(f"{type(self).__name__} does not support field deletions")
+
+    def __iter__(self):
+        """Iterates over the field names.
+
+        Returns:
+            _: the field name iterator
+        """
+        return iter(self._fields)
+
+    def __len__(self):
+        """Finds the number of the fields.
+
+        Returns:
+            _: the number of the fields
+        """
+        return len(self._fields)
+
+    def __contains__(self, key):
+        """Finds if a key is a field name.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: whether the key is a field name
+        """
+        return key in self._field_index
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        result = f"{type(self).__name__}(**{dict(self.items())!r})"
+        return result
+
+    def __reduce__(self):
+        """Finds the pickling recipe of self.
+
+        The record class is rebuilt from its DotDict class on the unpickling, since it is not a module-level name.
+
+        Returns:
+            result: a tuple of the constructor and the constructor args
+        """
+        values = tuple(object.__getattribute__(self, name) for name in self._fields)
+        result = (_record_from_values, (self._dotdict_class, values))
+        return result
+
+    def to_dotdict____(self):
+        """Finds a DotDict version of self, as an instance of the DotDict class of self.
+
+        Returns:
+            result: the DotDict
+        """
+        result = self._dotdict_class()
+        result._set_items(self.items())
+        return result
+
+    def to_dict____(self):
+        """Finds a Python built-in dict version of self.
+
+        Returns:
+            result: the dict
+        """
+        result = self.to_dotdict____().to_dict____()
+        return result
+
+
+@_lru_cache(maxsize=4096)
+def _compile_path(path):
+    """Compiles a dotted path string into a tuple of steps.
+
+    Args:
+        path: a dotted path string, like "model.encoder.layers[3].dropout"
+
+    Returns:
+        result: the tuple of steps, each a str key or an int index
+
+    Raises:
+        ValueError: if the path string is malformed
+    """
+    steps = []
+    pos = 0
+    # Whether a name can start at pos, which is at the path start or after a dot
+    name_ok = True
+
+    while pos < len(path):
+        match = _path_step_regex.match(path, pos)
+
+        if match is None:
+            raise ValueError(f"Malformed path at position {pos}: {path}")
+
+        name, index, dot = match.groups()
+
+        if name is not None and name_ok:
+            steps.append(name)
+            name_ok = False
+        elif index is not None and len(steps) > 0 and not name_ok:
+            steps.append(int(index))
+        elif dot is not None and not name_ok:
+            name_ok = True
+        else:
+            raise ValueError(f"Malformed path at position {pos}: {path}")
+        # end if
+
+        pos = match.end()
+    # end while
+
+    if name_ok and len(steps) > 0:
+        raise ValueError(f"Malformed path with a trailing dot: {path}")
+
+    result = tuple(steps)
+    return result
+
+
+def _getattr_via_api(self, name):
+    """Gets an attribute with the given name, through the get_attr____ method.
+
+    This is the __getattr__ method of the DotDict subclasses that override the get_attr____ method.
+
+    Args:
+        name: an attribute name
+
+    Returns:
+        _: the attribute value
+    """
+    return self.get_attr____(name)
+
+
+def _clear_class_caches(cls):
+    """Clears the cached dir(cls) name sets and default templates of a DotDict class and its subclasses.
+
+    The record classes are kept, and refreshed by the DotDict record_class____ method, so the existing records stay
+        their instances.
+
+    Args:
+        cls: the DotDict class
+    """
+    for cache in (_dir_names, _class_defaults):
+        for key in [key for key in cache if issubclass(key, cls)]:
+            del cache[key]
+    # end for
+
+
+def _conv_dict(dict_, convs):
+    """Converts a Python built-in dict or Mapping to a DotDict, with a conversion memo.
+
+    See the DotDict from_dict____ method.
+
+    Args:
+        dict_: a dict or Mapping
+        convs: the conversion memo, which maps the id of each converted dict to its DotDict, and is updated in place
+
+    Returns:
+        result: the resulting DotDict
+    """
+    result = convs.get(id(dict_))
+
+    if result is not None:
+        return result
+
+    result = DotDict()
+    is_exc_key = DotDict.is_exc_key____
+    dir_names = DotDict.dir_names____()
+    convs[id(dict_)] = result
+    stack = [(dict_, result)]
+
+    while len(stack) > 0:
+        src, dest = stack.pop()
+
+        for key in src:
+            name = str(key)
+
+            # Protect the exceptional keys, as the set_attr____ method does
+            if is_exc_key(name):
+                continue
+
+            val = src[key]
+
+            if (not isinstance(val, DotDict)) and isinstance(val, dict):
+                conv = convs.get(id(val))
+
+                if conv is None:
+                    conv = DotDict()
+                    convs[id(val)] = conv
+                    stack.append((val, conv))
+                # end if
+
+                val = conv
+            # end if
+
+            if name in dir_names:
+                dest.__dict__[name] = val
+
+            _dict_setitem(dest, name, val)
+        # end for
+    # end while
+
+    return result
+
+
+def _lazy_from_dict(dict_, convs):
+    """Converts a Python built-in dict or Mapping to a lazy DotDict, with a shared lazy conversion memo.
+
+    The memo keeps each converted dict alive, so its id is not reused by another dict while the memo is in use.
+
+    Args:
+        dict_: a dict or Mapping
+        convs: the lazy conversion memo, which maps the id of each converted dict to a tuple of the dict and its
+            DotDict, and is updated in place
+
+    Returns:
+        result: the resulting lazy DotDict
+    """
+    result = DotDict()
+    result.__dict__["_lazy"] = True
+    result.__dict__["_lazy_convs"] = convs
+    convs[id(dict_)] = (dict_, result)
+
+    for key in dict_:
+        result.set_attr____(key, dict_[key])
+
+    return result
+
+
+def _freeze_val(val, convs, stack):
+    """Freezes a value for a FrozenDotDict.
+
+    Args:
+        val: the value
+        convs: the converted FrozenDotDicts, keyed by the ids of the original dicts
+        stack: the stack of the FrozenDotDicts whose nested values are not frozen yet
+
+    Returns:
+        result: the frozen value
+    """
+    if isinstance(val, FrozenDotDict):
+        result = val
+    elif isinstance(val, dict):
+        result = convs.get(id(val))
+
+        if result is None:
+            src = val
+
+            # Convert only the top level, and leave the nested dicts to the stack, so they share this memo
+            if not isinstance(src, DotDict):
+                src = DotDict.from_pairs____(src.items())
+
+            result = _dict_new(FrozenDotDict)
+            _dict_setitem_all(result, src)
+            convs[id(val)] = result
+            stack.append(result)
+        # end if
+    elif isinstance(val, (list, tuple)):
+        result = tuple(_freeze_val(elem, convs, stack) for elem in val)
+    elif isinstance(val, (set, frozenset)):
+        result = frozenset(_freeze_val(elem, convs, stack) for elem in val)
+    else:
+        result = val
+    # end if
+
+    return result
+
+
+def _track_attach(parent, key, val):
+    """Links a DotDict value and its nested DotDicts to the change tracking of a parent DotDict.
+
+    Args:
+        parent: the parent DotDict
+        key: the item key of the value in the parent
+        val: the value
+    """
+    stack = [(parent, key, val)]
+    seen = set()
+
+    while len(stack) > 0:
+        parent, key, val = stack.pop()
+
+        if (not isinstance(val, DotDict)) or isinstance(val, FrozenDotDict) or id(val) in seen:
+            continue
+
+        seen.add(id(val))
+        attrs = val.__dict__
+
+        # A linked subtree is already linked all the way down
+        if attrs.get("_track_parent") is parent and attrs.get("_track_key") == key:
+            continue
+
+        attrs["_track"] = True
+        attrs["_track_parent"] = parent
+        attrs["_track_key"] = key
+        attrs.pop("_track_log", None)
+
+        for child_key, child in dict.items(val):
+            if isinstance(child, DotDict):
+                stack.append((val, child_key, child))
+        # end for
+    # end while
+
+
+def _track_detach(parent, val):
+    """Unlinks a DotDict value from the change tracking of a parent DotDict, if it is linked there.
+
+    Args:
+        parent: the parent DotDict
+        val: the value
+    """
+    if isinstance(val, DotDict) and val.__dict__.get("_track_parent") is parent:
+        attrs = val.__dict__
+
+        for name in _track_attr_names:
+            attrs.pop(name, None)
+    # end if
+
+
+def _record_from_values(dotdict_class, values):
+    """Builds a record of the record class of a DotDict class from the field values, for the unpickling.
+
+    Args:
+        dotdict_class: the DotDict class
+        values: the field values, in the field order
+
+    Returns:
+        result: the record
+    """
+    result = dotdict_class.record_class____().from_values____(values)
+    return result
@@ -0,0 +1,606 @@
+"""Dot index."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import bisect
+
+from lyc_pyutils.libs import dotdict
+
+_bisect_left = bisect.bisect_left
+_DotDict = dotdict.DotDict
+_inf = float("inf")
+_missing = object()
+
+_chunk_size = 512
+"""The max number of the pairs per chunk of a sorted index, before the chunk is split."""
+
+
+class _SortedPairs:
+    """A sorted list of (value, handle) pairs, stored in chunks.
+
+    An insertion or a deletion moves the pairs of one chunk only, instead of the whole list. The chunks are found by
+        the bisection of their last pairs.
+    """
+
+    def __init__(self, pairs=()):
+        """Inits self with the given pairs.
+
+        Args:
+            pairs: an iterable of the pairs
+        """
+        pairs = sorted(pairs)
+
+        self._chunks = [pairs[start: start + _chunk_size] for start in range(0, len(pairs), _chunk_size)]
+        """The chunks, each a sorted list of the pairs."""
+
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        """The last pairs of the chunks."""
+
+    def __len__(self):
+        """Finds the number of the pairs.
+
+        Returns:
+            _: the number of the pairs
+        """
+        return sum(map(len, self._chunks))
+
+    def insert(self, pair):
+        """Inserts a pair.
+
+        Args:
+            pair: the pair
+        """
+        chunks = self._chunks
+        maxes = self._maxes
+
+        if len(chunks) <= 0:
+            chunks.append([pair])
+            maxes.append(pair)
+            return
+        # end if
+
+        # A pair after all the chunks goes to the last chunk
+        index = min(_bisect_left(maxes, pair), len(chunks) - 1)
+        chunk = chunks[index]
+        chunk.insert(_bisect_left(chunk, pair), pair)
+        maxes[index] = chunk[-1]
+
+        if len(chunk) > _chunk_size:
+            half = len(chunk) // 2
+            chunks[index: index + 1] = [chunk[:half], chunk[half:]]
+            maxes[index: index + 1] = [chunk[half - 1], chunk[-1]]
+        # end if
+
+    def check(self, pair):
+        """Checks if a pair is comparable with the pairs in self, by finding its insertion position.
+
+        Args:
+            pair: the pair
+
+        Raises:
+            TypeError: if the pair is not comparable with the pairs in self
+        """
+        chunks = self._chunks
+        maxes = self._maxes
+
+        if len(chunks) <= 0:
+            return
+
+        index = min(_bisect_left(maxes, pair), len(chunks) - 1)
+        _bisect_left(chunks[index], pair)
+
+    def find(self, pair):
+        """Finds the place of a pair.
+
+        Args:
+            pair: the pair
+
+        Returns:
+            result: a tuple of the chunk index and the position in the chunk
+
+        Raises:
+            ValueError: if there is no such a pair
+        """
+        chunks = self._chunks
+        index = _bisect_left(self._maxes, pair)
+
+        if index < len(chunks):
+            chunk = chunks[index]
+            pos = _bisect_left(chunk, pair)
+
+            if pos < len(chunk) and chunk[pos][1] == pair[1]:
+                result = (index, pos)
+                return result
+            # end if
+        # end if
+
+        raise ValueError(f"No such a pair: {pair}")
+
+    def delete(self, place):
+        """Deletes the pair at a place.
+
+        Args:
+            place: the place, from the find method
+        """
+        chunks = self._chunks
+        maxes = self._maxes
+        index, pos = place
+        chunk = chunks[index]
+        del chunk[pos]
+
+        if len(chunk) > 0:
+            maxes[index] = chunk[-1]
+        else:
+            del chunks[index]
+            del maxes[index]
+        # end if
+
+    def between(self, low, high):
+        """Finds the pairs in a range, in order.
+
+        Args:
+            low: the pair-comparable lower bound, included, or None for no lower bound
+            high: the pair-comparable upper bound, excluded, or None for no upper bound
+
+        Returns:
+            result: the list of the pairs
+        """
+        chunks = self._chunks
+        maxes = self._maxes
+
+        if low is None:
+            start_index, start_pos = 0, 0
+        else:
+            start_index = _bisect_left(maxes, low)
+            start_pos = _bisect_left(chunks[start_index], low) if start_index < len(chunks) else 0
+        # end if
+
+        if high is None:
+            stop_index, stop_pos = len(chunks), 0
+        else:
+            stop_index = _bisect_left(maxes, high)
+            stop_pos = _bisect_left(chunks[stop_index], high) if stop_index < len(chunks) else 0
+        # end if
+
+        if start_index > stop_index or (start_index == stop_index and start_pos >= stop_pos):
+            return []
+
+        if start_index == stop_index:
+            return chunks[start_index][start_pos: stop_pos]
+
+        result = chunks[start_index][start_pos:]
+
+        for chunk in chunks[start_index + 1: stop_index]:
+            result.extend(chunk)
+
+        if stop_index < len(chunks):
+            result.extend(chunks[stop_index][:stop_pos])
+
+        return result
+
+
+class DotIndex:
+    """Dot index.
+
+    An indexed collection of DotDict records, with hash indexes and sorted indexes on the chosen fields.
+
+    A hash index maps each field value to its records, for the equality lookups in O(1). A sorted index keeps the
+        (value, handle) pairs of a field in order, for the range lookups in O(log n) plus the number of the results.
+        Both are updated incrementally when the records are added, removed, or updated through self. A record without
+        the field is left out of the index of the field.
+
+    A record whose sort-indexed field is None is left out of the sorted index of the field too, like a record without
+        the field. The other values of a sorted index must be comparable with one another, and the values of a hash
+        index must be hashable. A record with a value that breaks these rules is rejected with TypeError, before any
+        change to self.
+
+    NOTE: Change the indexed fields of a record with the update____ method. The indexes do not see the changes made to
+        a record in any other way. Such a record is still removed or updated correctly, since self keeps the values
+        that it indexed for each record.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    def __init__(self, records=(), hash_fields=(), sorted_fields=()):
+        """Inits self with the given records and indexed fields.
+
+        Args:
+            records: an iterable of the records, each a dict (including DotDict)
+            hash_fields: an iterable of the field names to hash-index
+            sorted_fields: an iterable of the field names to sort-index
+        """
+        self._records = {}
+        """The records, keyed by their handles, in the insertion order."""
+
+        self._handles = {}
+        """The record handles, keyed by the record ids."""
+
+        self._next_handle = 0
+        """The handle of the next record."""
+
+        self._hash_indexes = {}
+        """The hash indexes, keyed by the field names. Each maps a value to a dict of the handles, in order."""
+
+        self._sorted_indexes = {}
+        """The sorted indexes, keyed by the field names. Each keeps the (value, handle) pairs in order."""
+
+        self._entries = {}
+        """The index entries of the records, keyed by their handles. Each is a list of the entries, like from the
+            _index_entries method."""
+
+        for record in records:
+            self.add____(record)
+
+        # Build the indexes after adding the records, in bulk
+        for field in hash_fields:
+            self.add_index____(field)
+
+        for field in sorted_fields:
+            self.add_index____(field, sort=True)
+
+    def _index_entries(self, handle, get_val):
+        """Finds the index entries of a record, and checks them before any index is changed.
+
+        Args:
+            handle: the record handle
+            get_val: a function of a field name and a default value, which gives the field value of the record
+
+        Returns:
+            result: the list of the entries, each a tuple of whether the index is sorted, the index, and the value
+
+        Raises:
+            TypeError: if a hash-indexed value is not hashable, or a sort-indexed value is not comparable with the
+                other values of its index
+        """
+        result = []
+
+        for field, index in self._hash_indexes.items():
+            val = get_val(field, _missing)
+
+            if val is not _missing:
+                try:
+                    hash(val)
+                except TypeError:
+                    raise TypeError(f"Cannot hash-index an unhashable value of the field {field}: {val!r}")
+                # end try
+
+                result.append((False, index, val))
+            # end if
+        # end for
+
+        for field, index in self._sorted_indexes.items():
+            val = get_val(field, _missing)
+
+            if val is not _missing and val is not None:
+                try:
+                    index.check((val, handle))
+                except TypeError:
+                    raise TypeError(f"Cannot sort-index an incomparable value of the field {field}: {val!r}")
+                # end try
+
+                result.append((True, index, val))
+            # end if
+        # end for
+
+        return result
+
+    def _index(self, handle, entries):
+        """Adds a record to all the indexes, and keeps its index entries.
+
+        Args:
+            handle: the record handle
+            entries: the index entries of the record, from the _index_entries method
+        """
+        for sort, index, val in entries:
+            if sort:
+                index.insert((val, handle))
+            else:
+                index.setdefault(val, {})[handle] = None
+            # end if
+        # end for
+
+        self._entries[handle] = entries
+
+    def _unindex(self, handle):
+        """Removes a record from all the indexes, with the values that they indexed.
+
+        All the entries are found before any index is changed, so a failure leaves the indexes as they are.
+
+        Args:
+            handle: the record handle
+
+        Raises:
+            ValueError: if an entry is not in its index, like when an indexed value is mutated in place
+        """
+        entries = self._entries[handle]
+        places = []
+
+        for sort, index, val in entries:
+            if sort:
+                places.append(index.find((val, handle)))
+                continue
+            # end if
+
+            handles = index.get(val)
+
+            if handles is None or handle not in handles:
+                raise ValueError(f"No such a hash index entry: {val!r}")
+
+            places.append(handles)
+        # end for
+
+        for (sort, index, val), place in zip(entries, places):
+            if sort:
+                index.delete(place)
+                continue
+            # end if
+
+            del place[handle]
+
+            if len(place) <= 0:
+                del index[val]
+        # end for
+
+        del self._entries[handle]
+
+    def __len__(self):
+        """Finds the number of the records.
+
+        Returns:
+            _: the number of the records
+        """
+        return len(self._records)
+
+    def __iter__(self):
+        """Iterates over the records, in the insertion order.
+
+        Returns:
+            _: the record iterator
+        """
+        return iter(self._records.values())
+
+    def __contains__(self, record):
+        """Finds if a record is in self, by its identity.
+
+        Args:
+            record: a record
+
+        Returns:
+            _: whether the record is in self
+        """
+        return id(record) in self._handles
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        result = str(
+            f"DotIndex(records={list(self._records.values())!r}, "
+            f"hash_fields={tuple(self._hash_indexes)!r}, "
+            f"sorted_fields={tuple(self._sorted_indexes)!r})"
+        )
+
+        return result
+
+    def add_index____(self, field, sort=False):
+        """Adds an index on a field, and indexes the existing records.
+
+        Args:
+            field: the field name
+            sort: whether to add a sorted index, instead of a hash index
+
+        Raises:
+            TypeError: if the values of the field are not all hashable, or not all comparable with one another
+        """
+        field = str(field)
+        old_index = (self._sorted_indexes if sort else self._hash_indexes).get(field)
+
+        if sort:
+            pairs = []
+
+            for handle, record in self._records.items():
+                val = record.get(field, _missing)
+
+                if val is not _missing and val is not None:
+                    pairs.append((val, handle))
+            # end for
+
+            index = _SortedPairs(pairs)
+            self._sorted_indexes[field] = index
+            new_entries = [(handle, (True, index, val)) for val, handle in pairs]
+        else:
+            index = {}
+            new_entries = []
+
+            for handle, record in self._records.items():
+                val = record.get(field, _missing)
+
+                if val is not _missing:
+                    index.setdefault(val, {})[handle] = None
+                    new_entries.append((handle, (False, index, val)))
+                # end if
+            # end for
+
+            self._hash_indexes[field] = index
+        # end if
+
+        if old_index is not None:
+            for handle, entries in self._entries.items():
+                entries[:] = [entry for entry in entries if entry[1] is not old_index]
+        # end if
+
+        for handle, entry in new_entries:
+            self._entries[handle].append(entry)
+
+    def add____(self, record):
+        """Adds a record to self.
+
+        A Python built-in dict record is converted to a DotDict first.
+
+        Args:
+            record: the record, a dict (including DotDict)
+
+        Returns:
+            record: the added record
+
+        Raises:
+            ValueError: if the record is in self already
+            TypeError: if an indexed value of the record is not hashable or comparable, see the class docstring
+        """
+        if not isinstance(record, _DotDict):
+            record = _DotDict.from_dict____(record)
+
+        if id(record) in self._handles:
+            raise ValueError("Cannot add a record that is in the DotIndex already")
+
+        handle = self._next_handle
+        entries = self._index_entries(handle, record.get)
+        self._next_handle += 1
+
+        self._records[handle] = record
+        self._handles[id(record)] = handle
+        self._index(handle, entries)
+        return record
+
+    def remove____(self, record):
+        """Removes a record from self, by its identity.
+
+        Args:
+            record: the record
+
+        Raises:
+            KeyError: if the record is not in self
+            ValueError: if an index entry of the record is not found, see the _unindex method, in which case nothing
+                is changed
+        """
+        handle = self._handles.get(id(record))
+
+        if handle is None:
+            raise KeyError("Cannot remove a record that is not in the DotIndex")
+
+        self._unindex(handle)
+        del self._handles[id(record)]
+        del self._records[handle]
+
+    def update____(self, record, **changes):
+        """Updates the fields of a record in self, and its index entries.
+
+        The values are set with the record's set_item____ method.
+
+        Args:
+            record: the record
+            **changes: the field names and their new values
+
+        Raises:
+            KeyError: if the record is not in self
+            TypeError: if an indexed new value is not hashable or comparable, see the class docstring, in which case
+                nothing is changed
+            ValueError: if an index entry of the record is not found, see the _unindex method, in which case nothing
+                is changed
+        """
+        handle = self._handles.get(id(record))
+
+        if handle is None:
+            raise KeyError("Cannot update a record that is not in the DotIndex")
+
+        def get_val(field, default):
+            return changes[field] if field in changes else record.get(field, default)
+
+        entries = self._index_entries(handle, get_val)
+        old_entries = self._entries[handle]
+        self._unindex(handle)
+
+        try:
+            for field, val in changes.items():
+                record.set_item____(field, val)
+        except Exception:
+            # Keep the record indexed, with the values that it had before the update
+            self._index(handle, old_entries)
+            raise
+        # end try
+
+        self._index(handle, entries)
+
+    def find____(self, **conds):
+        """Finds the records whose fields equal the given values, in the insertion order.
+
+        The conditions on the hash-indexed fields are looked up in their indexes, starting with the one with the fewest
+            records. The other conditions are checked on the found records only. Without any hash-indexed condition,
+            all the records are checked.
+
+        Args:
+            **conds: the field names and their values
+
+        Returns:
+            result: the list of the records
+        """
+        indexed = [(field, val) for field, val in conds.items() if field in self._hash_indexes]
+        others = [(field, val) for field, val in conds.items() if field not in self._hash_indexes]
+
+        if len(indexed) > 0:
+            handle_dicts = [self._hash_indexes[field].get(val, {}) for field, val in indexed]
+            handle_dicts.sort(key=len)
+            handles = handle_dicts[0]
+
+            for other_handles in handle_dicts[1:]:
+                handles = [handle for handle in handles if handle in other_handles]
+
+            records = [self._records[handle] for handle in sorted(handles)]
+        else:
+            records = self._records.values()
+        # end if
+
+        result = [
+            record for record in records
+            if all(record.get(field, _missing) == val for field, val in others)
+        ]
+
+        return result
+
+    def range____(self, field, low=None, high=None, low_closed=True, high_closed=True, reverse=False):
+        """Finds the records whose field values are in a range, in the order of the values.
+
+        Args:
+            field: the name of a sort-indexed field
+            low: the lower bound, or None for no lower bound
+            high: the upper bound, or None for no upper bound
+            low_closed: whether the lower bound is included
+            high_closed: whether the upper bound is included
+            reverse: whether to give the records in the descending order of the values
+
+        Returns:
+            result: the list of the records
+
+        Raises:
+            KeyError: if the field is not sort-indexed
+        """
+        field = str(field)
+
+        if field not in self._sorted_indexes:
+            raise KeyError(f"DotIndex has no sorted index on the field: {field}")
+
+        index = self._sorted_indexes[field]
+
+        # The handles are ints, so that (val,) sorts before and (val, inf) sorts after all the (val, handle) pairs
+        if low is not None:
+            low = (low,) if low_closed else (low, _inf)
+
+        if high is not None:
+            high = (high, _inf) if high_closed else (high,)
+
+        pairs = index.between(low, high)
+
+        if reverse:
+            pairs.reverse()
+
+        result = [self._records[handle] for _, handle in pairs]
+        return result
@@ -0,0 +1,533 @@
+"""Dot mapped."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import json
+import mmap
+import os
+import re
+
+from collections import abc
+
+from lyc_pyutils.libs import dotdict
+
+_DotDict = dotdict.DotDict
+_getpid = os.getpid
+_jsondump = json.dump
+_jsonload = json.load
+_jsonloads = json.loads
+_Mapping = abc.Mapping
+_mmap = mmap.mmap
+_mmap_read = mmap.ACCESS_READ
+_re_compile = re.compile
+_remove = os.remove
+_replace = os.replace
+_stat = os.stat
+
+_ws_regex = _re_compile(rb"[ \t\n\r]*")
+"""The regex that matches the JSON whitespace."""
+
+_str_regex = _re_compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+"""The regex that matches a JSON string."""
+
+_scalar_regex = _re_compile(rb"[^,:\]}\s]+")
+"""The regex that matches a JSON number, true, false, or null."""
+
+_skip_nesting = 3
+"""The max nesting depth of the containers that the skip regex steps over in a single match."""
+
+
+def _make_skip_regex():
+    """Makes the skip regex.
+
+    The skip regex steps over the JSON text up to the next bracket that is not in a string and not in a container
+        nested at most _skip_nesting deep. The bracket is the last byte of the match. Each part of the regex starts
+        with a distinct byte, so the regex does not backtrack more than linearly.
+
+    Returns:
+        result: the compiled regex
+    """
+    plain = rb'[^"\[\]{}]*'
+    nested = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+    for _ in range(_skip_nesting):
+        container = rb"[\[{]" + plain + rb"(?:(?:" + nested + rb")" + plain + rb")*[\]}]"
+        nested = rb'"[^"\\]*(?:\\.[^"\\]*)*"|' + container
+    # end for
+
+    result = _re_compile(plain + rb"(?:(?:" + nested + rb")" + plain + rb")*[\[\]{}]")
+    return result
+
+
+_skip_regex = _make_skip_regex()
+"""The regex that steps over the JSON text up to the next bracket that is not stepped over."""
+
+# The JSON structural bytes
+
+_open_brace = b"{"[0]
+_open_bracket = b"["[0]
+_close_brace = b"}"[0]
+_quote = b'"'[0]
+_colon = b":"[0]
+_comma = b","[0]
+
+_index_suffix = ".index.json"
+"""The file name suffix of the sidecar index files."""
+
+_index_version = 1
+"""The version of the sidecar index format."""
+
+
+class MappedDotDict(_Mapping):
+    """Mapped dot dictionary.
+
+    A read-only DotDict-like view of a JSON file, backed by an mmap of the file. Only the bytes of the requested values
+        are parsed.
+
+    On the first opening, the file is scanned once for an offset index: the byte range of each value of each object,
+        down to a given depth. An indexed object is given as a MappedDotDict view. Any other value is parsed from its
+        byte range on each access, with the objects in it converted to DotDicts. The index can be cached to a sidecar
+        file next to the JSON file, for the instant reopening.
+
+    Mutations raise TypeError.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    __slots__ = ("_data", "_objects", "_entries")
+
+    @classmethod
+    def open____(cls, from_file, depth=2, cache=True):
+        """Opens a JSON file as the root view.
+
+        The sidecar index file is at the JSON file location plus ".index.json". It is used if it matches the size, the
+            modification time, and the depth of the JSON file, and is rebuilt otherwise. The rebuilt index is written
+            to a temporary file and then moved over the sidecar index file, so a crash never leaves a truncated
+            sidecar. If the sidecar cannot be written, like in a read-only directory, the file is opened without it.
+
+        Args:
+            from_file: the JSON file location
+            depth: the depth down to which the objects are indexed, where the root object is at depth 1
+            cache: whether to read and write the sidecar index file
+
+        Returns:
+            result: the root view
+
+        Raises:
+            ValueError: if the file is not a JSON object
+        """
+        from_file = str(from_file)
+        depth = int(depth)
+        index_file = from_file + _index_suffix
+
+        file = open(from_file, "rb")
+
+        try:
+            data = _mmap(file.fileno(), 0, access=_mmap_read)
+        except ValueError:
+            raise ValueError(f"Cannot open an empty file as a MappedDotDict: {from_file}")
+        finally:
+            file.close()
+        # end try
+
+        stat = _stat(from_file)
+        stamp = [_index_version, stat.st_size, stat.st_mtime_ns, depth]
+        objects = None
+
+        if cache:
+            try:
+                with open(index_file, "r") as index:
+                    cached = _jsonload(index)
+
+                if cached["stamp"] == stamp:
+                    objects = {offset: {key: (start, end) for key, start, end in entries}
+                               for offset, entries in cached["objects"]}
+                # end if
+            except (OSError, ValueError, KeyError, TypeError):
+                # A missing or broken sidecar index is rebuilt
+                objects = None
+            # end try
+        # end if
+
+        if objects is None:
+            objects = cls.build_index____(data, depth)
+
+            if cache:
+                cached = {
+                    "stamp": stamp,
+                    "objects": [
+                        [offset, [[key, start, end] for key, (start, end) in entries.items()]]
+                        for offset, entries in objects.items()
+                    ]
+                }
+
+                temp_file = f"{index_file}.{_getpid()}.tmp"
+
+                try:
+                    with open(temp_file, "w") as index:
+                        _jsondump(cached, index, separators=(",", ":"))
+
+                    _replace(temp_file, index_file)
+                except OSError:
+                    # The sidecar index is only an optimization
+                    try:
+                        _remove(temp_file)
+                    except OSError:
+                        pass
+                    # end try
+                # end try
+            # end if
+        # end if
+
+        root = _ws_regex.match(data, 0).end()
+
+        if root not in objects:
+            raise ValueError(f"Cannot open a non-object JSON file as a MappedDotDict: {from_file}")
+
+        result = _make_view(cls, data, objects, root)
+        return result
+
+    @staticmethod
+    def build_index____(data, depth=2):
+        """Scans the JSON bytes for the offset index of the objects, down to the given depth.
+
+        The indexed objects are walked key by key. The other values are skipped over with the regex matching of the
+            strings and the brackets only, without parsing them.
+
+        Args:
+            data: a bytes-like object of the JSON text, like an mmap
+            depth: the depth down to which the objects are indexed, where the root object is at depth 1
+
+        Returns:
+            result: the index, a dict that maps the offset of each indexed object to its entries, and each key of the
+                entries to the byte range of the value
+
+        Raises:
+            ValueError: if the JSON text is malformed
+        """
+        result = {}
+        pos = _ws_regex.match(data, 0).end()
+
+        if pos < len(data) and data[pos] == _open_brace and depth >= 1:
+            _index_object(data, pos, depth, result)
+
+        return result
+
+    def _val(self, start, end):
+        """Decodes a value.
+
+        Args:
+            start: the start offset of the value
+            end: the end offset of the value
+
+        Returns:
+            result: the value, a MappedDotDict view for an indexed object
+        """
+        objects = self._objects
+
+        if start in objects:
+            result = _make_view(type(self), self._data, objects, start)
+        else:
+            result = _jsonloads(self._data[start: end], object_pairs_hook=_DotDict.from_pairs____)
+
+        return result
+
+    # Magic functions
+
+    def __getitem__(self, key):
+        """Gets a value with the given key.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: the value
+
+        Raises:
+            KeyError: if there is no such a value
+        """
+        start, end = self._entries[str(key)]
+        return self._val(start, end)
+
+    def __getattr__(self, name):
+        """Gets a value with the given name.
+
+        Args:
+            name: a name
+
+        Returns:
+            _: the value
+
+        Raises:
+            AttributeError: if the name is exceptional, or there is no such a value
+        """
+        span = None if _DotDict.is_exc_key____(name) else self._entries.get(name)
+
+        if span is None:
+            raise AttributeError(f"MappedDotDict has no attribute or item called: {name}")
+
+        return self._val(span[0], span[1])
+
+    def __setattr__(self, name, val):
+        """Rejects the attribute setting.
+
+        Args:
+            name: a name
+            val: a value
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError("MappedDotDict does not support mutations")
+
+    def __delattr__(self, name):
+        """Rejects the attribute deletion.
+
+        Args:
+            name: a name
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError("MappedDotDict does not support mutations")
+
+    def __iter__(self):
+        """Iterates over the keys, in order.
+
+        Returns:
+            _: the key iterator
+        """
+        return iter(self._entries)
+
+    def __len__(self):
+        """Finds the number of the items.
+
+        Returns:
+            _: the number of the items
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Finds if self has an item with the given key.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: whether self has the item
+        """
+        return str(key) in self._entries
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        result = f"MappedDotDict(**{self.to_dict____()!r})"
+        return result
+
+    def __reduce__(self):
+        """Finds the pickling recipe of self, which is a DotDict copy.
+
+        Returns:
+            result: the pickling recipe
+        """
+        result = (_DotDict.from_dict____, (self.to_dict____(),))
+        return result
+
+    # Public functions
+
+    def get_path____(self, path):
+        """Gets a nested value with the given path.
+
+        See the DotDict get_path____ method.
+
+        Args:
+            path: a path
+
+        Returns:
+            val: the value
+        """
+        steps = path if isinstance(path, tuple) else dotdict._compile_path(str(path))
+        val = self
+
+        for step in steps:
+            val = val[step]
+
+        return val
+
+    def to_dotdict____(self):
+        """Parses self fully into a DotDict.
+
+        Returns:
+            result: the DotDict
+        """
+        result = _DotDict.from_dict____(self.to_dict____())
+        return result
+
+    def to_dict____(self):
+        """Parses self fully into a Python built-in dict.
+
+        Returns:
+            result: the dict
+        """
+        objects = self._objects
+        result = {}
+
+        for key, (start, end) in self._entries.items():
+            if start in objects:
+                result[key] = _make_view(type(self), self._data, objects, start).to_dict____()
+            else:
+                result[key] = _jsonloads(self._data[start: end])
+        # end for
+
+        return result
+
+
+def _make_view(cls, data, objects, offset):
+    """Makes a MappedDotDict view of an indexed object.
+
+    Args:
+        cls: the MappedDotDict class
+        data: the JSON bytes
+        objects: the offset index
+        offset: the object offset
+
+    Returns:
+        result: the view
+    """
+    result = object.__new__(cls)
+    object.__setattr__(result, "_data", data)
+    object.__setattr__(result, "_objects", objects)
+    object.__setattr__(result, "_entries", objects[offset])
+    return result
+
+
+def _skip_ws(data, pos):
+    """Skips the JSON whitespace.
+
+    Args:
+        data: the JSON bytes
+        pos: the position
+
+    Returns:
+        result: the position after the whitespace
+    """
+    result = _ws_regex.match(data, pos).end()
+    return result
+
+
+def _skip_val(data, pos):
+    """Skips a JSON value, without parsing it.
+
+    Args:
+        data: the JSON bytes
+        pos: the start position of the value
+
+    Returns:
+        result: the end position of the value
+
+    Raises:
+        ValueError: if the value is malformed
+    """
+    if pos >= len(data):
+        raise ValueError(f"Malformed JSON at position {pos}: unexpected end")
+
+    first = data[pos]
+
+    if first == _quote:
+        match = _str_regex.match(data, pos)
+    elif first == _open_brace or first == _open_bracket:
+        level = 1
+        match = _skip_regex.match(data, pos + 1)
+
+        # The small nested containers are stepped over by the regex, and only the others are counted here
+        while match is not None:
+            end = match.end()
+            last = data[end - 1]
+
+            if last == _open_brace or last == _open_bracket:
+                level += 1
+            else:
+                level -= 1
+
+                if level <= 0:
+                    return end
+            # end if
+
+            match = _skip_regex.match(data, end)
+        # end while
+    else:
+        match = _scalar_regex.match(data, pos)
+    # end if
+
+    if match is None:
+        raise ValueError(f"Malformed JSON at position {pos}")
+
+    result = match.end()
+    return result
+
+
+def _index_object(data, pos, depth, objects):
+    """Indexes a JSON object, and its nested objects down to the given depth.
+
+    Args:
+        data: the JSON bytes
+        pos: the start position of the object, at its opening brace
+        depth: the depth down to which the objects are indexed, counting the object at 1
+        objects: the offset index to add to
+
+    Returns:
+        result: the end position of the object
+
+    Raises:
+        ValueError: if the object is malformed
+    """
+    entries = {}
+    objects[pos] = entries
+    start = pos
+    pos = _skip_ws(data, pos + 1)
+
+    if pos < len(data) and data[pos] == _close_brace:
+        return pos + 1
+
+    while True:
+        match = _str_regex.match(data, pos)
+
+        if match is None:
+            raise ValueError(f"Malformed JSON object at position {start}: expected a key at {pos}")
+
+        key_bytes = match.group()
+        key = _jsonloads(key_bytes) if b"\\" in key_bytes else str(key_bytes[1: -1], "utf-8")
+        pos = _skip_ws(data, match.end())
+
+        if pos >= len(data) or data[pos] != _colon:
+            raise ValueError(f"Malformed JSON object at position {start}: expected a colon at {pos}")
+
+        val_start = _skip_ws(data, pos + 1)
+
+        if depth > 1 and val_start < len(data) and data[val_start] == _open_brace:
+            val_end = _index_object(data, val_start, depth - 1, objects)
+        else:
+            val_end = _skip_val(data, val_start)
+
+        # Like in the json module, the last duplicate key wins
+        entries[key] = (val_start, val_end)
+        pos = _skip_ws(data, val_end)
+
+        if pos < len(data) and data[pos] == _comma:
+            pos = _skip_ws(data, pos + 1)
+        elif pos < len(data) and data[pos] == _close_brace:
+            return pos + 1
+        else:
+            raise ValueError(f"Malformed JSON object at position {start}: expected a comma or a brace at {pos}")
+        # end if
+    # end while
@@ -0,0 +1,609 @@
+"""Dot schema."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import copy
+
+from lyc_pyutils.libs import clamps
+from lyc_pyutils.libs import dotdict
+
+_clamp_float = clamps.clamp_float
+_clamp_int = clamps.clamp_int
+_compile_path = dotdict._compile_path
+_deepcopy = copy.deepcopy
+_DotDict = dotdict.DotDict
+_invalid = object()
+_missing = object()
+
+_rule_keys = frozenset(("type", "default", "required", "min", "max", "choices", "coerce"))
+"""The keys of a rule spec."""
+
+_node_op = 0
+"""The kind of the operations that find a nested node."""
+
+_leaf_op = 1
+"""The kind of the operations that check and coerce a value."""
+
+
+class DotSchema:
+    """Dot schema.
+
+    A compiled schema of the values of DotDict configs, keyed by their paths.
+
+    On the initialization, the rules are compiled once into a flat list of operations. A node operation finds a nested
+        node from an earlier found node with one step. A leaf operation reads a value from a found node, and checks and
+        coerces it with a coercer function that is composed from its rule. Each nested node is found once per config,
+        and shared by all the rules under it, so a config is checked and coerced in a single pass.
+
+    A rule spec is either a type, or a dict with any of the following keys:
+        "type": the value type, where an int, a float, and a bool are converted between one another if exact;
+        "default": the default value, set if the value is missing;
+        "required": whether a missing value is an error;
+        "min" and "max": the bounds, where the ints and the floats are clamped with the clamps functions;
+        "choices": the allowed values; and,
+        "coerce": a function of the value that gives the coerced value, after the above steps.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    def __init__(self, rules):
+        """Inits self with the given rules, and compiles them.
+
+        Args:
+            rules: a dict that maps each path to its rule spec, where a path is like in the DotDict get_path____ method
+
+        Raises:
+            ValueError: if a path is malformed or empty, or a rule spec has an unknown key
+        """
+        self._rules = {}
+        """The rule specs, keyed by the paths."""
+
+        self._ops = []
+        """The operations. Each is a tuple of the kind, the parent slot, the step, and the path for a node or the rule
+            for a leaf."""
+
+        self._slot_parents = [None]
+        """The parent slot and the step of each node slot, or None for the root slot."""
+
+        slots = {(): 0}
+        compiled = []
+
+        for path, spec in rules.items():
+            steps = path if isinstance(path, tuple) else _compile_path(str(path))
+
+            if len(steps) <= 0:
+                raise ValueError(f"Cannot compile a rule with an empty path: {path}")
+
+            if not isinstance(spec, dict):
+                spec = {"type": spec}
+
+            unknown_keys = set(spec) - _rule_keys
+
+            if len(unknown_keys) > 0:
+                raise ValueError(f"Unknown rule spec keys at {path}: {sorted(unknown_keys)}")
+
+            self._rules[path] = spec
+            compiled.append((steps, path, spec))
+        # end for
+
+        # The rules under the same node are next to one another after the sorting, so each node is found once
+        compiled.sort(key=lambda item: tuple(map(str, item[0])))
+
+        for steps, path, spec in compiled:
+            parent_slot = 0
+
+            for index in range(1, len(steps)):
+                prefix = steps[:index]
+                slot = slots.get(prefix)
+
+                if slot is None:
+                    slot = len(self._slot_parents)
+                    slots[prefix] = slot
+                    self._slot_parents.append((parent_slot, steps[index - 1]))
+                    self._ops.append((_node_op, parent_slot, steps[index - 1], _path_str(prefix)))
+                # end if
+
+                parent_slot = slot
+            # end for
+
+            rule = (path, _make_coercer(spec), spec.get("default", _missing), bool(spec.get("required", False)))
+            self._ops.append((_leaf_op, parent_slot, steps[-1], rule))
+        # end for
+
+    def _run(self, dict_, fix):
+        """Checks the values of a config, and coerces them if asked to.
+
+        Args:
+            dict_: the config, a DotDict
+            fix: whether to set the coerced values and the defaults
+
+        Returns:
+            result: the list of the error messages
+        """
+        result = []
+        slots = [dict_]
+        append_slot = slots.append
+
+        for kind, parent_slot, step, rule in self._ops:
+            parent = slots[parent_slot]
+
+            if kind == _node_op:
+                if parent is _missing or parent is _invalid:
+                    node = parent
+                else:
+                    node = _get_val(parent, step, fix)
+
+                # The rules under a node that is not a container are skipped, after one error for the node
+                if not (node is _missing or node is _invalid or isinstance(node, (dict, list, tuple))):
+                    result.append(f"{rule}: expected dict, got {node!r}")
+                    node = _invalid
+                # end if
+
+                append_slot(node)
+                continue
+            # end if
+
+            path, coercer, default, required = rule
+
+            if parent is _invalid:
+                continue
+
+            if parent is _missing:
+                val = _missing
+            else:
+                val = _get_val(parent, step, fix)
+
+            if val is _missing:
+                if required:
+                    result.append(f"{path}: missing required value")
+                elif default is not _missing and fix:
+                    try:
+                        if parent is _missing:
+                            parent = _make_slot(slots, self._slot_parents, parent_slot)
+
+                        _set_val(parent, step, _deepcopy(default))
+                    except (IndexError, TypeError) as exc:
+                        result.append(f"{path}: {exc}")
+                    # end try
+                # end if
+
+                continue
+            # end if
+
+            try:
+                coerced = coercer(val)
+            except (TypeError, ValueError) as exc:
+                result.append(f"{path}: {exc}")
+                continue
+            # end try
+
+            if fix and (coerced is not val) and (type(coerced) is not type(val) or coerced != val):
+                try:
+                    _set_val(parent, step, coerced)
+                except (IndexError, TypeError) as exc:
+                    result.append(f"{path}: {exc}")
+                # end try
+            # end if
+        # end for
+
+        return result
+
+    def rules____(self):
+        """Finds the rule specs.
+
+        Returns:
+            result: a dict that maps each path to its rule spec
+        """
+        result = dict(self._rules)
+        return result
+
+    def check____(self, dict_):
+        """Checks the values of a config, without changing it.
+
+        Args:
+            dict_: the config, a DotDict
+
+        Returns:
+            result: the list of the error messages, which is empty if the config is valid
+        """
+        result = self._run(dict_, False)
+        return result
+
+    def coerce____(self, dict_):
+        """Coerces the values of a config in place, and sets the missing values to their defaults.
+
+        The nested DotDicts are read with their get_item____ method, and the values are set with the set_item____
+            method of their parent DotDicts. Thus, the lazy and copy-on-write modes apply: a snapshot is coerced
+            without changing its base, and a lazy DotDict without changing its source dicts.
+
+        Args:
+            dict_: the config, a DotDict
+
+        Returns:
+            dict_: the config
+
+        Raises:
+            ValueError: if the config is invalid, with all the error messages
+        """
+        errors = self._run(dict_, True)
+
+        if len(errors) > 0:
+            raise ValueError("Invalid config:\n" + "\n".join(errors))
+
+        return dict_
+
+    def coerce_all____(self, dicts):
+        """Coerces the values of many configs in place, and collects their errors instead of raising them.
+
+        Args:
+            dicts: an iterable of the configs, each a DotDict
+
+        Returns:
+            result: the list of the error message lists, one per config, in order
+        """
+        run = self._run
+        result = [run(dict_, True) for dict_ in dicts]
+        return result
+
+
+def _make_coercer(spec):
+    """Makes the coercer function of a rule.
+
+    Args:
+        spec: the rule spec
+
+    Returns:
+        result: the coercer function, which gives the coerced value or raises TypeError or ValueError
+    """
+    type_ = spec.get("type")
+    low = spec.get("min")
+    high = spec.get("max")
+    choices = spec.get("choices")
+    coerce = spec.get("coerce")
+    steps = []
+
+    if type_ is int:
+        steps.append(_to_int)
+    elif type_ is float:
+        steps.append(_to_float)
+    elif type_ is bool:
+        steps.append(_to_bool)
+    elif type_ is not None:
+        steps.append(_make_type_check(type_))
+    # end if
+
+    if low is not None or high is not None:
+        steps.append(_make_clamp(type_, low, high))
+
+    if choices is not None:
+        try:
+            choices = frozenset(choices)
+        except TypeError:
+            # Some choices are not hashable
+            choices = tuple(choices)
+        # end try
+
+        def check_choice(val):
+            if val not in choices:
+                raise ValueError(f"expected one of the choices, got {val!r}")
+
+            return val
+
+        steps.append(check_choice)
+    # end if
+
+    if coerce is not None:
+        steps.append(coerce)
+
+    if len(steps) <= 0:
+        return _identity
+
+    if len(steps) == 1:
+        return steps[0]
+
+    steps = tuple(steps)
+
+    def coercer(val):
+        for step in steps:
+            val = step(val)
+
+        return val
+
+    return coercer
+
+
+def _make_type_check(type_):
+    """Makes the function that checks the type of a value.
+
+    Args:
+        type_: the type
+
+    Returns:
+        result: the function
+    """
+    def check_type(val):
+        if not isinstance(val, type_):
+            raise TypeError(f"expected {type_.__name__}, got {val!r}")
+
+        return val
+
+    return check_type
+
+
+def _make_clamp(type_, low, high):
+    """Makes the function that clamps a value.
+
+    Args:
+        type_: the value type, or None
+        low: the lower bound, or None
+        high: the upper bound, or None
+
+    Returns:
+        result: the function
+    """
+    def clamp_one(val):
+        if low is not None and val < low:
+            return type(val)(low)
+
+        if high is not None and val > high:
+            return type(val)(high)
+
+        return val
+
+    if low is None or high is None:
+        return clamp_one
+
+    if type_ is int or type_ is float:
+        clamp = _clamp_int if type_ is int else _clamp_float
+
+        def clamp_both(val):
+            return clamp(val, low, high)
+
+        return clamp_both
+    # end if
+
+    # Without a rule type, clamp each value with its own type
+    def clamp_val(val):
+        val_type = type(val)
+
+        if val_type is int:
+            return _clamp_int(val, low, high)
+
+        if val_type is float:
+            return _clamp_float(val, low, high)
+
+        return clamp_one(val)
+
+    return clamp_val
+
+
+def _to_int(val):
+    """Converts a value to an int, if exact.
+
+    Args:
+        val: the value
+
+    Returns:
+        result: the int
+
+    Raises:
+        TypeError: if the value is not a number or a numeric str
+        ValueError: if the value is not an exact int
+    """
+    val_type = type(val)
+
+    if val_type is int:
+        return val
+
+    if val_type is bool:
+        raise TypeError(f"expected int, got {val!r}")
+
+    if val_type is float:
+        if not val.is_integer():
+            raise ValueError(f"expected int, got {val!r}")
+
+        return int(val)
+    # end if
+
+    if val_type is str:
+        return int(val)
+
+    raise TypeError(f"expected int, got {val!r}")
+
+
+def _to_float(val):
+    """Converts a value to a float.
+
+    Args:
+        val: the value
+
+    Returns:
+        result: the float
+
+    Raises:
+        TypeError: if the value is not a number or a numeric str
+        ValueError: if the str is not numeric
+    """
+    val_type = type(val)
+
+    if val_type is float:
+        return val
+
+    if val_type is int or val_type is str:
+        return float(val)
+
+    raise TypeError(f"expected float, got {val!r}")
+
+
+def _to_bool(val):
+    """Converts a value to a bool, if exact.
+
+    Args:
+        val: the value
+
+    Returns:
+        result: the bool
+
+    Raises:
+        TypeError: if the value is not a bool, 0, or 1
+    """
+    if val is True or val is False:
+        return val
+
+    if type(val) is int and (val == 0 or val == 1):
+        return bool(val)
+
+    raise TypeError(f"expected bool, got {val!r}")
+
+
+def _identity(val):
+    """Gives a value as it is.
+
+    Args:
+        val: the value
+
+    Returns:
+        val: the value
+    """
+    return val
+
+
+def _set_val(parent, step, val):
+    """Sets a value in a node.
+
+    Args:
+        parent: the node, a dict (including DotDict), list, or tuple
+        step: the step, a key or an index
+        val: the value
+
+    Raises:
+        TypeError: if the node is a tuple, or the step is not an int index of a list
+        IndexError: if the step is out of the range of a list
+    """
+    if isinstance(parent, _DotDict):
+        parent.set_item____(step, val)
+    elif isinstance(parent, dict):
+        parent[step] = val
+    elif isinstance(parent, list):
+        if type(step) is not int:
+            raise TypeError(f"cannot set {step!r} in a list")
+
+        if not -len(parent) <= step < len(parent):
+            raise IndexError(f"cannot set index {step} in a list of length {len(parent)}")
+
+        parent[step] = val
+    else:
+        raise TypeError(f"cannot set {step!r} in a {type(parent).__name__}")
+    # end if
+
+
+def _make_slot(slots, slot_parents, slot):
+    """Makes the missing nodes of a slot and its parent slots as empty DotDicts.
+
+    The missing slots are marked invalid if their nodes cannot be made, so the later rules under them are skipped.
+
+    Args:
+        slots: the found nodes, one per slot
+        slot_parents: the parent slot and the step of each slot
+        slot: the slot
+
+    Returns:
+        result: the node of the slot
+
+    Raises:
+        TypeError: if a missing node cannot be set in its parent node, like in the _set_val function
+        IndexError: if a missing node is out of the range of its parent list
+    """
+    result_slot = slot
+    missing_slots = []
+
+    while slots[slot] is _missing:
+        missing_slots.append(slot)
+        slot = slot_parents[slot][0]
+    # end while
+
+    for missing_slot in reversed(missing_slots):
+        parent_slot, step = slot_parents[missing_slot]
+        # The set_item____ method stores a DotDict as it is
+        node = _DotDict()
+
+        try:
+            _set_val(slots[parent_slot], step, node)
+        except (IndexError, TypeError):
+            for invalid_slot in missing_slots:
+                slots[invalid_slot] = _invalid
+
+            raise
+        # end try
+
+        slots[missing_slot] = node
+    # end for
+
+    result = slots[result_slot]
+    return result
+
+
+def _get_val(parent, step, fix):
+    """Gets a value from a node.
+
+    The values of a DotDict are read as they are stored, like in the DotDict get_path____ method. When fixing, they
+        are read with the get_item____ method instead, so the lazy and copy-on-write modes convert or copy them before
+        they are changed.
+
+    Args:
+        parent: the node, a dict (including DotDict), list, or tuple
+        step: the step, a key or an index
+        fix: whether the value may be changed
+
+    Returns:
+        result: the value, or _missing if there is no such a value
+    """
+    if fix and isinstance(parent, _DotDict) and (parent._lazy or parent._cow):
+        result = parent.get_item____(step) if step in parent else _missing
+        return result
+    # end if
+
+    if isinstance(parent, dict):
+        result = dict.get(parent, step, _missing)
+        return result
+    # end if
+
+    try:
+        result = parent[step]
+    except (IndexError, KeyError, TypeError):
+        result = _missing
+    # end try
+
+    return result
+
+
+def _path_str(steps):
+    """Finds the path string of the given steps.
+
+    Args:
+        steps: the steps, each a str key or an int index
+
+    Returns:
+        result: the path string, like "model.encoder.layers[3]"
+    """
+    segs = []
+
+    for step in steps:
+        if isinstance(step, int):
+            segs.append(f"[{step}]")
+        elif len(segs) > 0:
+            segs.append(f".{step}")
+        else:
+            segs.append(step)
+        # end if
+    # end for
+
+    result = "".join(segs)
+    return result
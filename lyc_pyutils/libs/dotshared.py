@@ -0,0 +1,567 @@
+"""Dot shared."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import mmap
+import os
+import pickle
+import struct
+import zlib
+
+from collections import abc
+from multiprocessing import shared_memory
+
+from lyc_pyutils.libs import dotdict
+
+try:
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+# end try
+
+_crc32 = zlib.crc32
+_DotDict = dotdict.DotDict
+_fstat = os.fstat
+_Mapping = abc.Mapping
+_mmap = mmap.mmap
+_mmap_read = mmap.ACCESS_READ
+_os_close = os.close
+_O_RDONLY = os.O_RDONLY
+_pickle_dumps = pickle.dumps
+_pickle_protocol = pickle.HIGHEST_PROTOCOL
+_pickle_loads = pickle.loads
+_SharedMemory = shared_memory.SharedMemory
+_Struct = struct.Struct
+
+_header = _Struct("<4sxxxxQ")
+"""The buffer header: the magic bytes, and the root node offset."""
+
+_node_header = _Struct("<QQ")
+"""The node header: the number of the entries, and the number of the hash slots."""
+
+_entry = _Struct("<QII")
+"""A node entry: the key offset, the key length, and the value length. The value follows the key."""
+
+_slot = _Struct("<I")
+"""A hash slot: the entry index plus 1, or 0 if the slot is empty."""
+
+_node_ref = _Struct("<Q")
+"""A nested node value: the node offset."""
+
+_int_val = _Struct("<q")
+"""An int value that fits in 64 bits."""
+
+_float_val = _Struct("<d")
+"""A float value."""
+
+_magic = b"LYCD"
+"""The magic bytes of the buffer format."""
+
+_node_tag = b"N"[0]
+"""The tag of a nested node value."""
+
+_str_tag = b"S"[0]
+"""The tag of a UTF-8 str value."""
+
+_int_tag = b"I"[0]
+"""The tag of an int value."""
+
+_float_tag = b"D"[0]
+"""The tag of a float value."""
+
+_pickle_tag = b"P"[0]
+"""The tag of a pickled value, for the other types."""
+
+_node_prefix = bytes((_node_tag,))
+_str_prefix = bytes((_str_tag,))
+_int_prefix = bytes((_int_tag,))
+_float_prefix = bytes((_float_tag,))
+_pickle_prefix = bytes((_pickle_tag,))
+
+_consts = {b"Z"[0]: None, b"T"[0]: True, b"F"[0]: False}
+"""The constant values, keyed by their tags."""
+
+_const_vals = {id(val): bytes((tag,)) for tag, val in _consts.items()}
+"""The serialized constant values, keyed by the ids of the constants."""
+
+_int_min = -(1 << 63)
+"""The min int value that fits in 64 bits."""
+
+_int_max = (1 << 63) - 1
+"""The max int value that fits in 64 bits."""
+
+
+class SharedDotDict(_Mapping):
+    """Shared dot dictionary.
+
+    A read-only DotDict-like view of a dict tree, serialized in a compact form into a buffer. The buffer is usually a
+        multiprocessing.shared_memory block that many processes attach to, so the tree is stored once, rather than once
+        per process.
+
+    Each nested dict is a node, with its entries in order and a hash table of its keys. A lookup hashes the key with
+        CRC-32 and reads the matching entry only. The nested dicts are decoded lazily, as SharedDotDict views of their
+        nodes, and the other values are unpickled on each access, as copies. Nothing is cached, so the memory of a
+        process does not grow with its reads.
+
+    Mutations raise TypeError.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    __slots__ = ("_owner", "_buf", "_offset", "_count", "_slot_count")
+
+    @classmethod
+    def dumps____(cls, dict_):
+        """Serializes a dict tree into the compact form.
+
+        The nested dicts are serialized once each, so the shared nested dicts stay shared in the result.
+
+        Args:
+            dict_: a dict (including DotDict) or Mapping
+
+        Returns:
+            result: the serialized bytes
+
+        Raises:
+            ValueError: if the dict tree has a cycle
+        """
+        data = bytearray(_header.size)
+        offsets = {}
+        visiting = {id(dict_)}
+        stack = [(dict_, iter(dict_.values()))]
+
+        # The nodes are serialized in the post-order, so that the offsets of the nested nodes are known
+        while len(stack) > 0:
+            node, vals = stack[-1]
+
+            for val in vals:
+                if isinstance(val, _Mapping) and id(val) not in offsets:
+                    if id(val) in visiting:
+                        raise ValueError("Cannot serialize a dict tree with a cycle")
+
+                    visiting.add(id(val))
+                    stack.append((val, iter(val.values())))
+                    break
+                # end if
+            else:
+                stack.pop()
+                visiting.discard(id(node))
+                offsets[id(node)] = _write_node(data, node, offsets)
+            # end for
+        # end while
+
+        _header.pack_into(data, 0, _magic, offsets[id(dict_)])
+        result = bytes(data)
+        return result
+
+    @classmethod
+    def from_buffer____(cls, buf, owner=None):
+        """Builds and returns the root view of a serialized dict tree in a buffer.
+
+        Args:
+            buf: a bytes-like object of the serialized form
+            owner: an object to keep alive as long as the views, like the shared memory block of the buffer, or None
+
+        Returns:
+            result: the root view
+
+        Raises:
+            ValueError: if the buffer is not of the serialized form
+        """
+        magic, offset = _header.unpack_from(buf, 0)
+
+        if magic != _magic:
+            raise ValueError("Buffer is not of the SharedDotDict serialized form")
+
+        result = _make_view(cls, owner, buf, offset)
+        return result
+
+    @classmethod
+    def publish____(cls, dict_, name=None):
+        """Serializes a dict tree into a new shared memory block.
+
+        The caller owns the block. Keep it open while the other processes attach to it, and then close and unlink it.
+
+        Args:
+            dict_: a dict (including DotDict) or Mapping
+            name: the block name, or None for a random name
+
+        Returns:
+            result: the shared memory block, a multiprocessing.shared_memory.SharedMemory
+        """
+        data = cls.dumps____(dict_)
+        result = _SharedMemory(name=name, create=True, size=len(data))
+        result.buf[:len(data)] = data
+        return result
+
+    @classmethod
+    def attach____(cls, name):
+        """Attaches to a shared memory block published by the publish____ method.
+
+        The attaching process does not unlink the block at its exit. The block stays open as long as the views.
+
+        Args:
+            name: the block name
+
+        Returns:
+            result: the root view
+        """
+        try:
+            owner = _SharedMemory(name=name, track=False)
+            buf = owner.buf
+        except TypeError:
+            if _posixshmem is None:
+                # Without POSIX shared memory, there is no tracking to avoid
+                owner = _SharedMemory(name=name)
+                buf = owner.buf
+            else:
+                # Before Python 3.13, SharedMemory tracks an attached block, and unlinks it at the process exit, so
+                #   the block is mapped read-only here instead
+                fd = _posixshmem.shm_open("/" + name.lstrip("/"), _O_RDONLY, mode=0o600)
+
+                try:
+                    owner = _mmap(fd, _fstat(fd).st_size, access=_mmap_read)
+                finally:
+                    _os_close(fd)
+                # end try
+
+                buf = memoryview(owner)
+            # end if
+        # end try
+
+        result = cls.from_buffer____(buf, owner=owner)
+        return result
+
+    def _find_entry(self, key):
+        """Finds the entry of a key.
+
+        Args:
+            key: a str key
+
+        Returns:
+            result: the entry index, or -1 if there is no such an entry
+        """
+        buf = self._buf
+        offset = self._offset
+        slot_count = self._slot_count
+
+        if slot_count <= 0:
+            return -1
+
+        key_bytes = key.encode()
+        entries_offset = offset + _node_header.size
+        slots_offset = entries_offset + self._count * _entry.size
+        slot_index = _crc32(key_bytes) & (slot_count - 1)
+
+        while True:
+            index = _slot.unpack_from(buf, slots_offset + slot_index * _slot.size)[0] - 1
+
+            if index < 0:
+                return -1
+
+            key_offset, key_len, _ = _entry.unpack_from(buf, entries_offset + index * _entry.size)
+
+            if key_len == len(key_bytes) and buf[key_offset: key_offset + key_len] == key_bytes:
+                return index
+
+            slot_index = (slot_index + 1) & (slot_count - 1)
+        # end while
+
+    def _entry_key(self, index):
+        """Decodes the key of an entry.
+
+        Args:
+            index: the entry index
+
+        Returns:
+            result: the key
+        """
+        key_offset, key_len, _ = _entry.unpack_from(self._buf, self._offset + _node_header.size + index * _entry.size)
+        result = str(self._buf[key_offset: key_offset + key_len], "utf-8")
+        return result
+
+    def _entry_val(self, index):
+        """Decodes the value of an entry.
+
+        Args:
+            index: the entry index
+
+        Returns:
+            result: the value, a SharedDotDict view for a nested dict
+        """
+        buf = self._buf
+        key_offset, key_len, val_len = _entry.unpack_from(buf, self._offset + _node_header.size + index * _entry.size)
+        val_offset = key_offset + key_len
+
+        tag = buf[val_offset]
+
+        if tag == _node_tag:
+            result = _make_view(type(self), self._owner, buf, _node_ref.unpack_from(buf, val_offset + 1)[0])
+        elif tag == _str_tag:
+            result = str(buf[val_offset + 1: val_offset + val_len], "utf-8")
+        elif tag == _int_tag:
+            result = _int_val.unpack_from(buf, val_offset + 1)[0]
+        elif tag == _float_tag:
+            result = _float_val.unpack_from(buf, val_offset + 1)[0]
+        elif tag in _consts:
+            result = _consts[tag]
+        else:
+            result = _pickle_loads(buf[val_offset + 1: val_offset + val_len])
+        # end if
+
+        return result
+
+    # Magic functions
+
+    def __getitem__(self, key):
+        """Gets a value with the given key.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: the value
+
+        Raises:
+            KeyError: if there is no such a value
+        """
+        index = self._find_entry(str(key))
+
+        if index < 0:
+            raise KeyError(key)
+
+        return self._entry_val(index)
+
+    def __getattr__(self, name):
+        """Gets a value with the given name.
+
+        Args:
+            name: a name
+
+        Returns:
+            _: the value
+
+        Raises:
+            AttributeError: if the name is exceptional, or there is no such a value
+        """
+        index = -1 if _DotDict.is_exc_key____(name) else self._find_entry(name)
+
+        if index < 0:
+            raise AttributeError(f"SharedDotDict has no attribute or item called: {name}")
+
+        return self._entry_val(index)
+
+    def __setattr__(self, name, val):
+        """Rejects the attribute setting.
+
+        Args:
+            name: a name
+            val: a value
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError("SharedDotDict does not support mutations")
+
+    def __delattr__(self, name):
+        """Rejects the attribute deletion.
+
+        Args:
+            name: a name
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError("SharedDotDict does not support mutations")
+
+    def __iter__(self):
+        """Iterates over the keys, in order.
+
+        Returns:
+            _: the key iterator
+        """
+        return map(self._entry_key, range(self._count))
+
+    def __len__(self):
+        """Finds the number of the items.
+
+        Returns:
+            _: the number of the items
+        """
+        return self._count
+
+    def __contains__(self, key):
+        """Finds if self has an item with the given key.
+
+        Args:
+            key: a key
+
+        Returns:
+            _: whether self has the item
+        """
+        return self._find_entry(str(key)) >= 0
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        result = f"SharedDotDict(**{self.to_dict____()!r})"
+        return result
+
+    def __reduce__(self):
+        """Finds the pickling recipe of self, which is a DotDict copy.
+
+        Returns:
+            result: the pickling recipe
+        """
+        result = (_DotDict.from_dict____, (self.to_dict____(),))
+        return result
+
+    # Public functions
+
+    def get_path____(self, path):
+        """Gets a nested value with the given path.
+
+        See the DotDict get_path____ method.
+
+        Args:
+            path: a path
+
+        Returns:
+            val: the value
+        """
+        steps = path if isinstance(path, tuple) else dotdict._compile_path(str(path))
+        val = self
+
+        for step in steps:
+            val = val[step]
+
+        return val
+
+    def to_dotdict____(self):
+        """Decodes self fully into a DotDict.
+
+        Returns:
+            result: the DotDict
+        """
+        result = _DotDict.from_dict____(self.to_dict____())
+        return result
+
+    def to_dict____(self):
+        """Decodes self fully into a Python built-in dict.
+
+        Returns:
+            result: the dict
+        """
+        result = {}
+
+        for index in range(self._count):
+            val = self._entry_val(index)
+
+            if isinstance(val, SharedDotDict):
+                val = val.to_dict____()
+
+            result[self._entry_key(index)] = val
+        # end for
+
+        return result
+
+
+def _make_view(cls, owner, buf, offset):
+    """Makes a SharedDotDict view of a node.
+
+    Args:
+        cls: the SharedDotDict class
+        owner: the object to keep alive as long as the view, or None
+        buf: the buffer
+        offset: the node offset
+
+    Returns:
+        result: the view
+    """
+    result = object.__new__(cls)
+    count, slot_count = _node_header.unpack_from(buf, offset)
+    object.__setattr__(result, "_owner", owner)
+    object.__setattr__(result, "_buf", buf)
+    object.__setattr__(result, "_offset", offset)
+    object.__setattr__(result, "_count", count)
+    object.__setattr__(result, "_slot_count", slot_count)
+    return result
+
+
+def _write_node(data, node, offsets):
+    """Serializes a node at the end of the data.
+
+    Args:
+        data: the bytearray of the serialized form
+        node: the dict of the node
+        offsets: the node offsets, keyed by the ids of the serialized dicts
+
+    Returns:
+        result: the node offset
+    """
+    items = list(node.items())
+    count = len(items)
+
+    # A power of 2 with a load factor of at most 0.5, for the short probes
+    slot_count = 0 if count <= 0 else 1 << (2 * count - 1).bit_length()
+
+    result = len(data)
+    entries_offset = result + _node_header.size
+    slots_offset = entries_offset + count * _entry.size
+    pos = slots_offset + slot_count * _slot.size
+    data.extend(bytes(pos - result))
+    _node_header.pack_into(data, result, count, slot_count)
+
+    slots = [0] * slot_count
+    chunks = []
+
+    for index, (key, val) in enumerate(items):
+        key_bytes = str(key).encode()
+
+        val_type = type(val)
+
+        # The common scalars are stored as they are, and only the other values are pickled
+        if isinstance(val, _Mapping):
+            val_bytes = _node_prefix + _node_ref.pack(offsets[id(val)])
+        elif val_type is str:
+            val_bytes = _str_prefix + val.encode()
+        elif val_type is int and _int_min <= val <= _int_max:
+            val_bytes = _int_prefix + _int_val.pack(val)
+        elif val_type is float:
+            val_bytes = _float_prefix + _float_val.pack(val)
+        elif val is None or val_type is bool:
+            val_bytes = _const_vals[id(val)]
+        else:
+            val_bytes = _pickle_prefix + _pickle_dumps(val, protocol=_pickle_protocol)
+        # end if
+
+        _entry.pack_into(data, entries_offset + index * _entry.size, pos, len(key_bytes), len(val_bytes))
+        chunks.append(key_bytes)
+        chunks.append(val_bytes)
+        pos += len(key_bytes) + len(val_bytes)
+
+        slot_index = _crc32(key_bytes) & (slot_count - 1)
+
+        while slots[slot_index] != 0:
+            slot_index = (slot_index + 1) & (slot_count - 1)
+
+        slots[slot_index] = index + 1
+    # end for
+
+    for slot_index, slot in enumerate(slots):
+        if slot != 0:
+            _slot.pack_into(data, slots_offset + slot_index * _slot.size, slot)
+    # end for
+
+    data.extend(b"".join(chunks))
+    return result
@@ -0,0 +1,927 @@
+"""Dot table."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import array
+import itertools
+import json
+
+from collections import abc
+
+from lyc_pyutils.libs import dotdict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
+
+_array = array.array
+_DotDict = dotdict.DotDict
+_dict_get = dict.get
+_dict_new = dict.__new__
+_dict_setitem_all = dict.update
+_jsondumps = json.dumps
+_jsonloads = json.loads
+_Mapping = abc.Mapping
+_numpy = numpy
+_repeat = itertools.repeat
+
+_typecodes = {int: "q", float: "d"}
+"""The array.array typecodes of the value types that are stored as typed arrays."""
+
+_typecode_types = {"q": int, "d": float}
+"""The value types of the array.array typecodes."""
+
+_typecode_kinds = {"q": "i8", "d": "f8"}
+"""The NumPy dtypes of the array.array typecodes."""
+
+_kind_typecodes = {"i": "q", "u": "q", "b": None, "f": "d"}
+"""The array.array typecodes of the NumPy dtype kinds, or None for the kinds stored as lists."""
+
+_stream_buf_size = 65536
+"""The number of characters to buffer before each write to a JSON Lines file."""
+
+
+def _make_column(values):
+    """Makes a column from the given values.
+
+    If all the values are ints, or all the values are floats, the column is a typed array.array. Otherwise, the column
+        is a list. The bools are not ints here, so that they stay bools. As in a DotDict, the Python built-in dict
+        values are converted to DotDicts.
+
+    Args:
+        values: an iterable of the values
+
+    Returns:
+        result: the column, an array.array or a list
+    """
+    if not isinstance(values, list):
+        values = list(values)
+
+    result = values
+
+    if len(values) > 0:
+        types = set(map(type, values))
+
+        if dict in types:
+            result = [_DotDict.from_dict____(val) if type(val) is dict else val for val in values]
+        elif len(types) == 1:
+            typecode = _typecodes.get(types.pop())
+
+            if typecode is not None:
+                try:
+                    result = _array(typecode, values)
+                except OverflowError:
+                    # The ints out of the typed array range stay in a list
+                    result = values
+                # end try
+            # end if
+        # end if
+    # end if
+
+    return result
+
+
+def _make_schema_column(values, kind):
+    """Makes a column from the given values, with the value type of a schema field.
+
+    An int or float column is a typed array.array whenever the values fit in. Otherwise, this works like
+        the _make_column function.
+
+    Args:
+        values: a list of the values
+        kind: the value type of the schema field
+
+    Returns:
+        result: the column, an array.array or a list
+    """
+    typecode = _typecodes.get(kind)
+
+    if typecode is not None:
+        try:
+            return _array(typecode, values)
+        except (TypeError, OverflowError):
+            # Some values do not fit in, like None, str, or out of the range ints
+            pass
+        # end try
+    # end if
+
+    result = _make_column(values)
+    return result
+
+
+def _conv_val(val):
+    """Converts a Python built-in dict value to a DotDict, as in a DotDict.
+
+    Args:
+        val: the value
+
+    Returns:
+        result: the converted value
+    """
+    result = _DotDict.from_dict____(val) if type(val) is dict else val
+    return result
+
+
+def _is_col_name(name):
+    """Finds if a name can be a column name with the "table.key" syntax.
+
+    Args:
+        name: a name
+
+    Returns:
+        result: whether the name is neither private nor with 4 trailing underscores
+    """
+    result = not (name.startswith("_") or name.endswith("____"))
+    return result
+
+
+class DotTable:
+    """Dot table.
+
+    A table of DotDict-like rows, with each column stored as a contiguous sequence. A column of only ints or only
+        floats is a typed array.array, and any other column is a list.
+
+    The columns can be accessed with the "table.key" syntax, except for the private names and the names with 4
+        trailing underscores, and with the "table[key]" syntax. The rows can be accessed with the "table[index]"
+        syntax, as DotTableRow views that read and write the columns in place. A slice gives a new DotTable.
+
+    The column operations, like the apply____, filter____, and take____ methods, work on the whole columns at once,
+        instead of going through the rows one by one.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    @classmethod
+    def from_rows____(cls, rows, schema=None):
+        """Builds and returns a DotTable from an iterable of rows.
+
+        Without a schema, the rows are read in a single pass. The column names are the row keys, in their first-seen
+            order. A value missing from a row is None.
+
+        With a schema, which is a DotDict subclass with class-level defaults, the columns are the schema fields, in
+            the class-level default template order. Each column is read in its own pass. A value missing from a row is
+            the field default, and the other row keys are left out. A column with an int or float default is a typed
+            array.array whenever its values fit in, as in a NumPy structured array with the schema dtype.
+
+        As in a DotDict, the Python built-in dict values are converted to DotDicts.
+
+        Args:
+            rows: an iterable of the rows, each a dict (including DotDict), or a Mapping if without a schema
+            schema: a DotDict subclass, or None
+
+        Returns:
+            result: the DotTable
+        """
+        if schema is not None:
+            rows = rows if isinstance(rows, list) else list(rows)
+            defaults, _ = schema.defaults____()
+            cols = {}
+
+            # Read each column with the C-level dict.get, without a Python-level loop body
+            for name, default in defaults.items():
+                vals = list(map(_dict_get, rows, _repeat(name), _repeat(default)))
+                cols[name] = _make_schema_column(vals, type(default))
+            # end for
+
+            result = cls()
+            object.__setattr__(result, "_cols", cols)
+            object.__setattr__(result, "_count", len(rows))
+            return result
+        # end if
+
+        cols = {}
+        count = 0
+
+        for row in rows:
+            for key, val in row.items():
+                col = cols.get(key)
+
+                if col is None:
+                    col = [None] * count
+                    cols[key] = col
+                # end if
+
+                col.append(val)
+            # end for
+
+            count += 1
+
+            # Fill the missing values, which only happens when the row misses some of the columns
+            if len(row) != len(cols):
+                for col in cols.values():
+                    if len(col) < count:
+                        col.append(None)
+                # end for
+            # end if
+        # end for
+
+        result = cls()
+        result._set_cols(cols, count)
+        return result
+
+    @classmethod
+    def from_json_lines____(cls, from_file):
+        """Loads a DotTable from a JSON Lines file, with one JSON object per row.
+
+        The rows are parsed as Python built-in dicts, and then the nested JSON objects in the columns are converted to
+            DotDicts, as in the from_rows____ method.
+
+        Args:
+            from_file: the JSON Lines file location
+
+        Returns:
+            result: the DotTable
+        """
+        from_file = str(from_file)
+
+        file = open(from_file, "r")
+        rows = [_jsonloads(line) for line in file if len(line.strip()) > 0]
+        file.close()
+
+        result = cls.from_rows____(rows)
+        return result
+
+    def _set_cols(self, cols, count):
+        """Sets the columns of self, with the typed arrays made where possible.
+
+        Args:
+            cols: the columns, keyed by the column names
+            count: the number of the rows
+        """
+        object.__setattr__(self, "_cols", {str(name): _make_column(col) for name, col in cols.items()})
+        object.__setattr__(self, "_count", count)
+
+    def _set_cell(self, name, index, val):
+        """Sets a cell value, and turns a typed array column into a list if the value does not fit in.
+
+        Args:
+            name: the column name
+            index: the row index
+            val: the cell value
+        """
+        col = self._cols[name]
+        val = _conv_val(val)
+
+        if isinstance(col, _array) and type(val) is not _typecode_types[col.typecode]:
+            col = list(col)
+            self._cols[name] = col
+        # end if
+
+        col[index] = val
+
+    def _find_index(self, index):
+        """Finds the non-negative row index of the given index.
+
+        Args:
+            index: a row index
+
+        Returns:
+            result: the non-negative row index
+
+        Raises:
+            IndexError: if the index is out of the range
+        """
+        result = index + self._count if index < 0 else index
+
+        if result < 0 or result >= self._count:
+            raise IndexError(f"Row index out of range: {index}")
+
+        return result
+
+    def __init__(self, cols=None, **kwargs):
+        """Inits self with the given columns, and then with the given keyword arguments.
+
+        Args:
+            cols: the columns, a dict or Mapping from the column names to the iterables of the column values
+            **kwargs: the keyword arguments, the column names and the iterables of the column values
+
+        Raises:
+            ValueError: if the columns have different lengths
+        """
+        all_cols = {}
+
+        if cols is not None:
+            all_cols.update(cols)
+
+        all_cols.update(kwargs)
+        all_cols = {name: list(col) for name, col in all_cols.items()}
+        counts = set(len(col) for col in all_cols.values())
+
+        if len(counts) > 1:
+            raise ValueError(f"Cannot build a DotTable with columns of different lengths: {sorted(counts)}")
+
+        count = counts.pop() if len(counts) > 0 else 0
+        self._set_cols(all_cols, count)
+
+    def __len__(self):
+        """Finds the number of the rows.
+
+        Returns:
+            _: the number of the rows
+        """
+        return self._count
+
+    def __iter__(self):
+        """Iterates over the row views.
+
+        Yields:
+            row: a row view
+        """
+        for index in range(self._count):
+            yield DotTableRow(self, index)
+
+    def __contains__(self, name):
+        """Finds if a name is a column name.
+
+        Args:
+            name: a name
+
+        Returns:
+            _: whether the name is a column name
+        """
+        return name in self._cols
+
+    def __getitem__(self, key):
+        """Gets a column with a name, a row view with an index, or a new DotTable with a slice.
+
+        Args:
+            key: a column name, a row index, or a slice
+
+        Returns:
+            result: the column, the row view, or the new DotTable
+
+        Raises:
+            KeyError: if the key is a str, and there is no such a column
+            IndexError: if the key is an int, and the index is out of the range
+        """
+        if isinstance(key, str):
+            if key not in self._cols:
+                raise KeyError(f"DotTable has no column called: {key}")
+
+            result = self._cols[key]
+        elif isinstance(key, slice):
+            result = type(self)()
+            result._set_cols({name: col[key] for name, col in self._cols.items()}, len(range(self._count)[key]))
+        else:
+            result = DotTableRow(self, self._find_index(int(key)))
+        # end if
+
+        return result
+
+    def __setitem__(self, name, col):
+        """Sets a column with the given name to the given values.
+
+        Args:
+            name: a column name
+            col: an iterable of the column values
+
+        Raises:
+            ValueError: if the number of the values does not match the number of the rows
+        """
+        name = str(name)
+        col = _make_column(col)
+
+        # The first column of an empty table decides the number of the rows
+        if len(self._cols) <= 0:
+            object.__setattr__(self, "_count", len(col))
+
+        if len(col) != self._count:
+            raise ValueError(f"Cannot set a column of {len(col)} values to a DotTable of {self._count} rows")
+
+        self._cols[name] = col
+
+    def __delitem__(self, name):
+        """Deletes a column with the given name.
+
+        Args:
+            name: a column name
+
+        Raises:
+            KeyError: if there is no such a column
+        """
+        name = str(name)
+
+        if name not in self._cols:
+            raise KeyError(f"DotTable has no column called: {name}")
+
+        del self._cols[name]
+
+    def __getattr__(self, name):
+        """Gets a column with the given name.
+
+        Args:
+            name: a column name
+
+        Returns:
+            _: the column
+
+        Raises:
+            AttributeError: if there is no such a column
+        """
+        cols = self.__dict__.get("_cols", {})
+
+        if _is_col_name(name) and name in cols:
+            return cols[name]
+
+        raise AttributeError(f"DotTable has no attribute or column called: {name}")
+
+    def __setattr__(self, name, col):
+        """Sets a column with the given name to the given values.
+
+        Args:
+            name: a column name
+            col: an iterable of the column values
+
+        Raises:
+            AttributeError: if the name is not a column name with the "table.key" syntax
+        """
+        if not _is_col_name(name):
+            raise AttributeError(f"DotTable attribute is protected: {name}")
+
+        self.__setitem__(name, col)
+
+    def __delattr__(self, name):
+        """Deletes a column with the given name.
+
+        Args:
+            name: a column name
+
+        Raises:
+            AttributeError: if there is no such a column
+        """
+        if not (_is_col_name(name) and name in self._cols):
+            raise AttributeError(f"DotTable has no column called: {name}")
+
+        del self._cols[name]
+
+    def __eq__(self, other):
+        """Finds if self equals other, column by column.
+
+        Args:
+            other: the other object
+
+        Returns:
+            result: the equality
+        """
+        if not isinstance(other, DotTable):
+            return NotImplemented
+
+        result = self._count == other._count and list(self._cols) == list(other._cols)
+        result = result and all(list(col) == list(other._cols[name]) for name, col in self._cols.items())
+        return result
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        cols = {name: list(col) for name, col in self._cols.items()}
+        result = f"DotTable(**{cols!r})"
+        return result
+
+    def col_names____(self):
+        """Finds the column names.
+
+        Returns:
+            result: the tuple of the column names
+        """
+        result = tuple(self._cols)
+        return result
+
+    def append____(self, row):
+        """Appends a row to self.
+
+        A new key adds a column, with None for the previous rows. A missing key gives None.
+
+        Args:
+            row: the row, a dict (including DotDict) or Mapping
+        """
+        for key in row:
+            key = str(key)
+
+            if key not in self._cols:
+                self._cols[key] = [None] * self._count
+        # end for
+
+        for name, col in self._cols.items():
+            val = _conv_val(row.get(name))
+
+            if isinstance(col, _array) and type(val) is not _typecode_types[col.typecode]:
+                col = list(col)
+                self._cols[name] = col
+            # end if
+
+            col.append(val)
+        # end for
+
+        object.__setattr__(self, "_count", self._count + 1)
+
+    def extend____(self, rows):
+        """Appends the rows to self.
+
+        Args:
+            rows: an iterable of the rows, each a dict (including DotDict) or Mapping
+        """
+        for row in rows:
+            self.append____(row)
+
+    def apply____(self, func, *names):
+        """Applies a function to the values of the given columns, row by row, and returns the results as a column.
+
+        Args:
+            func: the function, which takes one value from each given column
+            *names: the column names
+
+        Returns:
+            result: the column of the results, an array.array or a list
+        """
+        cols = [self[name] for name in names]
+        result = _make_column(map(func, *cols))
+        return result
+
+    def filter____(self, pred, *names):
+        """Finds the rows whose values of the given columns satisfy a predicate, as a new DotTable.
+
+        Args:
+            pred: the predicate, which takes one value from each given column
+            *names: the column names
+
+        Returns:
+            result: the new DotTable
+        """
+        cols = [self[name] for name in names]
+        indices = [index for index, keep in enumerate(map(pred, *cols)) if keep]
+        result = self.take____(indices)
+        return result
+
+    def take____(self, indices):
+        """Finds the rows at the given indices, as a new DotTable.
+
+        Args:
+            indices: an iterable of the row indices
+
+        Returns:
+            result: the new DotTable
+        """
+        indices = [self._find_index(int(index)) for index in indices]
+        cols = {}
+
+        for name, col in self._cols.items():
+            vals = [col[index] for index in indices]
+            cols[name] = _array(col.typecode, vals) if isinstance(col, _array) else vals
+        # end for
+
+        result = type(self)()
+        object.__setattr__(result, "_cols", cols)
+        object.__setattr__(result, "_count", len(indices))
+        return result
+
+    def sort____(self, *names, reverse=False):
+        """Finds the rows sorted by the values of the given columns, as a new DotTable.
+
+        Args:
+            *names: the column names, in the sort key order
+            reverse: whether to sort in the descending order
+
+        Returns:
+            result: the new DotTable
+        """
+        cols = [self[name] for name in names]
+
+        if len(cols) == 1:
+            key = cols[0].__getitem__
+        else:
+            keys = list(zip(*cols))
+            key = keys.__getitem__
+        # end if
+
+        indices = sorted(range(self._count), key=key, reverse=reverse)
+        result = self.take____(indices)
+        return result
+
+    def to_numpy____(self, name):
+        """Finds a NumPy array of a column.
+
+        A typed array.array column is shared with the NumPy array, without a copy.
+
+        Args:
+            name: the column name
+
+        Returns:
+            result: the NumPy array
+
+        Raises:
+            ImportError: if NumPy is not available
+        """
+        if _numpy is None:
+            raise ImportError("DotTable.to_numpy____ requires NumPy")
+
+        col = self[name]
+
+        if isinstance(col, _array):
+            result = _numpy.frombuffer(col, dtype=col.typecode)
+        else:
+            result = _numpy.asarray(col)
+        # end if
+
+        return result
+
+    def to_rows____(self, schema=None):
+        """Finds a list of DotDicts, one per row.
+
+        Like in the DotDict from_dict____ method, the exceptional keys are skipped.
+
+        With a schema, which is a DotDict subclass with class-level defaults, the rows are schema instances with the
+            schema fields only, and a field missing from the columns is the field default. The rows are filled in
+            bulk, as in the instance initialization with the class-level default template, with the nested dicts in
+            the columns as they are.
+
+        Args:
+            schema: a DotDict subclass, or None
+
+        Returns:
+            result: the list of DotDicts
+        """
+        result = []
+
+        if schema is None:
+            names = tuple(self._cols)
+
+            # The nested dicts in the columns are DotDicts already
+            for vals in zip(*self._cols.values()):
+                result.append(_DotDict.from_pairs____(zip(names, vals)))
+
+            return result
+        # end if
+
+        defaults, dict_names = schema.defaults____()
+        names = tuple(name for name in defaults if name in self._cols)
+        cols = [self._cols[name] for name in names]
+        missing = {name: val for name, val in defaults.items() if name not in self._cols}
+        missing_dict_names = tuple(name for name in dict_names if name in missing)
+
+        for vals in zip(*cols):
+            row = _dict_new(schema)
+            attrs = dict(zip(names, vals))
+
+            if len(missing) > 0:
+                attrs.update(missing)
+
+                for name in missing_dict_names:
+                    attrs[name] = _DotDict.from_dict____(missing[name])
+            # end if
+
+            _dict_setitem_all(row, attrs)
+            row.__dict__.update(attrs)
+            result.append(row)
+        # end for
+
+        # Without any columns, the rows are all defaults
+        if len(cols) <= 0:
+            result = [schema() for _ in range(self._count)]
+
+        return result
+
+    def to_struct_array____(self):
+        """Finds a NumPy structured array of self, with one field per column.
+
+        The field dtypes are inferred from the columns: "i8" and "f8" for the typed array.array columns, "?" for the
+            bool columns, "U" with the max length for the str columns, and "O" for the other columns. The typed
+            array.array columns are copied in bulk, without going through the values one by one.
+
+        Returns:
+            result: the NumPy structured array
+
+        Raises:
+            ImportError: if NumPy is not available
+        """
+        if _numpy is None:
+            raise ImportError("DotTable.to_struct_array____ requires NumPy")
+
+        dtype = []
+
+        for name, col in self._cols.items():
+            if isinstance(col, _array):
+                kind = _typecode_kinds[col.typecode]
+            else:
+                types = set(map(type, col))
+
+                if types == {bool}:
+                    kind = "?"
+                elif types == {str}:
+                    kind = f"U{max(1, max(map(len, col)))}"
+                else:
+                    kind = "O"
+                # end if
+            # end if
+
+            dtype.append((name, kind))
+        # end for
+
+        result = _numpy.empty(self._count, dtype=dtype)
+
+        for name, col in self._cols.items():
+            if isinstance(col, _array):
+                result[name] = _numpy.frombuffer(col, dtype=col.typecode)
+            else:
+                result[name] = col
+            # end if
+        # end for
+
+        return result
+
+    @classmethod
+    def from_struct_array____(cls, struct_array):
+        """Builds and returns a DotTable from a NumPy structured array, with one column per field.
+
+        The int and float fields are copied in bulk to typed array.array columns, and the other fields are converted
+            to lists of Python values.
+
+        Args:
+            struct_array: a 1-dimensional NumPy structured array
+
+        Returns:
+            result: the DotTable
+        """
+        cols = {}
+
+        for name in struct_array.dtype.names:
+            field = struct_array[name]
+            typecode = _kind_typecodes.get(field.dtype.kind)
+
+            if typecode is not None:
+                cols[name] = _array(typecode, field.astype(typecode).tobytes())
+            else:
+                cols[name] = [_DotDict.from_dict____(val) if type(val) is dict else val for val in field.tolist()]
+            # end if
+        # end for
+
+        result = cls()
+        object.__setattr__(result, "_cols", cols)
+        object.__setattr__(result, "_count", len(struct_array))
+        return result
+
+    def save_json_lines____(self, to_file):
+        """Saves self to a JSON Lines file, with one JSON object per row.
+
+        Args:
+            to_file: the JSON Lines file location
+        """
+        to_file = str(to_file)
+
+        names = tuple(self._cols)
+        buf = []
+        buf_size = 0
+
+        file = open(to_file, "w+")
+
+        for vals in zip(*self._cols.values()):
+            line = f"{_jsondumps(dict(zip(names, vals)))}\n"
+            buf.append(line)
+            buf_size += len(line)
+
+            if buf_size >= _stream_buf_size:
+                file.write("".join(buf))
+                buf.clear()
+                buf_size = 0
+            # end if
+        # end for
+
+        if buf_size > 0:
+            file.write("".join(buf))
+
+        file.close()
+
+
+class DotTableRow(_Mapping):
+    """Dot table row.
+
+    A view of a DotTable row, which reads and writes the table columns in place. The values can be accessed with the
+        "row.key" syntax, except for the private names and the names with 4 trailing underscores, and with the
+        "row[key]" syntax, as in a DotDict.
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        """Inits self with the given table and row index.
+
+        Args:
+            table: the DotTable
+            index: the non-negative row index
+        """
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_index", index)
+
+    def __getitem__(self, key):
+        """Gets a value with the given key.
+
+        Args:
+            key: a column name
+
+        Returns:
+            _: the value
+
+        Raises:
+            KeyError: if there is no such a column
+        """
+        return self._table[str(key)][self._index]
+
+    def __setitem__(self, key, val):
+        """Sets a value with the given key.
+
+        Args:
+            key: a column name
+            val: the value
+
+        Raises:
+            KeyError: if there is no such a column
+        """
+        key = str(key)
+
+        if key not in self._table:
+            raise KeyError(f"DotTable has no column called: {key}")
+
+        self._table._set_cell(key, self._index, val)
+
+    def __getattr__(self, name):
+        """Gets a value with the given name.
+
+        Args:
+            name: a column name
+
+        Returns:
+            _: the value
+
+        Raises:
+            AttributeError: if there is no such a column
+        """
+        if _is_col_name(name) and name in self._table:
+            return self._table._cols[name][self._index]
+
+        raise AttributeError(f"DotTableRow has no attribute or column called: {name}")
+
+    def __setattr__(self, name, val):
+        """Sets a value with the given name.
+
+        Args:
+            name: a column name
+            val: the value
+
+        Raises:
+            AttributeError: if there is no such a column
+        """
+        if not (_is_col_name(name) and name in self._table):
+            raise AttributeError(f"DotTableRow has no column called: {name}")
+
+        self._table._set_cell(name, self._index, val)
+
+    def __iter__(self):
+        """Iterates over the column names.
+
+        Returns:
+            _: the column name iterator
+        """
+        return iter(self._table._cols)
+
+    def __len__(self):
+        """Finds the number of the columns.
+
+        Returns:
+            _: the number of the columns
+        """
+        return len(self._table._cols)
+
+    def __repr__(self):
+        """Finds the Python representation of self.
+
+        Returns:
+            result: self's Python representation
+        """
+        result = f"DotTableRow(**{dict(self.items())!r})"
+        return result
+
+    def to_dotdict____(self):
+        """Finds a DotDict copy of self.
+
+        Returns:
+            result: the DotDict
+        """
+        result = _DotDict()
+        result._set_items(self.items())
+        return result
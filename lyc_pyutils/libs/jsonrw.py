@@ -8,12 +8,18 @@
 
 import json
 
-_jsondump = json.dump
+from lyc_pyutils.libs import dotdict
+
+_DotDict = dotdict.DotDict
 _jsondumps = json.dumps
 _jsonload = json.load
 _jsonloads = json.loads
+_JSONEncoder = json.JSONEncoder
 _NoneType = type(None)
 
+_stream_buf_size = 65536
+"""The number of characters to buffer before each write to a JSON stream."""
+
 
 def load_json(from_file):
     """Loads the data from a JSON file to an object and returns the object.
@@ -57,6 +63,48 @@ def load_json(from_file):
     return result
 
 
+def load_json_dotdict(from_file):
+    """Loads the data from a JSON file to an object and returns the object, with the JSON objects as DotDicts.
+
+    The DotDicts are built during the parsing, in a single pass.
+
+    Args:
+        from_file: the JSON file location
+
+    Returns:
+        result: the object
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    from_file = str(from_file)
+
+    file = open(from_file, "r")
+    obj = _jsonload(file, object_pairs_hook=_DotDict.from_pairs____)
+    file.close()
+
+    if isinstance(obj, (_DotDict, list)):
+        result = obj
+    elif isinstance(obj, str):
+        result = str(obj)
+    elif isinstance(obj, bool):
+        result = bool(obj)
+    elif isinstance(obj, int):
+        result = int(obj)
+    elif isinstance(obj, float):
+        result = float(obj)
+    elif isinstance(obj, _NoneType):
+        result = None
+    else:
+        result = None
+    # end if
+
+    return result
+
+
 def save_json(from_obj, to_file):
     """Saves the data from an object to a JSON file.
 
@@ -70,10 +118,31 @@ def save_json(from_obj, to_file):
     # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
     # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
 
-    if isinstance(from_obj, dict):
-        from_obj = dict(from_obj)
-    elif isinstance(from_obj, list):
-        from_obj = list(from_obj)
+    to_file = str(to_file)
+
+    file = open(to_file, "w+")
+    save_json_stream(from_obj, file)
+    file.close()
+
+
+def save_json_stream(from_obj, to_stream):
+    """Saves the data from an object to a JSON stream, chunk by chunk.
+
+    The dicts (including DotDicts) and lists are encoded as they are, without copies. The encoded chunks are
+        buffered and written to the stream in batches.
+
+    Args:
+        from_obj: the object
+        to_stream: the JSON stream, a writable text file object
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    if isinstance(from_obj, (dict, list)):
+        pass
     elif isinstance(from_obj, str):
         from_obj = str(from_obj)
     elif isinstance(from_obj, bool):
@@ -88,13 +157,87 @@ def save_json(from_obj, to_file):
         from_obj = None
     # end if
 
+    encoder = _JSONEncoder(indent=4)
+    buf = []
+    buf_size = 0
+
+    for chunk in encoder.iterencode(from_obj):
+        buf.append(chunk)
+        buf_size += len(chunk)
+
+        if buf_size >= _stream_buf_size:
+            to_stream.write("".join(buf))
+            buf.clear()
+            buf_size = 0
+        # end if
+    # end for
+
+    if buf_size > 0:
+        to_stream.write("".join(buf))
+
+
+def append_json_patch(ops, to_file):
+    """Appends the patch operations to a JSON Lines patch log file, one operation per line.
+
+    Each line is a JSON array of the operation name, the path, and the value, like ["change", ["a", "b"], 1]. See
+        the DotDict diff____ and checkpoint____ methods for the operations.
+
+    Args:
+        ops: an iterable of the operations, each a tuple of the operation name, the path, and the value
+        to_file: the patch log file location
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
     to_file = str(to_file)
 
-    file = open(to_file, "w+")
-    _jsondump(from_obj, file, indent=4)
+    lines = [f"{_jsondumps([op, list(path), val])}\n" for op, path, val in ops]
+
+    if len(lines) <= 0:
+        return
+
+    file = open(to_file, "a")
+    file.write("".join(lines))
     file.close()
 
 
+def load_json_patch(from_file):
+    """Loads the patch operations from a JSON Lines patch log file and returns the operations.
+
+    The JSON objects in the values are loaded as DotDicts. See the append_json_patch function.
+
+    Args:
+        from_file: the patch log file location
+
+    Returns:
+        result: the list of the operations, each a tuple of the operation name, the path tuple, and the value
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    from_file = str(from_file)
+
+    result = []
+    file = open(from_file, "r")
+
+    for line in file:
+        if len(line.strip()) <= 0:
+            continue
+
+        op, path, val = _jsonloads(line, object_pairs_hook=_DotDict.from_pairs____)
+        result.append((str(op), tuple(path), val))
+    # end for
+
+    file.close()
+    return result
+
+
 def load_json_str(from_str):
     """Loads the data from a JSON string to an object and returns the object.
 
@@ -135,6 +278,46 @@ def load_json_str(from_str):
     return result
 
 
+def load_json_str_dotdict(from_str):
+    """Loads the data from a JSON string to an object and returns the object, with the JSON objects as DotDicts.
+
+    The DotDicts are built during the parsing, in a single pass.
+
+    Args:
+        from_str: the JSON string
+
+    Returns:
+        result: the object
+    """
+
+    # Part of LYC-PythonUtils
+    # Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+    # GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+    # GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+
+    from_str = str(from_str)
+
+    obj = _jsonloads(from_str, object_pairs_hook=_DotDict.from_pairs____)
+
+    if isinstance(obj, (_DotDict, list)):
+        result = obj
+    elif isinstance(obj, str):
+        result = str(obj)
+    elif isinstance(obj, bool):
+        result = bool(obj)
+    elif isinstance(obj, int):
+        result = int(obj)
+    elif isinstance(obj, float):
+        result = float(obj)
+    elif isinstance(obj, _NoneType):
+        result = None
+    else:
+        result = None
+    # end if
+
+    return result
+
+
 def save_json_str(from_obj):
     """Saves the data from an object to a JSON string and return the string
 
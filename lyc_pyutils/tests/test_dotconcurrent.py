@@ -0,0 +1,238 @@
+"""Executable that tests the dot concurrent utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import os
+import pathlib
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+_IO = typing.IO
+_join = ospath.join
+_makedirs = os.makedirs
+_Path = pathlib.Path
+_TestCase = unittest.TestCase
+
+_LYCConcurrentDotDict = lyc_pyutils.ConcurrentDotDict
+_LYCFrozenDotDict = lyc_pyutils.FrozenDotDict
+_LYCFuncThread = lyc_pyutils.FuncThread
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestConcurrentDotDict(_BaseCase):
+    """Tests for the ConcurrentDotDict class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        dict_ = _LYCConcurrentDotDict(a1={"a1": 1, "a2": {"a1": 2}}, a2={"a1": 3})
+        version = dict_.snapshot____()
+        dict_.set_path____("a1.a1", 4)
+        dict_.a3 = [1, {"a1": 5}]
+
+        not_match_info = str(
+            f"ConcurrentDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"ConcurrentDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        new_version = dict_.snapshot____()
+
+        actual = [
+            version.a1.a1, dict_.a1.a1, dict_["a3"][1].a1, type(new_version).__name__,
+            new_version.a2 is version.a2, new_version.a1.a2 is version.a1.a2
+        ]
+
+        expect = [1, 4, 5, _LYCFrozenDotDict.__name__, True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dict_.update____({"a4": 6}, a5=7)
+        del dict_.a3
+        dict_.apply_patch____([("add", ("a2", "a2"), 8), ("remove", ("a4",), None)])
+
+        actual = dict_
+        expect = {"a1": {"a1": 4, "a2": {"a1": 2}}, "a2": {"a1": 3, "a2": 8}, "a5": 7}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A failed patch publishes nothing
+        version = dict_.snapshot____()
+
+        try:
+            dict_.apply_patch____([("change", ("a5",), 9), ("remove", ("a6",), None)])
+            actual = False
+        except KeyError:
+            actual = dict_.snapshot____() is version
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            dict_.items = 1
+            actual = False
+        except AttributeError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # The exceptional keys stored through the item syntax survive the later writes
+        dict_["_a6"] = 9
+        dict_["items"] = 10
+        dict_.set_path____("a2._a3", 11)
+        dict_.set_path____("a2.a4", 12)
+        dict_.a7 = 13
+
+        actual = [dict(dict_.snapshot____()), dict(dict_["a2"])]
+
+        expect = [
+            {"a1": dict_["a1"], "a2": dict_["a2"], "a5": 7, "_a6": 9, "items": 10, "a7": 13},
+            {"a1": 3, "a2": 8, "_a3": 11, "a4": 12}
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_threads(self):
+        """Tests the multi-thread use case."""
+        method_name = self.test_threads.__name__
+        self._log_method_start(method_name)
+
+        dict_ = _LYCConcurrentDotDict(a1={"a1": 0, "a2": 0})
+
+        def read():
+            torn_count = 0
+
+            for _ in range(2000):
+                version = dict_.snapshot____()
+                torn_count += int(version.a1.a1 != version.a1.a2)
+            # end for
+
+            return torn_count
+
+        def write(count):
+            for index in range(count):
+                dict_.apply_patch____([("change", ("a1", "a1"), index), ("change", ("a1", "a2"), index)])
+
+        threads = [_LYCFuncThread(target=read) for _ in range(4)]
+        threads += [_LYCFuncThread(target=write, args=(200,)) for _ in range(2)]
+
+        for thread in threads:
+            thread.start()
+
+        torn_counts = [thread.join() for thread in threads[:4]]
+
+        for thread in threads[4:]:
+            thread.join()
+
+        not_match_info = str(
+            f"ConcurrentDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"ConcurrentDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [torn_counts, dict_.a1.a1, dict_.a1.a2]
+        expect = [[0, 0, 0, 0], 199, 199]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
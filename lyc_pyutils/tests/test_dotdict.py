@@ -6,8 +6,10 @@
 # First added by username: liu-yucheng
 # Last updated by username: liu-yucheng
 
+import io
 import os
 import pathlib
+import pickle
 # import shutil
 import typing
 import unittest
@@ -16,15 +18,24 @@ from os import path as ospath
 
 import lyc_pyutils
 
+from lyc_pyutils.libs import dotdict
+
 # _copytree = shutil.copytree
 _IO = typing.IO
+_StringIO = io.StringIO
 _join = ospath.join
 _makedirs = os.makedirs
 _Path = pathlib.Path
+_pickle_dumps = pickle.dumps
+_pickle_loads = pickle.loads
 # _rmtree = shutil.rmtree
 _TestCase = unittest.TestCase
 
 _LYCDotDict = lyc_pyutils.DotDict
+_LYCFrozenDotDict = lyc_pyutils.FrozenDotDict
+_LYCDotRecord = lyc_pyutils.DotRecord
+_lyc_exc_keys = dotdict._exc_keys
+_lyc_exc_keys_cap = dotdict._exc_keys_cap
 
 _tests_path = _Path(__file__).parent
 _repo_path = _Path(_tests_path).parent.parent
@@ -44,6 +55,13 @@ def _dquote_repr(instr):
     return result
 
 
+class _RecordConfig(_LYCDotDict):
+    """A DotDict class with declared fields, at the module level for pickling."""
+
+    a1 = 1
+    a2 = {"a1": True}
+
+
 class _BaseCase(_TestCase):
 
     def __init__(self, methodName):
@@ -170,6 +188,805 @@ class TestDotdict(_BaseCase):
 
         self._log_method_end(method_name)
 
+    def test_class_attr(self):
+        """Tests the class-level attribute use case."""
+        method_name = self.test_class_attr.__name__
+        self._log_method_start(method_name)
+
+        class _Config(_LYCDotDict):
+            a1 = 1
+
+        dotdict = _Config()
+        dotdict.a1 = 2
+        dotdict.set_class_attr____("a2", True)
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dotdict.a1
+        expect = 2
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = dotdict["a2"]
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = _Config().to_dict____()
+        expect = {"a1": 1, "a2": True}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dotdict.a2 = False
+        dotdict.del_class_attr____("a2")
+
+        actual = "a2" in dotdict or hasattr(_Config, "a2")
+        expect = False
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A class-level attribute set directly on the class is mirrored too
+        _Config.a3 = 5
+        dotdict.a3 = 7
+
+        actual = [dotdict.a3, dotdict["a3"]]
+        expect = [7, 7]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A subclass that overrides the get_attr____ method has its "dict.key" reads routed through it
+        class _LowerConfig(_LYCDotDict):
+            def get_attr____(self, name):
+                return super().get_attr____(name.lower())
+
+        actual = [_LowerConfig(a4=1).A4, hasattr(dotdict, "a4"), hasattr(_LowerConfig(), "a4")]
+        expect = [1, False, False]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_exc_key(self):
+        """Tests the memoized exceptional key classification use case."""
+        method_name = self.test_exc_key.__name__
+        self._log_method_start(method_name)
+
+        class _Config(_LYCDotDict):
+            pass
+
+        keys = ["a1", "_a1", "__a1__", "a1____", "items", "a1__", "keys1"]
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        # The second classifications are memo hits
+        expect = [False, True, True, True, True, False, False]
+
+        actual = [_Config.is_exc_key____(key) for key in keys]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [_Config.is_exc_key____(key) for key in keys]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = set(keys) <= set(_lyc_exc_keys[_Config])
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # The memo starts over when it is full, and the classifications stay correct
+        many = [f"_k{index}" if index % 2 else f"k{index}" for index in range(_lyc_exc_keys_cap * 2 + 10)]
+        expect = [key[:1] == "_" for key in many]
+
+        actual = [_Config.is_exc_key____(key) for key in many]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [_Config.is_exc_key____(key) for key in reversed(many)]
+        expect.reverse()
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [len(_lyc_exc_keys[_Config]) <= _lyc_exc_keys_cap, [_Config.is_exc_key____(key) for key in keys]]
+        expect = [True, [False, True, True, True, True, False, False]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A changed dir_dict_excs____ takes effect after the memo is cleared
+        _Config.dir_dict_excs____ = _LYCDotDict.dir_dict_excs____ | {"a1"}
+        _Config.clear_exc_keys____()
+
+        actual = [len(_lyc_exc_keys), _Config.is_exc_key____("a1"), _LYCDotDict.is_exc_key____("a1")]
+        expect = [0, True, False]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_lazy(self):
+        """Tests the lazy mode use case."""
+        method_name = self.test_lazy.__name__
+        self._log_method_start(method_name)
+
+        dict_ = {"a1": 1, "a2": {"a1": {"a1": True}}}
+        dotdict = _LYCDotDict.from_dict____(dict_, lazy=True)
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dict.__getitem__(dotdict, "a2") is dict_["a2"]
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = dotdict.a2.a1.a1
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = type(dict.__getitem__(dotdict, "a2")).__name__
+        expect = _LYCDotDict.__name__
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = dotdict.to_dict____()
+        expect = dict_
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_deep(self):
+        """Tests the deep and shared nesting use case."""
+        method_name = self.test_deep.__name__
+        self._log_method_start(method_name)
+
+        depth = 5000
+        dict_ = {}
+        leaf = dict_
+
+        for _ in range(depth):
+            leaf["a1"] = {}
+            leaf = leaf["a1"]
+        # end for
+
+        shared = {"a1": 1}
+        dict_["a2"] = shared
+        dict_["a3"] = shared
+
+        dotdict = _LYCDotDict.from_dict____(dict_)
+        result = dotdict.to_dict____()
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dotdict.a2 is dotdict.a3
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = result["a2"] is result["a3"]
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = 0
+        leaf = result
+
+        while len(leaf["a1"]) > 0:
+            leaf = leaf["a1"]
+            actual += 1
+        # end while
+
+        expect = depth - 1
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_alias(self):
+        """Tests the aliased and self-referencing nesting use case."""
+        method_name = self.test_alias.__name__
+        self._log_method_start(method_name)
+
+        shared = {"a1": 1}
+        dict_ = {"a1": {"a1": shared}, "a2": {"a1": shared}}
+        dict_["a3"] = dict_
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        dotdict = _LYCDotDict.from_dict____(dict_, lazy=True)
+        result = dotdict.to_dict____()
+
+        actual = [dotdict.a1.a1 is dotdict.a2.a1, dotdict.a3 is dotdict, result["a3"] is result]
+        expect = [True, True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dotdict = _LYCDotDict.unflatten____({"a1.a1": 1, "a2": shared, "a3": shared})
+
+        actual = [dotdict.a2 is dotdict.a3, type(dotdict.a2).__name__]
+        expect = [True, _LYCDotDict.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        del dict_["a3"]
+        frozen = _LYCFrozenDotDict(dict_)
+
+        actual = [frozen.a1.a1 is frozen.a2.a1, type(frozen.a1.a1).__name__]
+        expect = [True, _LYCFrozenDotDict.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_pickle(self):
+        """Tests the pickling use case."""
+        method_name = self.test_pickle.__name__
+        self._log_method_start(method_name)
+
+        dotdict = _LYCDotDict.from_dict____({"a1": 1, "a2": {"a1": [1, 2]}})
+        dotdict.a3 = dotdict.a2
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        for protocol in (0, 2, 5):
+            loaded = _pickle_loads(_pickle_dumps(dotdict, protocol=protocol))
+
+            actual = loaded
+            expect = dotdict
+            self._match_values(actual, expect, not_match_info, match_info)
+
+            actual = type(loaded.a2).__name__
+            expect = _LYCDotDict.__name__
+            self._match_values(actual, expect, not_match_info, match_info)
+
+            actual = loaded.a2 is loaded.a3
+            expect = True
+            self._match_values(actual, expect, not_match_info, match_info)
+        # end for
+
+        self._log_method_end(method_name)
+
+    def test_snapshot(self):
+        """Tests the copy-on-write snapshot use case."""
+        method_name = self.test_snapshot.__name__
+        self._log_method_start(method_name)
+
+        base = _LYCDotDict.from_dict____({"a1": {"a1": 1}, "a2": {"a1": 2}})
+        snapshot = base.snapshot____()
+        snapshot.a1.a1 = 3
+        base.a2.a1 = 4
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = base.to_dict____()
+        expect = {"a1": {"a1": 1}, "a2": {"a1": 4}}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = snapshot.to_dict____()
+        expect = {"a1": {"a1": 3}, "a2": {"a1": 2}}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        a3 = _LYCDotDict()
+        snapshot.a3 = a3
+
+        actual = snapshot.a3 is a3
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        base = _RecordConfig()
+        snapshot = base.snapshot____()
+        snapshot.a2.a1 = False
+
+        actual = [base.a2.a1, snapshot.a2.a1, base.a2 is base["a2"], snapshot.a2 is snapshot["a2"]]
+        expect = [True, False, True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dict_ = {"a1": {"a1": 1}}
+        base = _LYCDotDict.from_dict____(dict_, lazy=True)
+        snapshot = base.snapshot____()
+        base.a1
+        snapshot.a1.a1 = 2
+
+        actual = [base.a1.a1, snapshot.a1.a1, base.a1 is snapshot.a1, dict_]
+        expect = [1, 2, False, {"a1": {"a1": 1}}]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_deep_update(self):
+        """Tests the deep update and merge use case."""
+        method_name = self.test_deep_update.__name__
+        self._log_method_start(method_name)
+
+        override = {"a2": {"a2": 3}, "a3": {"a1": None}}
+        dotdict = _LYCDotDict.from_dict____({"a1": 1, "a2": {"a1": True, "a2": 2}})
+        dotdict.deep_update____(override, a1={"a1": 1})
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dotdict.to_dict____()
+        expect = {"a1": {"a1": 1}, "a2": {"a1": True, "a2": 3}, "a3": {"a1": None}}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = type(dotdict.a3).__name__
+        expect = _LYCDotDict.__name__
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        merged = _LYCDotDict.merge____({"a1": {"a1": 1}}, {"a1": {"a2": 2}}, override)
+        merged.a3.a1 = False
+
+        actual = merged.to_dict____()
+        expect = {"a1": {"a1": 1, "a2": 2}, "a2": {"a2": 3}, "a3": {"a1": False}}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = override["a3"]["a1"]
+        expect = None
+        self._match_values(_dquote_repr(actual), _dquote_repr(expect), not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_path(self):
+        """Tests the dotted path use case."""
+        method_name = self.test_path.__name__
+        self._log_method_start(method_name)
+
+        dotdict = _LYCDotDict.from_dict____({"a1": {"a1": [1, {"a1": 2}]}, "a2": 3})
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dotdict.get_path____("a1.a1[1].a1")
+        expect = 2
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = dotdict.get_paths____(["a2", ("a1", "a1", 0)])
+        expect = [3, 1]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dotdict.set_path____("a1.a1[1].a1", 4)
+        dotdict.set_path____("a1.a2", {"a1": 5})
+
+        actual = dotdict.a1.a1[1]["a1"] + dotdict.a1.a2.a1
+        expect = 9
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            dotdict.get_path____("a1..a1")
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_flatten(self):
+        """Tests the flatten and unflatten use case."""
+        method_name = self.test_flatten.__name__
+        self._log_method_start(method_name)
+
+        dict_ = {"a1": {"a1": {"a1": 1}, "a2": [2]}, "a2": 3}
+        dotdict = _LYCDotDict.from_dict____(dict_)
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = dotdict.flatten____()
+        expect = {"a1.a1.a1": 1, "a1.a2": [2], "a2": 3}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = _LYCDotDict.unflatten____(dotdict.flatten____("/"), sep="/").to_dict____()
+        expect = dict_
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            _LYCDotDict.unflatten____({"a1": 1, "a1.a1": 2})
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_diff(self):
+        """Tests the diff and patch use case."""
+        method_name = self.test_diff.__name__
+        self._log_method_start(method_name)
+
+        dotdict1 = _LYCDotDict.from_dict____({"a1": {"a1": 1, "a2": {"a1": 2}}, "a2": 3, "a3": 4})
+        dotdict2 = _LYCDotDict.from_dict____({"a1": {"a1": 5, "a2": {"a1": 2}}, "a2": {"a1": 6}, "a4": 7})
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = list(dotdict1.diff____(dotdict2))
+
+        expect = [
+            ("change", ("a1", "a1"), 5),
+            ("change", ("a2",), {"a1": 6}),
+            ("remove", ("a3",), None),
+            ("add", ("a4",), 7)
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dotdict3 = dotdict1.snapshot____()
+        dotdict3.apply_patch____(actual)
+
+        actual = [dotdict3 == dotdict2, dotdict1.a1.a1, list(dotdict3.diff____(dotdict2))]
+        expect = [True, 1, []]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        frozen1 = _LYCFrozenDotDict.from_dict____(dotdict1)
+        frozen2 = _LYCFrozenDotDict.from_dict____(dotdict1.to_dict____())
+
+        actual = list(frozen1.diff____(frozen2))
+        expect = []
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_track(self):
+        """Tests the change tracking use case."""
+        method_name = self.test_track.__name__
+        self._log_method_start(method_name)
+
+        dotdict = _LYCDotDict.from_dict____({"a1": {"a1": 1, "a2": {"a1": 2}}, "a2": 3, "a3": 4})
+        replica = _LYCDotDict.from_dict____(dotdict.to_dict____())
+        dotdict.track____()
+
+        dotdict.a1.a1 += 1
+        dotdict.a1.a1 += 1
+        dotdict["a1"]["a2"]["a2"] = 5
+        del dotdict.a3
+        dotdict.a4 = {"a1": 6}
+        dotdict.a4.a1 = 7
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        ops = dotdict.checkpoint____()
+        actual = ops
+
+        expect = [
+            ("change", ("a1", "a1"), 3),
+            ("add", ("a1", "a2", "a2"), 5),
+            ("remove", ("a3",), None),
+            ("add", ("a4",), {"a1": 7})
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        replica.apply_patch____(ops)
+        actual = [replica == dotdict, dotdict.changes____()]
+        expect = [True, []]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A replaced DotDict no longer records to its old place
+        old_a1 = dotdict.a1
+        dotdict.a1 = 8
+        old_a1.a1 = 9
+
+        actual = dotdict.changes____()
+        expect = [("change", ("a1",), 8)]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_str(self):
+        """Tests the string representation use case."""
+        method_name = self.test_str.__name__
+        self._log_method_start(method_name)
+
+        dotdict = _LYCDotDict.from_dict____({"a1": {"a1": {"a1": 1}, "a2": [1, 2, 3]}, "a2": {}, "a3": "x"})
+        stream = _StringIO()
+        char_count = dotdict.write_str____(stream)
+
+        not_match_info = str(
+            f"DotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        full_str = ".{a1: .{a1: .{a1: 1}, a2: [1, 2, 3]}, a2: .{}, a3: 'x'}"
+        actual = [str(dotdict), stream.getvalue(), char_count, str(_LYCDotDict())]
+        expect = [full_str, full_str, len(full_str), ".{}"]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [
+            dotdict.str____(max_depth=2),
+            dotdict.str____(max_items=2),
+            dotdict.str____(max_chars=10)
+        ]
+
+        expect = [
+            ".{a1: .{a1: .{...}, a2: [1, 2, 3]}, a2: .{}, a3: 'x'}",
+            ".{a1: .{a1: .{a1: 1}, a2: [1, 2, ...]}, a2: .{}, ...}",
+            full_str[:7] + "..."
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A DotDict nested in itself is written once
+        dotdict.a1.a1.a2 = dotdict
+
+        actual = str(dotdict)
+        expect = ".{a1: .{a1: .{a1: 1, a2: .{...}}, a2: [1, 2, 3]}, a2: .{}, a3: 'x'}"
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # Writing copies nothing from a snapshot, and converts nothing in a lazy DotDict
+        base = _LYCDotDict.from_dict____({"a1": {"a1": 1}})
+        snapshot = base.snapshot____()
+        dict_ = {"a1": {"a1": 1, "_a2": 2}}
+        lazy = _LYCDotDict.from_dict____(dict_, lazy=True)
+
+        actual = [
+            str(snapshot), dict.__getitem__(snapshot, "a1") is dict.__getitem__(base, "a1"),
+            str(lazy), dict.__getitem__(lazy, "a1") is dict_["a1"], len(str(base)), len(base.str____(max_chars=8))
+        ]
+
+        expect = [".{a1: .{a1: 1}}", True, ".{a1: .{a1: 1}}", True, 15, 8]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+class TestFrozenDotDict(_BaseCase):
+    """Tests for the FrozenDotDict class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        dict_ = {"a1": 1, "a2": {"a1": [1, {"a1": True}]}}
+        frozen1 = _LYCFrozenDotDict.from_dict____(dict_)
+        frozen2 = _LYCFrozenDotDict(dict_)
+        frozen3 = _LYCFrozenDotDict(a1=2)
+
+        not_match_info = str(
+            f"FrozenDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"FrozenDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = frozen1.a2.a1[1].a1
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = hash(frozen1) == hash(frozen2) and frozen1 == frozen2
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = {frozen1: 1, frozen3: 3}[frozen2]
+        expect = 1
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = frozen1 == frozen3
+        expect = False
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            frozen1.a2.a2 = 2
+            actual = False
+        except TypeError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = "a2" in frozen1.a2
+        expect = False
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+class TestDotRecord(_BaseCase):
+    """Tests for the DotRecord class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        record_class = _RecordConfig.record_class____()
+        record1 = record_class(a1=2)
+        record2 = record_class()
+        record2["a1"] = 3
+        record2.a2.a1 = False
+
+        not_match_info = str(
+            f"DotRecord content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotRecord content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [issubclass(record_class, _LYCDotRecord), record_class is _RecordConfig.record_class____()]
+        expect = [True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [record1.a1, record1["a2"].a1, record2.a1, record2.a2.a1]
+        expect = [2, True, 3, False]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [hasattr(record1, "__dict__"), list(record1), len(record1)]
+        expect = [False, ["a1", "a2"], 2]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = _pickle_loads(_pickle_dumps(record2))
+        expect = record2
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [type(record2.to_dotdict____()).__name__, record2.to_dict____()]
+        expect = [_RecordConfig.__name__, {"a1": 3, "a2": {"a1": False}}]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            record1.a3 = 4
+            actual = False
+        except AttributeError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            record1["a3"] = 4
+            actual = False
+        except KeyError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A class-level change keeps the record classes, and refreshes the defaults of the changed class only
+        class _Config(_LYCDotDict):
+            a1 = 1
+
+        config_record_class = _Config.record_class____()
+        record3 = config_record_class()
+        _Config.a1 = 2
+        _LYCDotDict.clear_dir_names____()
+
+        actual = [
+            isinstance(record1, _RecordConfig.record_class____()), isinstance(record3, _Config.record_class____()),
+            record3.a1, config_record_class().a1
+        ]
+
+        expect = [True, True, 1, 2]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        _Config.a2 = 3
+
+        actual = [config_record_class is _Config.record_class____(), list(_Config.record_class____()())]
+        expect = [False, ["a1", "a2"]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
 
 def main():
     """Runs this module as an executable."""
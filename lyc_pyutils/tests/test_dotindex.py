@@ -0,0 +1,230 @@
+"""Executable that tests the dot index utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import os
+import pathlib
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+_IO = typing.IO
+_join = ospath.join
+_makedirs = os.makedirs
+_Path = pathlib.Path
+_TestCase = unittest.TestCase
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCDotIndex = lyc_pyutils.DotIndex
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestDotIndex(_BaseCase):
+    """Tests for the DotIndex class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        records = [
+            _LYCDotDict(a1=1, a2="x"),
+            _LYCDotDict(a1=3, a2="y"),
+            _LYCDotDict(a1=2, a2="x"),
+            _LYCDotDict(a2="y")
+        ]
+
+        index = _LYCDotIndex(records, hash_fields=["a2"], sorted_fields=["a1"])
+        record = index.add____({"a1": 2, "a2": "y"})
+
+        not_match_info = str(
+            f"DotIndex content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotIndex content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [len(index), record in index, type(record).__name__]
+        expect = [5, True, _LYCDotDict.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [index.find____(a2="y"), index.find____(a2="y", a1=2), index.find____(a2="z")]
+        expect = [[records[1], records[3], record], [record], []]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [
+            [r.a1 for r in index.range____("a1", 2, 3)],
+            [r.a1 for r in index.range____("a1", 1, 3, low_closed=False, high_closed=False)],
+            [r.a1 for r in index.range____("a1", high=2, reverse=True)]
+        ]
+
+        expect = [[2, 2, 3], [2, 2], [2, 2, 1]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        index.update____(records[0], a1=4, a2="y")
+        index.remove____(records[1])
+
+        actual = [[r.get("a1") for r in index.find____(a2="y")], [r.a1 for r in index.range____("a1", 3)]]
+        expect = [[4, None, 2], [4]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            index.remove____(records[1])
+            actual = False
+        except KeyError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A rejected record leaves no trace, and a None value is left out of the sorted index
+        try:
+            index.add____({"a1": "z", "a2": "z"})
+            actual = False
+        except TypeError:
+            actual = True
+        # end try
+
+        record = index.add____({"a1": None, "a2": "z"})
+
+        actual = [actual, len(index), index.find____(a2="z"), [r.a1 for r in index.range____("a1")]]
+        expect = [True, 5, [record], [2, 2, 4]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            index.update____(record, a1="z", a2="w")
+            actual = False
+        except TypeError:
+            actual = True
+        # end try
+
+        index.remove____(record)
+
+        actual = [actual, record.a2, len(index), index.find____(a2="w")]
+        expect = [True, "z", 4, []]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # A record whose indexed fields are changed outside of the index is still removed from all of it
+        record = index.add____({"a1": 3, "a2": "zzz"})
+        record.a1 = 1
+        record.a2 = "w"
+        index.remove____(record)
+
+        actual = [
+            len(index), record in index, record in list(index), index.find____(a2="zzz"),
+            [r.a1 for r in index.range____("a1")]
+        ]
+
+        expect = [4, False, False, [], [2, 2, 4]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            index.remove____(record)
+            actual = False
+        except KeyError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        record = records[2]
+        record.a2 = "w"
+        index.update____(record, a1=5)
+        index.add_index____("a2")
+
+        actual = [index.find____(a2="w"), [r.a1 for r in index.range____("a1", 5)]]
+        expect = [[record], [5]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Executable that tests the dot mapped utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import json
+import os
+import pathlib
+import shutil
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+_basename = ospath.basename
+_exists = ospath.exists
+_IO = typing.IO
+_jsondump = json.dump
+_join = ospath.join
+_listdir = os.listdir
+_makedirs = os.makedirs
+_Path = pathlib.Path
+_remove = os.remove
+_rmtree = shutil.rmtree
+_TestCase = unittest.TestCase
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCMappedDotDict = lyc_pyutils.MappedDotDict
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+_test_dotmapped_path = _join(_test_data_path, "test_dotmapped")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestMappedDotDict(_BaseCase):
+    """Tests for the MappedDotDict class."""
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._json1_loc = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _rmtree(_test_dotmapped_path, ignore_errors=True)
+        _makedirs(_test_dotmapped_path, exist_ok=True)
+
+        self._json1_loc = _join(_test_dotmapped_path, "json1.json")
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        _rmtree(_test_dotmapped_path, ignore_errors=True)
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        dict_ = {
+            "a1": {"a1": {"a1": 1, "a2": [1, {"a1": 2}]}, "a2": "x\"]}", "a3": "\u00fc"},
+            "a2": None,
+            "a3": -1.5e3,
+            "a4": {},
+            "a5": [[{"a1": [True]}]]
+        }
+
+        with open(self._json1_loc, "w") as file:
+            _jsondump(dict_, file, indent=4)
+
+        view = _LYCMappedDotDict.open____(self._json1_loc)
+
+        not_match_info = str(
+            f"MappedDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"MappedDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [
+            type(view.a1).__name__, type(view.a1.a1).__name__, view.a1.a1.a2[1].a1, view.a1.a2, view["a1"]["a3"],
+            view.a2, view.a3, len(view.a4), view.get_path____("a5[0][0].a1"), list(view), "a6" in view
+        ]
+
+        expect = [
+            _LYCMappedDotDict.__name__, _LYCDotDict.__name__, 2, "x\"]}", "\u00fc",
+            None, -1.5e3, 0, [True], ["a1", "a2", "a3", "a4", "a5"], False
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [view == dict_, view.to_dict____() == dict_, _exists(self._json1_loc + ".index.json")]
+        expect = [True, True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # The sidecar index is reused, and rebuilt for a different depth
+        reopened_view = _LYCMappedDotDict.open____(self._json1_loc)
+        deeper_view = _LYCMappedDotDict.open____(self._json1_loc, depth=3)
+
+        actual = [reopened_view == dict_, type(deeper_view.a1.a1).__name__]
+        expect = [True, _LYCMappedDotDict.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            view.a1 = 2
+            actual = False
+        except TypeError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_stale_index(self):
+        """Tests the stale sidecar index use case."""
+        method_name = self.test_stale_index.__name__
+        self._log_method_start(method_name)
+
+        with open(self._json1_loc, "w") as file:
+            _jsondump({"a1": {"a1": 1}}, file)
+
+        _LYCMappedDotDict.open____(self._json1_loc)
+
+        with open(self._json1_loc, "w") as file:
+            _jsondump({"a2": {"a1": 2}, "a1": {"a1": 3}}, file)
+
+        view = _LYCMappedDotDict.open____(self._json1_loc)
+
+        not_match_info = str(
+            f"MappedDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"MappedDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [view.a1.a1, view.a2.a1]
+        expect = [3, 2]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        # An unwritable sidecar index location falls back to no sidecar, without leaving any temporary file
+        index_loc = self._json1_loc + ".index.json"
+        _remove(index_loc)
+        _makedirs(index_loc)
+        view = _LYCMappedDotDict.open____(self._json1_loc)
+
+        actual = [view.a1.a1, sorted(_listdir(_test_dotmapped_path))]
+        expect = [3, sorted([_basename(self._json1_loc), _basename(index_loc)])]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
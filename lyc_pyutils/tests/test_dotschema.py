@@ -0,0 +1,224 @@
+"""Executable that tests the dot schema utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import os
+import pathlib
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+_IO = typing.IO
+_join = ospath.join
+_makedirs = os.makedirs
+_Path = pathlib.Path
+_TestCase = unittest.TestCase
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCDotSchema = lyc_pyutils.DotSchema
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestDotSchema(_BaseCase):
+    """Tests for the DotSchema class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        schema = _LYCDotSchema({
+            "name": {"type": str, "required": True},
+            "model.lr": {"type": float, "min": 0.0, "max": 1.0, "default": 0.001},
+            "model.layers": {"type": int, "min": 1, "max": 64, "default": 4},
+            "model.act": {"type": str, "choices": ["relu", "gelu"], "default": "relu"},
+            "data.aug.flip": {"type": bool, "default": False},
+            "seed": {"type": int, "min": 0},
+            "layers[0].dim": int
+        })
+
+        dict_ = _LYCDotDict.from_dict____({"name": "a", "model": {"lr": "2", "layers": 100.0}, "seed": -5})
+
+        not_match_info = str(
+            f"DotSchema content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotSchema content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [schema.check____(dict_), schema.coerce____(dict_) is dict_]
+        expect = [[], True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [dict_.model.lr, dict_.model.layers, dict_.model.act, dict_.data.aug.flip, dict_.seed]
+        expect = [1.0, 64, "relu", False, 0]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [type(dict_.data.aug).__name__, type(dict_.model.lr).__name__, type(dict_.model.layers).__name__]
+        expect = [_LYCDotDict.__name__, float.__name__, int.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dict_ = _LYCDotDict.from_dict____({"model": 5, "seed": 1.5, "layers": [{"dim": "x"}]})
+
+        actual = schema.check____(dict_)
+
+        expect = [
+            "layers[0].dim: invalid literal for int() with base 10: 'x'",
+            "model: expected dict, got 5",
+            "name: missing required value",
+            "seed: expected int, got 1.5"
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            schema.coerce____(dict_)
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        dicts = [_LYCDotDict(name="b", seed="3"), _LYCDotDict(seed=3)]
+
+        actual = [schema.coerce_all____(dicts), dicts[0].seed, dicts[1].model.layers]
+        expect = [[[], ["name: missing required value"]], 3, 4]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        schema = _LYCDotSchema({"a1.a1": {"type": float, "min": 0.0, "max": 1.0}, "a2": {"min": 0, "max": 10}})
+        dict_ = {"a1": {"a1": 2}, "a2": 5}
+        base = _LYCDotDict.from_dict____(dict_)
+        snapshot = schema.coerce____(base.snapshot____())
+        lazy = schema.coerce____(_LYCDotDict.from_dict____(dict_, lazy=True))
+
+        actual = [base.a1.a1, snapshot.a1.a1, lazy.a1.a1, dict_, type(snapshot.a2).__name__]
+        expect = [2, 1.0, 1.0, {"a1": {"a1": 2}, "a2": 5}, int.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        schema = _LYCDotSchema({"a1[1]": int, "a2[5].a1": {"default": 1}, "a2[5].a2": {"default": 2}, "a3": int})
+        dicts = [_LYCDotDict(a1=(1, "2"), a2=[1, 2], a3="3"), _LYCDotDict(a1=(1, 2), a2=[1, 2], a3="3")]
+
+        actual = [schema.coerce_all____(dicts), dicts[0].a1, dicts[0].a2, dicts[0].a3]
+
+        expect = [
+            [
+                ["a1[1]: cannot set 1 in a tuple", "a2[5].a1: cannot set index 5 in a list of length 2"],
+                ["a2[5].a1: cannot set index 5 in a list of length 2"]
+            ],
+            (1, "2"), [1, 2], 3
+        ]
+
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            schema.coerce____(_LYCDotDict(a1=(1, "2"), a2=[1, 2, 3, 4, 5, 6]))
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            _LYCDotSchema({"a": {"tpye": int}})
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
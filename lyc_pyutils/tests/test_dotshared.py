@@ -0,0 +1,208 @@
+"""Executable that tests the dot shared utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import os
+import pathlib
+import pickle
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+_IO = typing.IO
+_join = ospath.join
+_makedirs = os.makedirs
+_Path = pathlib.Path
+_pickle_dumps = pickle.dumps
+_pickle_loads = pickle.loads
+_TestCase = unittest.TestCase
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCSharedDotDict = lyc_pyutils.SharedDotDict
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestSharedDotDict(_BaseCase):
+    """Tests for the SharedDotDict class."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        shared = {"a1": True}
+        dict_ = _LYCDotDict.from_dict____({
+            "a1": {"a1": 1, "a2": 0.5, "a3": "x", "a4": None, "a5": [1, {"a1": 2}], "a6": 1 << 70},
+            "a2": shared,
+            "a3": shared,
+            "a4": {}
+        })
+
+        view = _LYCSharedDotDict.from_buffer____(_LYCSharedDotDict.dumps____(dict_))
+
+        not_match_info = str(
+            f"SharedDotDict content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"SharedDotDict content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [
+            view.a1.a1, view["a1"]["a2"], view.a1.a3, view.a1.a4, view.a1.a5, view.a1.a6,
+            view.get_path____("a1.a5[1].a1"), list(view), len(view.a4), "a2" in view, "a5" in view
+        ]
+
+        expect = [1, 0.5, "x", None, [1, {"a1": 2}], 1 << 70, 2, ["a1", "a2", "a3", "a4"], 0, True, False]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [view == dict_, view.to_dotdict____() == dict_, _pickle_loads(_pickle_dumps(view)) == dict_]
+        expect = [True, True, True]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            view.a1 = 2
+            actual = False
+        except TypeError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        cyclic = {}
+        cyclic["a1"] = cyclic
+
+        try:
+            _LYCSharedDotDict.dumps____(cyclic)
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_shared_memory(self):
+        """Tests the shared memory use case."""
+        method_name = self.test_shared_memory.__name__
+        self._log_method_start(method_name)
+
+        dict_ = {f"a{index}": {"a1": index, "a2": str(index)} for index in range(100)}
+        shm = _LYCSharedDotDict.publish____(dict_)
+
+        try:
+            view = _LYCSharedDotDict.attach____(shm.name)
+
+            not_match_info = str(
+                f"SharedDotDict content does not match\n"
+                f"Actual: {{}}\n"
+                f"Expected: {{}}"
+            )
+
+            match_info = str(
+                f"SharedDotDict content matched\n"
+                f"Actual and expected: {{}}"
+            )
+
+            actual = [view.a42.a1, view["a99"].a2, len(view), view.to_dict____() == dict_]
+            expect = [42, "99", 100, True]
+            self._match_values(actual, expect, not_match_info, match_info)
+
+            del view
+        finally:
+            shm.close()
+            shm.unlink()
+        # end try
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Executable that tests the dot table utilities."""
+
+# Copyright 2022-2023 Yucheng Liu. GNU LGPL3 license.
+# GNU LGPL3 license copy: https://www.gnu.org/licenses/lgpl-3.0.txt
+# GNU LGPL3 is based on GNU GPL3, GNU GPL3 copy: https://www.gnu.org/licenses/gpl-3.0.txt
+# First added by username: liu-yucheng
+# Last updated by username: liu-yucheng
+
+import array
+import os
+import pathlib
+import shutil
+import typing
+import unittest
+
+from os import path as ospath
+
+import lyc_pyutils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
+
+_array = array.array
+_IO = typing.IO
+_join = ospath.join
+_makedirs = os.makedirs
+_numpy = numpy
+_Path = pathlib.Path
+_rmtree = shutil.rmtree
+_skipIf = unittest.skipIf
+_TestCase = unittest.TestCase
+
+_LYCDotDict = lyc_pyutils.DotDict
+_LYCDotTable = lyc_pyutils.DotTable
+
+_tests_path = _Path(__file__).parent
+_repo_path = _Path(_tests_path).parent.parent
+
+_test_data_path = _join(_repo_path, ".lyc_pyutils_test_data")
+_log_loc = _join(_test_data_path, "log.txt")
+_test_dottable_path = _join(_test_data_path, "test_dottable")
+
+
+class _BaseCase(_TestCase):
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._log: _IO = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _makedirs(_test_data_path, exist_ok=True)
+        self._log = open(_log_loc, "a+")
+
+        case_name = type(self).__name__
+        info = f"- Test-case {case_name}"
+        self._logln(info)
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        case_name = type(self).__name__
+        info = f"- End of test-case {case_name}"
+        self._logln(info)
+
+        self._log.flush()
+        self._log.close()
+
+    def _logstr(self, str_to_log):
+        str_to_log = str(str_to_log)
+
+        if self._log is not None:
+            self._log.write(str_to_log)
+
+    def _logln(self, line):
+        line = str(line)
+
+        line = line + "\n"
+        self._logstr(line)
+
+    def _log_method_start(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- Test-method {method_name}"
+        self._logln(info)
+
+    def _log_method_end(self, method_name):
+        method_name = str(method_name)
+
+        info = f"-- End of test-method {method_name}"
+        self._logln(info)
+
+
+class TestDotTable(_BaseCase):
+    """Tests for the DotTable class."""
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._table1_loc = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _rmtree(_test_dottable_path, ignore_errors=True)
+        _makedirs(_test_dottable_path, exist_ok=True)
+
+        self._table1_loc = _join(_test_dottable_path, "table1.jsonl")
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        _rmtree(_test_dottable_path, ignore_errors=True)
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        rows = [
+            _LYCDotDict(a1=1, a2=0.5, a3="x"),
+            _LYCDotDict(a1=2, a2=1.5, a3="y"),
+            {"a1": 3, "a2": 2.5, "a4": {"a1": True}}
+        ]
+
+        table = _LYCDotTable.from_rows____(rows)
+
+        not_match_info = str(
+            f"DotTable content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotTable content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [table.col_names____(), len(table), isinstance(table.a1, _array), isinstance(table["a3"], _array)]
+        expect = [("a1", "a2", "a3", "a4"), 3, True, False]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [table[0].a3, table[-1].a4.a1, table[2]["a3"]]
+        expect = ["x", True, None]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        table.a5 = table.apply____(lambda a1, a2: a1 + a2, "a1", "a2")
+        table[1].a3 = "z"
+
+        actual = [list(table.a5), list(table.a3)]
+        expect = [[1.5, 3.5, 5.5], ["x", "z", None]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = [list(table.filter____(lambda a5: a5 > 2, "a5").a1), list(table.sort____("a2", reverse=True).a1)]
+        expect = [[2, 3], [3, 2, 1]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = table.to_rows____()[1]
+        expect = {"a1": 2, "a2": 1.5, "a3": "z", "a4": None, "a5": 3.5}
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        table.save_json_lines____(self._table1_loc)
+        loaded_table = _LYCDotTable.from_json_lines____(self._table1_loc)
+
+        actual = [loaded_table == table, type(loaded_table[2].a4).__name__]
+        expect = [True, _LYCDotDict.__name__]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        try:
+            table.a6 = [1, 2]
+            actual = False
+        except ValueError:
+            actual = True
+        # end try
+
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    def test_schema(self):
+        """Tests the schema use case."""
+        method_name = self.test_schema.__name__
+        self._log_method_start(method_name)
+
+        class _Sample(_LYCDotDict):
+            a1 = 0
+            a2 = 0.0
+            a3 = False
+
+        rows = [{"a1": 1, "a2": 0.5, "a3": True, "a4": "x"}, {"a1": 2}]
+        table = _LYCDotTable.from_rows____(rows, schema=_Sample)
+
+        not_match_info = str(
+            f"DotTable content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotTable content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [table.col_names____(), table.a1, table.a2, table.a3]
+        expect = [("a1", "a2", "a3"), _array("q", [1, 2]), _array("d", [0.5, 0.0]), [True, False]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        sample_rows = table.to_rows____(_Sample)
+
+        actual = [type(sample_rows[0]).__name__, sample_rows[1].a2, sample_rows[1]]
+        expect = [_Sample.__name__, 0.0, {"a1": 2, "a2": 0.0, "a3": False}]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+    @_skipIf(_numpy is None, "NumPy is not available")
+    def test_struct_array(self):
+        """Tests the NumPy structured array use case."""
+        method_name = self.test_struct_array.__name__
+        self._log_method_start(method_name)
+
+        class _Sample(_LYCDotDict):
+            a1 = 0
+            a2 = 0.0
+            a3 = False
+
+        rows = [{"a1": 1, "a2": 0.5, "a3": True}, {"a1": 2, "a2": 1.5, "a3": False}]
+        table = _LYCDotTable.from_rows____(rows, schema=_Sample)
+        struct_array = table.to_struct_array____()
+
+        not_match_info = str(
+            f"DotTable content does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"DotTable content matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = [struct_array.dtype.names, struct_array["a1"].tolist(), struct_array["a3"].tolist()]
+        expect = [("a1", "a2", "a3"), [1, 2], [True, False]]
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = _LYCDotTable.from_struct_array____(struct_array)
+        expect = table
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+def main():
+    """Runs this module as an executable."""
+    unittest.main(verbosity=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@
 # First added by username: liu-yucheng
 # Last updated by username: liu-yucheng
 
+import io
 import json
 import os
 import pathlib
@@ -20,6 +21,7 @@ import lyc_pyutils
 _copytree = shutil.copytree
 _IO = typing.IO
 _join = ospath.join
+_StringIO = io.StringIO
 _jsonload = json.load
 _makedirs = os.makedirs
 _Path = pathlib.Path
@@ -29,7 +31,13 @@ _TestCase = unittest.TestCase
 _lyc_load_json = lyc_pyutils.load_json
 _lyc_save_json = lyc_pyutils.save_json
 _lyc_load_json_str = lyc_pyutils.load_json_str
+_lyc_load_json_dotdict = lyc_pyutils.load_json_dotdict
+_lyc_load_json_str_dotdict = lyc_pyutils.load_json_str_dotdict
 _lyc_save_json_str = lyc_pyutils.save_json_str
+_lyc_save_json_stream = lyc_pyutils.save_json_stream
+_lyc_append_json_patch = lyc_pyutils.append_json_patch
+_lyc_load_json_patch = lyc_pyutils.load_json_patch
+_LYCDotDict = lyc_pyutils.DotDict
 
 _tests_path = _Path(__file__).parent
 _repo_path = _Path(_tests_path).parent.parent
@@ -181,6 +189,71 @@ class TestLoadJSON(_BaseCase):
         self._log_method_end(method_name)
 
 
+class TestLoadJSONDotDict(_BaseCase):
+    """Tests for the load_json_dotdict function."""
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._cfg1_loc = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _rmtree(_test_jsonrw_path, ignore_errors=True)
+        _copytree(_default_test_jsonrw_path, _test_jsonrw_path)
+
+        self._cfg1_loc = _join(_test_jsonrw_path, "config1.json")
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        _rmtree(_test_jsonrw_path, ignore_errors=True)
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        cfg1 = _lyc_load_json_dotdict(self._cfg1_loc)
+
+        not_match_info = str(
+            f"load_json_dotdict result does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"load_json_dotdict result matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = type(cfg1).__name__
+        expect = _LYCDotDict.__name__
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = cfg1.config
+        expect = "config1"
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = cfg1.test
+        expect = "jsonrw"
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
 class TestSaveJSON(_BaseCase):
     """Tests for the save_json function."""
 
@@ -315,6 +388,57 @@ class TestLoadJSONStr(_BaseCase):
         self._log_method_end(method_name)
 
 
+class TestLoadJSONStrDotDict(_BaseCase):
+    """Tests for the load_json_str_dotdict function."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        cfg5_str = fr"""
+
+{{
+    "config": "config5",
+    "test": {{"jsonrw": [{{"test": true}}]}},
+    "_private": "skipped"
+}}
+
+        """
+        cfg5_str = cfg5_str.strip()
+
+        cfg5 = _lyc_load_json_str_dotdict(cfg5_str)
+
+        not_match_info = str(
+            f"load_json_str_dotdict result does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"load_json_str_dotdict result matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = cfg5
+        expect = _LYCDotDict.from_dict____(_lyc_load_json_str(cfg5_str))
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = cfg5.test.jsonrw[0].test
+        expect = True
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
 class TestSaveJSONStr(_BaseCase):
     """Tests for the save_json_str function."""
 
@@ -372,6 +496,125 @@ class TestSaveJSONStr(_BaseCase):
         self._log_method_end(method_name)
 
 
+class TestSaveJSONStream(_BaseCase):
+    """Tests for the save_json_stream function."""
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        cfg4 = {
+            "config": "config4",
+            "test": {"jsonrw": "test", "list": [1, 2.5, None, True]}
+        }
+
+        cfg4_dotdict = _LYCDotDict.from_dict____(cfg4)
+        stream = _StringIO()
+        _lyc_save_json_stream(cfg4_dotdict, stream)
+
+        not_match_info = str(
+            f"save_json_stream result does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"save_json_stream result matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = stream.getvalue()
+        expect = _lyc_save_json_str(cfg4)
+        self._match_values(_dquote_repr(actual), _dquote_repr(expect), not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
+class TestJSONPatch(_BaseCase):
+    """Tests for the append_json_patch and load_json_patch functions."""
+
+    def __init__(self, methodName):
+        """Initializes self with the given args."""
+        super().__init__(methodName)
+
+        self._patch_loc = None
+
+    def setUp(self):
+        """Sets up before the tests."""
+        super().setUp()
+
+        _rmtree(_test_jsonrw_path, ignore_errors=True)
+        _copytree(_default_test_jsonrw_path, _test_jsonrw_path)
+
+        self._patch_loc = _join(_test_jsonrw_path, "patch.jsonl")
+
+    def tearDown(self):
+        """Tears down after the tests."""
+        super().tearDown()
+
+        _rmtree(_test_jsonrw_path, ignore_errors=True)
+
+    def _match_values(self, actual, expect, not_match_info, match_info):
+        not_match_info = str(not_match_info)
+        match_info = str(match_info)
+
+        fail_msg = not_match_info.format(actual, expect)
+        success_msg = match_info.format(actual)
+        self.assertTrue(actual == expect, fail_msg)
+        self._logln(success_msg)
+
+    def test_norm(self):
+        """Tests the normal use case."""
+        method_name = self.test_norm.__name__
+        self._log_method_start(method_name)
+
+        cfg5 = _LYCDotDict.from_dict____({"config": "config5", "test": {"jsonrw": "test", "count": 0}})
+        replica = _LYCDotDict.from_dict____(cfg5.to_dict____())
+        cfg5.track____()
+
+        cfg5.test.count += 1
+        _lyc_append_json_patch(cfg5.checkpoint____(), self._patch_loc)
+
+        cfg5.test.count += 1
+        cfg5.test.list = [1, 2.5, None, True]
+        del cfg5.config
+        _lyc_append_json_patch(cfg5.checkpoint____(), self._patch_loc)
+
+        ops = _lyc_load_json_patch(self._patch_loc)
+        replica.apply_patch____(ops)
+
+        not_match_info = str(
+            f"JSON patch result does not match\n"
+            f"Actual: {{}}\n"
+            f"Expected: {{}}"
+        )
+
+        match_info = str(
+            f"JSON patch result matched\n"
+            f"Actual and expected: {{}}"
+        )
+
+        actual = len(ops)
+        expect = 4
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        actual = replica
+        expect = cfg5
+        self._match_values(actual, expect, not_match_info, match_info)
+
+        self._log_method_end(method_name)
+
+
 def main():
     """Runs this module as an executable."""
     unittest.main(verbosity=1)